@@ -1,42 +1,124 @@
 from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout, QProgressBar
-from PySide6.QtCore import Qt, QRectF
-from PySide6.QtGui import QPainter, QColor
+from PySide6.QtCore import Qt, QRect, QRectF
+from PySide6.QtGui import QPainter, QColor, QBrush, QGradient, QPixmap, QRegion
+
+from metrics import PAINT_TIME, timed
+
+DEFAULT_COLORS = [
+    (0.0, 0.3, QColor("#4CAF50")),  # Muted green for morning
+    (0.3, 0.7, QColor("#FFA726")),  # Muted orange for mid-day
+    (0.7, 1.0, QColor("#EF5350")),  # Muted red for evening
+]
 
 
 class MultiColorProgressBar(QProgressBar):
+    """
+    A progress bar filled with color bands.
+
+    The bands are painted once per size into a pixmap, a repaint only blits
+    the filled part of it. A value change only repaints the part of the bar
+    whose fill changed and the percentage text.
+
+    colors is a list of (start, end, brush) sections, start and end being
+    fractions of the bar. A brush is a QColor or a QGradient; a gradient is
+    laid out relative to its section, so (0, 0) to (1, 0) spans the section
+    from left to right. Any number of sections can be used.
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.colors = [
-            (0.0, 0.3, QColor("#4CAF50")),  # Muted green for morning
-            (0.3, 0.7, QColor("#FFA726")),  # Muted orange for mid-day
-            (0.7, 1.0, QColor("#EF5350")),  # Muted red for evening
-        ]
+        self._colors = list(DEFAULT_COLORS)
+        self.band_pixmap = None  # The bands painted over the full bar, for band_key
+        self.band_key = None  # (width, height, dpr)
         self.setTextVisible(True)
         self.setFormat("%p%")
         self.setStyleSheet("QProgressBar { color: white; }")
 
+    @property
+    def colors(self):
+        return self._colors
+
+    @colors.setter
+    def colors(self, colors):
+        self._colors = list(colors)
+        self.band_pixmap = None
+        self.update()
+
+    def fraction(self, value=None):
+        """How much of the bar value fills, from 0 to 1"""
+        value = self.value() if value is None else value
+        span = self.maximum() - self.minimum()
+        if span <= 0:
+            return 0.0
+        return min(max((value - self.minimum()) / span, 0.0), 1.0)
+
+    def filled_width(self, value=None):
+        return round(self.width() * self.fraction(value))
+
+    def setValue(self, value):
+        """Set the value, repainting only the part of the fill that changed and the text"""
+        previous = self.value()
+        if value == previous:
+            return
+        # QProgressBar repaints the whole bar on every change, hold that off. The attribute is
+        # set directly because setUpdatesEnabled(True) would schedule a full repaint anyway.
+        updates_disabled = self.testAttribute(Qt.WA_UpdatesDisabled)
+        self.setAttribute(Qt.WA_UpdatesDisabled, True)
+        try:
+            super().setValue(value)
+        finally:
+            self.setAttribute(Qt.WA_UpdatesDisabled, updates_disabled)
+        left, right = sorted((self.filled_width(previous), self.filled_width(self.value())))
+        changed = QRegion(QRect(left, 0, right - left + 1, self.height()))
+        self.update(changed | QRegion(self.text_rect(previous)) | QRegion(self.text_rect(self.value())))
+
+    def text_rect(self, value):
+        """Where the percentage text of value is drawn"""
+        text_size = self.fontMetrics().size(0, f"{value}%")
+        rect = QRect(0, 0, text_size.width() + 2, self.height())
+        rect.moveCenter(self.rect().center())
+        return rect
+
+    def bands(self):
+        """The bands painted over the whole bar, repainted only when the size or the colors change"""
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr)
+        if self.band_pixmap is None or self.band_key != key:
+            pixmap = QPixmap(self.size() * dpr)
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            for start, end, color in self._colors:
+                if isinstance(color, QGradient):
+                    # A copy, the caller's gradient keeps its own coordinate mode
+                    color = type(color)(color)
+                    color.setCoordinateMode(QGradient.ObjectMode)
+                painter.fillRect(
+                    QRectF(self.width() * start, 0, self.width() * (end - start), self.height()),
+                    QBrush(color),
+                )
+            painter.end()
+            self.band_pixmap, self.band_key = pixmap, key
+        return self.band_pixmap
+
+    @timed(PAINT_TIME, widget="MultiColorProgressBar")
     def paintEvent(self, event):
         painter = QPainter(self)
         rect = self.rect()
 
         # Draw the background
-        painter.fillRect(rect, self.palette().window())
-
-        # Calculate the width of each section
-        for start, end, color in self.colors:
-            if self.value() / 100.0 <= start:
-                break
-            if self.value() / 100.0 < end:
-                end = self.value() / 100.0
-
-            section_rect = QRectF(
-                rect.left() + rect.width() * start,
-                rect.top(),
-                rect.width() * (end - start),
-                rect.height(),
-            )
+        painter.fillRect(event.rect(), self.palette().window())
 
-            painter.fillRect(section_rect, color)
+        # Draw the filled part of the bands
+        filled = self.filled_width()
+        if filled > 0:
+            bands = self.bands()
+            dpr = bands.devicePixelRatio()
+            painter.drawPixmap(
+                QRectF(0, 0, filled, rect.height()),
+                bands,
+                QRectF(0, 0, filled * dpr, rect.height() * dpr),
+            )
 
         # Draw the border
         painter.setPen(self.palette().windowText().color())
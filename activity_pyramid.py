@@ -0,0 +1,108 @@
+"""
+Session counts at three zoom levels: per day, per week and per month.
+
+The day level comes from the daily_stats table, which triggers keep up to date
+with the sessions. The week and month levels are sums of it, computed once when
+the pyramid is built and then adjusted together with the day level by add() and
+set(),
+so switching zoom levels never goes back to the database.
+
+Every level is a flat array of counts:
+- DAY: one entry per day from start (the Monday on or before the first day) to end,
+- WEEK: 53 entries per ISO year, for ISO weeks 1-53,
+- MONTH: 12 entries per year.
+"""
+
+from array import array
+from datetime import date, timedelta
+
+DAY = "day"
+WEEK = "week"
+MONTH = "month"
+LEVELS = (DAY, WEEK, MONTH)
+WEEKS_PER_YEAR = 53
+
+
+class ActivityPyramid:
+    def __init__(self, start, end):
+        self.first_day = start
+        self.start = start - timedelta(days=start.weekday())  # Day cells fill whole weeks
+        self.end = end
+        self.first_week_year = start.isocalendar()[0]
+        self.first_month_year = start.year
+        week_years = end.isocalendar()[0] - self.first_week_year + 1
+        month_years = end.year - self.first_month_year + 1
+        self.days = array("q", [0] * ((end - self.start).days + 1))
+        self.weeks = array("q", [0] * (week_years * WEEKS_PER_YEAR))
+        self.months = array("q", [0] * (month_years * 12))
+
+    @classmethod
+    def from_daily_counts(cls, start, end, counts):
+        """A pyramid from counts, one per day from start to end."""
+        pyramid = cls(start, end)
+        offset = (start - pyramid.start).days
+        for index, count in enumerate(counts):
+            if count:
+                pyramid.add(pyramid.start + timedelta(days=offset + index), count)
+        return pyramid
+
+    def contains(self, day):
+        return self.first_day <= day <= self.end
+
+    def add(self, day, count):
+        """Add count sessions (negative to remove) to day and to its week and month."""
+        if not self.contains(day):
+            return
+        self.days[(day - self.start).days] += count
+        self.weeks[self.week_index(day)] += count
+        self.months[self.month_index(day)] += count
+
+    def set(self, day, count):
+        """Set day's sessions to count, adjusting its week and month by the difference."""
+        if self.contains(day):
+            self.add(day, count - self.days[(day - self.start).days])
+
+    def week_index(self, day):
+        year, week, _ = day.isocalendar()
+        return (year - self.first_week_year) * WEEKS_PER_YEAR + week - 1
+
+    def month_index(self, day):
+        return (day.year - self.first_month_year) * 12 + day.month - 1
+
+    def counts(self, level):
+        return {DAY: self.days, WEEK: self.weeks, MONTH: self.months}[level]
+
+    def columns(self, level):
+        """Cells per row at the week and month levels, where a row is a year."""
+        return WEEKS_PER_YEAR if level == WEEK else 12
+
+    def years(self, level):
+        """The years shown as rows at the week and month levels."""
+        first = self.first_week_year if level == WEEK else self.first_month_year
+        return list(range(first, first + len(self.counts(level)) // self.columns(level)))
+
+    def period(self, level, index):
+        """First and last day of the cell at index, clipped to the pyramid's range."""
+        if level == DAY:
+            first = last = self.start + timedelta(days=index)
+        elif level == WEEK:
+            year, week = divmod(index, WEEKS_PER_YEAR)
+            first = date.fromisocalendar(self.first_week_year + year, 1, 1) + timedelta(weeks=week)
+            last = first + timedelta(days=6)
+        else:
+            year, month = divmod(index, 12)
+            first = date(self.first_month_year + year, month + 1, 1)
+            last = (first + timedelta(days=31)).replace(day=1) - timedelta(days=1)
+        return max(first, self.start if level == DAY else self.first_day), min(last, self.end)
+
+    def exists(self, level, index):
+        """Whether the cell is a real period inside the range (ISO years do not all have 53 weeks)."""
+        if not 0 <= index < len(self.counts(level)):
+            return False
+        if level == WEEK:
+            year, week = divmod(index, WEEKS_PER_YEAR)
+            last_week = date(self.first_week_year + year, 12, 28).isocalendar()[1]
+            if week + 1 > last_week:
+                return False
+        first, last = self.period(level, index)
+        return first <= last
@@ -0,0 +1,128 @@
+"""
+Productivity analytics over the whole session history.
+
+All metrics come from two flat arrays read in one query (start times in local
+epoch seconds and Focus seconds, see fetch_session_epochs): a single pass
+buckets the sessions by day, hour and weekday, and every other metric is
+computed from those buckets. The result is cached by the session write
+version, so asking again without new sessions costs one small query.
+"""
+
+import logging
+from array import array
+from datetime import date, timedelta
+
+from clock import get_clock
+from db import fetch_session_epochs, fetch_session_write_version
+
+ROLLING_WINDOWS = (7, 30, 90)
+EPOCH = date(1970, 1, 1)
+EPOCH_WEEKDAY = EPOCH.weekday()  # Thursday
+
+_cache = {}  # "key" -> (write version, today), "result" -> the analytics
+
+
+def day_totals(starts, focus_seconds, first_day, last_day):
+    """Focus seconds of each day from first_day to last_day, abandoned sessions count 0."""
+    first = (first_day - EPOCH).days
+    totals = array("q", [0] * ((last_day - first_day).days + 1))
+    for start, seconds in zip(starts, focus_seconds):
+        index = start // 86400 - first
+        if seconds > 0 and 0 <= index < len(totals):
+            totals[index] += seconds
+    return totals
+
+
+def rolling_averages(totals, window):
+    """
+    The average of each window-long run of totals ending at each index, with a
+    running sum so the whole series costs one pass. Early entries average over
+    the days there are.
+    """
+    averages = array("d", [0.0] * len(totals))
+    running = 0
+    for index, total in enumerate(totals):
+        running += total
+        if index >= window:
+            running -= totals[index - window]
+        averages[index] = running / min(index + 1, window)
+    return averages
+
+
+def streaks(totals):
+    """
+    (current, longest) runs of consecutive days with Focus. The current streak
+    still counts when today has no Focus yet, as long as yesterday had.
+    """
+    longest = run = 0
+    for total in totals:
+        run = run + 1 if total else 0
+        longest = max(longest, run)
+    current = 0
+    end = len(totals) - 1 if totals and totals[-1] else len(totals) - 2
+    while end - current >= 0 and totals[end - current]:
+        current += 1
+    return current, longest
+
+
+def median(values):
+    if not values:
+        return 0
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[middle]
+    return (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def compute(starts, focus_seconds, today):
+    """The analytics of the sessions in starts and focus_seconds, up to today."""
+    hours = array("q", [0] * 24)
+    weekdays = array("q", [0] * 7)
+    completed = array("q")
+    abandoned = 0
+    for start, seconds in zip(starts, focus_seconds):
+        if seconds < 0:
+            abandoned += 1
+            continue
+        completed.append(seconds)
+        day, second = divmod(start, 86400)
+        hours[second // 3600] += seconds
+        weekdays[(day + EPOCH_WEEKDAY) % 7] += seconds
+
+    first_day = EPOCH + timedelta(days=starts[0] // 86400) if starts else today
+    totals = day_totals(starts, focus_seconds, min(first_day, today), today)
+    current_streak, longest_streak = streaks(totals)
+    sessions = len(completed) + abandoned
+    return {
+        "current_streak": current_streak,
+        "longest_streak": longest_streak,
+        "hour_minutes": [seconds / 60 for seconds in hours],
+        "weekday_minutes": [seconds / 60 for seconds in weekdays],
+        "median_session_minutes": median(completed) / 60,
+        "completed": len(completed),
+        "abandoned": abandoned,
+        "completion_rate": len(completed) / sessions if sessions else 0.0,
+        # Average Focus minutes per day over the 7, 30 and 90 days ending on each
+        # day from first_day to today; the last entry is today's
+        "first_day": min(first_day, today),
+        "rolling_minutes": {
+            window: array("d", (seconds / 60 for seconds in rolling_averages(totals, window)))
+            for window in ROLLING_WINDOWS
+        },
+    }
+
+
+def productivity_analytics():
+    """
+    The analytics of the whole history, as a dict. Computed again only after a
+    session was written or when the day changed, since streaks and rolling
+    averages end today.
+    """
+    key = (fetch_session_write_version(), get_clock().today())
+    if _cache.get("key") != key:
+        starts, focus_seconds = fetch_session_epochs()
+        logging.debug("Computing analytics over %d sessions", len(starts))
+        _cache["result"] = compute(starts, focus_seconds, key[1])
+        _cache["key"] = key
+    return _cache["result"]
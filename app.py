@@ -1,8 +1,14 @@
+import startup_profile
+
+# Profiling has to start before the other imports so that they are timed too
+startup_profile.enable_if_requested()
+
 import os
 import sys
 import logging
 import platform
-from datetime import datetime, time, timedelta
+from collections import deque
+from datetime import time
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -14,7 +20,7 @@ from PySide6.QtWidgets import (
     QDialog,
     QSpinBox,
 )
-from PySide6.QtCore import QTimer, Qt, QDate
+from PySide6.QtCore import Qt, QDate, QEvent
 
 if platform.system() == "Windows":
     import win32con
@@ -23,19 +29,34 @@ if platform.system() == "Windows":
 from tree_widget import TreeWidget
 from MultiColorProgressBar import MultiColorProgressBar
 from db import (
-    init_db,
-    insert_pomodoro_session,
-    update_pomodoro_session,
+    get_app_path,
+    ensure_db,
     fetch_focus_summary,
-    get_setting,
+    get_settings,
     save_setting,
     delete_setting,
 )
 from motivation import get_motivational_phrase
 from yoga import get_desk_yoga_stretch
-from sound import play_celebratory_melody, play_rest_end_melody, play_bell_sound
+from sound import play_bell_sound, prerender_sounds
 from menu import AppMenu
 from style import load_dark_theme
+from timer_core import PomodoroTimer, FOCUS
+from clock import get_clock
+from day_progress import (
+    DayProgress,
+    DEFAULT_DAY_START,
+    DEFAULT_DAY_END,
+    minutes_to_time,
+    time_to_minutes,
+)
+from scheduler import Scheduler
+from events import EventBus, TimerPublisher, load_plugins
+import subscribers
+from startup_profile import profiled
+from diagnostics import log, setup_logging
+import metrics
+from single_instance import SingleInstance
 
 class XbitoPomodoro(QMainWindow):
     def __init__(self, app, phrase):
@@ -43,11 +64,18 @@ class XbitoPomodoro(QMainWindow):
             "TERM_PROGRAM" in os.environ.keys()
             and os.environ["TERM_PROGRAM"] == "vscode"
         )
-        # Initialize the database with unified init_db function
-        init_db()
+        # All time reads and timers go through the clock so tests can swap in a VirtualClock
+        self.clock = get_clock()
+        # The Focus / Rest cycle lives in a Qt-free state machine, this window is a view over it
+        self.timer_core = PomodoroTimer(clock=self.clock.monotonic)
+        self.timer_core.on("completed", self.auto_stop_timer)
+        # Side effects of the session lifecycle (database, sounds, plugins) subscribe to the event bus
+        self.events = EventBus()
+        self.timer_publisher = TimerPublisher(self.events, self.timer_core, self.clock)
+        subscribers.register(self.events)
+        load_plugins(self.events)
         self.phrase = phrase
         self.app = app
-        self.start_time = None  # To store the session start time
         # Check if running in a debug session
         if self.debug_mode:
             logging.debug("Running in debug mode.")
@@ -65,20 +93,20 @@ class XbitoPomodoro(QMainWindow):
         self.sessions_before_long_rest = 2  # Number of sessions before a long rest
         # Settings need to be loaded before we compute remaining_seconds
         self.load_settings()
-        self.completed_sessions = 0  # Track the number of completed sessions
         self.remaining_seconds = self.initial_seconds
-        self.is_timer_running = False  # Track timer state
         self.session_alert_triggered = False  # Track if the alert has been triggered
         super().__init__()
+        # Every timed job runs from one scheduler that arms a single timer for the next deadline
+        self.scheduler = Scheduler(self.clock, self)
+        self.scheduler.clock_jump_listeners.append(self.handle_clock_jump)
         self.tree_widget = TreeWidget()
-        self.tree_current_date = QDate.currentDate()  # For daily resets
+        self.tree_current_date = self.current_qdate()  # For daily resets
         self.setup_window()
         # Create a central widget and layout
         centralWidget = QWidget()
         self.layout = QVBoxLayout(centralWidget)
         self.setup_date_day_label()
         self.setup_progress_bar()
-        self.update_progress_bar()
         self.setCentralWidget(centralWidget)
         self.setup_timer()
         self.setup_timer_type_label()
@@ -91,20 +119,134 @@ class XbitoPomodoro(QMainWindow):
         self.setStyleSheet(load_dark_theme())
         self.adjustSize()
         self.setup_session_alert_timer()  # Add this line to initialize the session alert timer
+        self.setup_startup_tasks()
+
+    @property
+    def initial_seconds(self):
+        return self.timer_core.focus_seconds
+
+    @initial_seconds.setter
+    def initial_seconds(self, seconds):
+        self.timer_core.focus_seconds = seconds
+
+    @property
+    def rest_seconds(self):
+        return self.timer_core.rest_seconds
+
+    @rest_seconds.setter
+    def rest_seconds(self, seconds):
+        self.timer_core.rest_seconds = seconds
+
+    @property
+    def long_rest_seconds(self):
+        return self.timer_core.long_rest_seconds
+
+    @long_rest_seconds.setter
+    def long_rest_seconds(self, seconds):
+        self.timer_core.long_rest_seconds = seconds
+
+    @property
+    def sessions_before_long_rest(self):
+        return self.timer_core.sessions_before_long_rest
 
+    @sessions_before_long_rest.setter
+    def sessions_before_long_rest(self, sessions):
+        self.timer_core.sessions_before_long_rest = sessions
+
+    @property
+    def remaining_seconds(self):
+        return self.timer_core.remaining_seconds
+
+    @remaining_seconds.setter
+    def remaining_seconds(self, seconds):
+        self.timer_core.remaining_seconds = seconds
+
+    @property
+    def completed_sessions(self):
+        return self.timer_core.completed_sessions
+
+    @completed_sessions.setter
+    def completed_sessions(self, sessions):
+        self.timer_core.completed_sessions = sessions
+
+    @property
+    def is_timer_running(self):
+        return self.timer_core.is_running
+
+    @profiled
     def load_settings(self):
         """
-        Loads settings from the database.
+        Loads settings from the database, with a single query.
         """
-        self.initial_seconds = get_setting("focus_duration", self.initial_seconds)
-        self.rest_seconds = get_setting("short_break_duration", self.rest_seconds)
-        self.long_rest_seconds = get_setting(
-            "long_break_duration", self.long_rest_seconds
+        settings = get_settings(
+            {
+                "focus_duration": self.initial_seconds,
+                "short_break_duration": self.rest_seconds,
+                "long_break_duration": self.long_rest_seconds,
+                "sessions_before_long_break": self.sessions_before_long_rest,
+                "day_start": time_to_minutes(DEFAULT_DAY_START),
+                "day_end": time_to_minutes(DEFAULT_DAY_END),
+            }
         )
-        self.sessions_before_long_rest = get_setting(
-            "sessions_before_long_break", self.sessions_before_long_rest
+        self.initial_seconds = settings["focus_duration"]
+        self.rest_seconds = settings["short_break_duration"]
+        self.long_rest_seconds = settings["long_break_duration"]
+        self.sessions_before_long_rest = settings["sessions_before_long_break"]
+        try:
+            self.day_progress = DayProgress(
+                minutes_to_time(int(settings["day_start"])), minutes_to_time(int(settings["day_end"]))
+            )
+        except ValueError as e:
+            logging.error("Invalid day start or end setting: %s", e)
+            self.day_progress = DayProgress()
+
+    @profiled
+    def setup_startup_tasks(self):
+        """
+        Queues the work that is not needed for the first frame.
+
+        The window is shown first; once it has been painted these tasks run one per
+        event loop iteration, so the window stays responsive while they run:
+        the database migration check, the first focus summary query, decoding the
+        tree images that are not shown yet, pre-rendering the sounds (which is
+        also when pydub gets imported) and starting the optional metrics exporters.
+        """
+        self.first_paint_done = False
+        self.startup_tasks = deque(
+            [
+                ("ensure_db", ensure_db),
+                ("update_focus_summary", self.update_focus_summary),
+                ("preload_tree_images", lambda: self.tree_widget.preload_images()),
+                ("prerender_sounds", prerender_sounds),
+                ("metrics", lambda: metrics.setup(self.scheduler)),
+            ]
         )
 
+    def paintEvent(self, event):
+        if self.first_paint_done:
+            super().paintEvent(event)
+            return
+        with startup_profile.phase("first paintEvent"):
+            super().paintEvent(event)
+        startup_profile.mark("first paint")
+        self.first_paint_done = True
+        self.scheduler.call_later(0, self.run_next_startup_task, "startup")
+
+    def run_next_startup_task(self):
+        """
+        Runs one deferred startup task and schedules the next one.
+        """
+        name, task = self.startup_tasks.popleft()
+        try:
+            with startup_profile.phase(name, "task"):
+                task()
+        except Exception as e:
+            logging.error("Startup task %s failed: %s", name, e)
+        if self.startup_tasks:
+            self.scheduler.call_later(0, self.run_next_startup_task, "startup")
+        else:
+            startup_profile.finish(os.path.join(get_app_path(), "startup_profile.json"))
+
     def save_settings(self):
         """
         Saves the settings from the dialog and updates the application state.
@@ -115,6 +257,11 @@ class XbitoPomodoro(QMainWindow):
         new_rest_seconds = self.short_break_spinbox.value() * multiplier
         new_long_rest_seconds = self.long_break_spinbox.value() * multiplier
         new_sessions_before_long_rest = self.sessions_spinbox.value()
+        new_day_start = self.day_start_edit.time().toPython()
+        new_day_end = self.day_end_edit.time().toPython()
+        if new_day_end <= new_day_start:
+            self.show_dialog("Settings", "The day must end after it starts.")
+            return
 
         # Save settings only if they differ from the default values
         if new_initial_seconds != self.initial_seconds:
@@ -137,19 +284,25 @@ class XbitoPomodoro(QMainWindow):
         else:
             delete_setting("sessions_before_long_break")
 
-        # Update the application state
-        self.initial_seconds = new_initial_seconds
-        self.rest_seconds = new_rest_seconds
-        self.long_rest_seconds = new_long_rest_seconds
-        self.sessions_before_long_rest = new_sessions_before_long_rest
-
-        # Update the remaining seconds if the timer is not running
-        if not self.is_timer_running:
-            if self.timer_type == "Focus":
-                self.remaining_seconds = self.initial_seconds
-            elif self.timer_type == "Rest":
-                self.remaining_seconds = self.rest_seconds
-            self.update_countdown_display()
+        for key, value, default in (
+            ("day_start", new_day_start, DEFAULT_DAY_START),
+            ("day_end", new_day_end, DEFAULT_DAY_END),
+        ):
+            if value != default:
+                save_setting(key, time_to_minutes(value))
+            else:
+                delete_setting(key)
+
+        # Update the application state, a stopped timer picks up the new durations
+        self.timer_core.set_durations(
+            new_initial_seconds,
+            new_rest_seconds,
+            new_long_rest_seconds,
+            new_sessions_before_long_rest,
+        )
+        self.update_countdown_display()
+        self.day_progress = DayProgress(new_day_start, new_day_end)
+        self.update_progress_bar()
 
         # Close the settings dialog
         self.sender().parent().accept()
@@ -159,7 +312,7 @@ class XbitoPomodoro(QMainWindow):
         Sends the application window to the back of the screen.
         """
         self.setWindowFlag(Qt.WindowStaysOnTopHint, False)
-        QTimer.singleShot(15000, self.bring_to_front_delayed)
+        self.scheduler.call_later(15, self.bring_to_front_delayed)
 
     def bring_to_front_delayed(self):
         """
@@ -168,18 +321,39 @@ class XbitoPomodoro(QMainWindow):
         self.setWindowFlag(Qt.WindowStaysOnTopHint, True)
         self.show()
 
+    def handle_remote_command(self, args):
+        """
+        Runs the command line of a second launch, forwarded by SingleInstance.
+
+        Supports --start, --pause, --reset and --status. Any other launch brings the
+        window to the front. Returns the timer status for the other process to print.
+        """
+        if "--start" in args and not self.is_timer_running:
+            self.click_start_timer()
+        elif "--pause" in args and self.is_timer_running:
+            self.click_pause_timer()
+        elif "--reset" in args:
+            self.click_reset_timer()
+        elif "--status" not in args:
+            self.showNormal()
+            self.raise_()
+            self.activateWindow()
+        minutes, seconds = divmod(self.remaining_seconds, 60)
+        state = "running" if self.is_timer_running else "stopped"
+        return f"{self.timer_core.label} {minutes:02d}:{seconds:02d} ({state})"
+
+    @profiled
     def setup_timer_type_label(self):
         """
         Sets up the timer type label in the UI.
 
-        This method creates a QLabel widget to display the current timer type in the UI.
-        It sets the initial timer type to "Focus" and applies the necessary styling and alignment.
+        This method creates a QLabel widget to display the current timer type in the UI,
+        as reported by the timer state machine, and applies the necessary styling and alignment.
         The QLabel widget is then added to the layout.
 
         """
-        self.timer_type = "Focus"  # Attribute to track the current timer type
         self.timer_type_label = QLabel(
-            self.timer_type
+            self.timer_core.label
         )  # Display the timer type in the UI
         self.timer_type_label.setStyleSheet("font-size: 18px; font-weight: bold;")
         self.timer_type_label.setAlignment(
@@ -188,20 +362,94 @@ class XbitoPomodoro(QMainWindow):
 
         self.layout.addWidget(self.timer_type_label)
 
+    @profiled
     def setup_timer(self):
         """
-        Sets up the timer for updating the progress bar and countdown.
+        Sets up the scheduler jobs for updating the progress bar and countdown.
 
-        This method creates two QTimer objects: `update_timer` and `timer`.
-        The `update_timer` is used to update the progress bar every minute,
-        while the `timer` is used to automatically update the countdown.
+        This method creates two jobs: `progress_bar_job` and `countdown_job`.
+        The `progress_bar_job` runs when the day progress changes to the next percent
+        (see update_progress_bar), while the `countdown_job` polls the timer state machine
+        to refresh the countdown, and only runs while a session is running (see schedule_countdown).
         """
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.update_progress_bar)
-        self.update_timer.start(60000)  # Update every minute
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.auto_update_countdown)
+        self.progress_bar_job = self.scheduler.call_later(
+            0, self.update_progress_bar, "progress_bar", start=False, background=True
+        )
+        self.countdown_job = self.scheduler.call_every(
+            1, self.auto_update_countdown, "countdown", start=False
+        )
+        self.update_progress_bar()
+
+    def schedule_countdown(self):
+        """
+        Schedules the countdown job for the current power mode.
 
+        While the window is visible the countdown ticks every second, aligned with the
+        session deadline so the display changes right on each second. While it is hidden,
+        minimized or occluded nobody sees the countdown, so the only wakeup is at the deadline.
+        """
+        if not self.is_timer_running:
+            self.countdown_job.cancel()
+            return
+        seconds_left = self.timer_core.deadline - self.clock.monotonic()
+        if self.scheduler.power_save:
+            self.countdown_job.restart(seconds_left)
+        else:
+            self.countdown_job.restart(seconds_left % 1 or 1)
+
+    def update_power_mode(self):
+        """
+        Enters power save mode while the window is hidden, minimized or occluded,
+        and leaves it as soon as the window can be seen again.
+
+        In power save mode the countdown only wakes up at the session deadline and
+        background refreshes (progress bar, focus summary, phrase) are coalesced.
+        """
+        handle = self.windowHandle()
+        hidden = (
+            not self.isVisible()
+            or self.isMinimized()
+            or (handle is not None and not handle.isExposed())
+        )
+        if hidden == self.scheduler.power_save:
+            return
+        if not hidden:
+            # Coming back into view is a good moment to notice a suspend or clock change
+            self.scheduler.check_clock()
+        self.scheduler.set_power_save(hidden)
+        logging.debug(
+            "Power save %s (%.1f wakeups/hour)",
+            "on" if hidden else "off",
+            self.scheduler.wakeups_per_hour(),
+        )
+        if not hidden:
+            self.update_countdown_display()
+        self.schedule_countdown()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        handle = self.windowHandle()
+        if handle is not None and not getattr(self, "_watching_exposure", False):
+            # Expose events go to the QWindow, they tell us when the window gets occluded
+            handle.installEventFilter(self)
+            self._watching_exposure = True
+        self.update_power_mode()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_power_mode()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self.update_power_mode()
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Expose and watched is self.windowHandle():
+            self.update_power_mode()
+        return super().eventFilter(watched, event)
+
+    @profiled
     def setup_start_pause_button(self):
         """
         Set up the start/pause button and reset button.
@@ -223,6 +471,7 @@ class XbitoPomodoro(QMainWindow):
 
         self.layout.addLayout(button_layout)
 
+    @profiled
     def setup_controls_layout(self):
         """
         Set up the controls layout for the application.
@@ -283,6 +532,7 @@ class XbitoPomodoro(QMainWindow):
                 self.completed_sessions = 4
             self.update_tree_stage()
 
+    @profiled
     def setup_emoticon_buttons(self):
         """
         Set up the yoga button in the user interface.
@@ -307,6 +557,7 @@ class XbitoPomodoro(QMainWindow):
         yoga_stretch = get_desk_yoga_stretch()
         self.show_dialog("Desk Yoga Stretch", yoga_stretch)
 
+    @profiled
     def setup_window(self):
         """
         Set up the window properties and position.
@@ -327,24 +578,24 @@ class XbitoPomodoro(QMainWindow):
         # Set the window to always stay on top
         self.setWindowFlags(self.windowFlags() | Qt.WindowStaysOnTopHint)
 
+    @profiled
     def setup_motivational_phrase(self):
         """
         Display motivational Phrase in the screen, allowing for multi-line if it exceeds the width.
         When the phrase is too long, it will wrap to the next line.
 
-        Add a timer to update the motivational phrase every 6 hours.
+        Add a scheduler job to update the motivational phrase every 6 hours.
         """
         self.motivational_phrase_label = QLabel(self.phrase)
         self.motivational_phrase_label.setObjectName("motivationalPhraseLabel")
         self.motivational_phrase_label.setWordWrap(True)  # Enable word wrapping
         self.motivational_phrase_label.setAlignment(Qt.AlignCenter)
         self.layout.insertWidget(0, self.motivational_phrase_label)
-        self.update_motivational_phrase_timer = QTimer(self)
-        self.update_motivational_phrase_timer.timeout.connect(
-            self.update_motivational_phrase
-        )
-        self.update_motivational_phrase_timer.start(
-            self.update_motivational_phrase_seconds * 1000
+        self.motivational_phrase_job = self.scheduler.call_every(
+            self.update_motivational_phrase_seconds,
+            self.update_motivational_phrase,
+            "motivational_phrase",
+            background=True,
         )  # Update every 6 hours
 
     def update_motivational_phrase(self):
@@ -356,6 +607,7 @@ class XbitoPomodoro(QMainWindow):
         self.phrase = get_motivational_phrase()
         self.motivational_phrase_label.setText(self.phrase)
 
+    @profiled
     def setup_date_day_label(self):
         """
         Initializes the date and day labels.
@@ -364,10 +616,10 @@ class XbitoPomodoro(QMainWindow):
         It also sets the styles and alignments for each label, and adds them to the main layout of the dialog.
         """
         # Store the initial date in self.current_date
-        self.current_date = QDate.currentDate()
+        self.current_date = self.current_qdate()
 
         # Get the current date
-        current_date = QDate.currentDate()
+        current_date = self.current_qdate()
 
         # Format the date
         date_text = current_date.toString("dd")
@@ -414,17 +666,22 @@ class XbitoPomodoro(QMainWindow):
 
         self.layout.addLayout(self.date_container_layout)
 
-        # Create a timer to check date changes every minute
-        self.date_refresh_timer = QTimer(self)
-        self.date_refresh_timer.timeout.connect(self.update_date_day_label)
-        self.date_refresh_timer.start(60000 * 30)  # every 1/2 hour    
+        # Check for a date change exactly at local midnight
+        self.date_rollover_job = self.scheduler.call_daily(
+            time(0, 0), self.update_date_day_label, "date_rollover"
+        )
     
+    def current_qdate(self):
+        """Returns today's date, according to the app clock, as a QDate."""
+        today = self.clock.today()
+        return QDate(today.year, today.month, today.day)
+
     def update_date_day_label(self):
-        new_date = QDate.currentDate()
+        new_date = self.current_qdate()
         if new_date != self.current_date:
             self.current_date = new_date
             # Reset completed sessions for new day:
-            self.completed_sessions = 0
+            self.timer_core.reset_day()
             
             # Remove the old tree widget from the layout
             old_tree = self.tree_widget
@@ -453,6 +710,7 @@ class XbitoPomodoro(QMainWindow):
             self.year_label.setText(year_text)
             self.day_label.setText(day_text)
 
+    @profiled
     def setup_progress_bar(self):
         self.progress_bar = MultiColorProgressBar(self)
         self.layout.addWidget(self.progress_bar)
@@ -482,26 +740,13 @@ class XbitoPomodoro(QMainWindow):
         This method sets the start time of the session, starts the timer, and updates the UI to reflect the timer's state.
         It also disables the yoga button to prevent user input during the session.
         """
-        if not self.is_timer_running:
-            # Only set the start time if the timer is not already running
-            self.start_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.timer.start(1000)  # Update every second
-        self.is_timer_running = True
+        # Starting a queued "Next: ..." session makes it the current one.
+        # The session is recorded by the persistence subscriber.
+        self.timer_core.start()
+        self.schedule_countdown()
         self.start_pause_button.setText("Pause")
         self.yoga_button.setEnabled(False)
-        # If timer type label is "Next: Rest", change it to "Rest" when starting the timer
-        if (
-            self.timer_type_label.text() == "Next: Rest"
-            or self.timer_type_label.text() == "Next: Long Rest"
-        ):
-            self.timer_type_label.setText("Rest")
-            self.timer_type = "Rest"
-        elif self.timer_type_label.text() == "Next: Focus":
-            self.timer_type_label.setText("Focus")
-            self.timer_type = "Focus"
-        # If after changing the timer_type it is Focus then record the start time
-        if self.timer_type == "Focus":
-            insert_pomodoro_session(self.start_time, None, None)  # No status needed until completion
+        self.timer_type_label.setText(self.timer_core.label)
         self.reset_session_alert_timer()  # Reset the session alert timer when a session starts
         self.session_alert_triggered = False  # Reset the session alert triggered flag
 
@@ -511,12 +756,12 @@ class XbitoPomodoro(QMainWindow):
 
         This method:
         - Stops the timer
-        - Sets the timer running flag to False
+        - Pauses the timer state machine
         - Changes the start/pause button text to "Start"
         - Enables the yoga button
         """
-        self.timer.stop()
-        self.is_timer_running = False
+        self.countdown_job.cancel()
+        self.timer_core.pause()
         self.start_pause_button.setText("Start")
         self.yoga_button.setEnabled(True)
         self.reset_session_alert_timer()  # Reset the session alert timer when a pause happens
@@ -526,72 +771,33 @@ class XbitoPomodoro(QMainWindow):
         """
         Resets the timer to its initial state.
 
-        This method stops the timer, resets the remaining seconds to the initial duration,
-        updates the countdown label and button text, disables the yoga button,
-        and sets the timer running flag to False.
-        """
-        self.timer.stop()
-        # If the label is "Next: Rest" set the remaining seconds to the Rest timer duration
-        # If the label is "Next: Focus" set the remaining seconds to the Focus timer duration
-        if self.timer_type_label.text() == "Next: Rest":
-            self.remaining_seconds = self.rest_seconds
-        elif self.timer_type_label.text() == "Next: Long Rest":
-            self.remaining_seconds = self.long_rest_seconds
-        elif self.timer_type_label.text() == "Next: Focus":
-            self.remaining_seconds = self.initial_seconds
-        else:
-            # Reset happened somewhere else, not at the end of a session, so reset to the Focus timer duration
-            self.remaining_seconds = self.initial_seconds
+        This method stops the timer, resets the remaining seconds to the full session duration,
+        updates the countdown label and button text, and disables the yoga button.
+        """
+        self.countdown_job.cancel()
+        # On Reset always go back to Focus, but if coming from Feedback let the natural flow go on.
+        self.timer_core.reset(keep_session_type=from_feedback)
         self.update_countdown_display()
         self.start_pause_button.setText("Start")
-        self.is_timer_running = False
         self.yoga_button.setEnabled(False)
-        if not from_feedback:
-            # On Reset always set the timer type to Focus, but if coming from Feedback let the natural flow go on.
-            self.timer_type = "Focus"
-            self.timer_type_label.setText("Focus")
+        self.timer_type_label.setText(self.timer_core.label)
         self.reset_session_alert_timer()  # Reset the session alert timer when a reset happens
         self.session_alert_triggered = False  # Reset the session alert triggered flag
 
-    def auto_stop_timer(self):
+    def auto_stop_timer(self, finished_type, next_type):
         """
-        A session has completed.
+        A session has completed, called by the timer state machine.
         - changes the start/pause button text to "Start",
-        - enables the yoga button
-        - attempts to play a melody. If an error occurs while playing the melody, logs the error.
+        - enables the yoga button and grows the tree after a Focus session
+        - shows the next session type queued by the state machine
+        Recording the session and playing the melody are done by the event bus subscribers.
         """
-        self.timer.stop()
+        self.countdown_job.cancel()
         self.start_pause_button.setText("Start")
-        self.is_timer_running = False
-        # Play the corresponding melody
-        logging.debug(f"Playing melody: {self.timer_type}")
-        if self.timer_type == "Focus":
-            # Record the session as completed
-            update_pomodoro_session(
-                self.start_time,
-                datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "pending",
-            )
-            try:
-                play_celebratory_melody()
-            except Exception as e:
-                logging.error(f"Error playing melody: {e}")
+        if finished_type == FOCUS:
             self.yoga_button.setEnabled(True)
-            self.completed_sessions += 1
             self.update_tree_stage()
-            if self.completed_sessions % self.sessions_before_long_rest == 0:
-                self.timer_type_label.setText("Next: Long Rest")
-                self.remaining_seconds = self.long_rest_seconds
-            else:
-                self.timer_type_label.setText("Next: Rest")
-                self.remaining_seconds = self.rest_seconds
-        elif self.timer_type == "Rest":
-            try:
-                play_rest_end_melody()
-            except Exception as e:
-                logging.error(f"Error playing melody: {e}")
-            self.timer_type_label.setText("Next: Focus")
-            self.remaining_seconds = self.initial_seconds
+        self.timer_type_label.setText(self.timer_core.label)
         # Convert self.remaining_seconds to minutes and seconds for the countdown label
         self.update_countdown_display()
         self.reset_session_alert_timer()  # Reset the session alert timer when a session finishes normally
@@ -605,14 +811,11 @@ class XbitoPomodoro(QMainWindow):
         """
         Automatically updates the countdown timer and handles actions when the timer reaches zero.
 
-        Decreases the remaining seconds by 1 and updates the countdown label with the new time.
-        If the remaining seconds reach zero:
-        - stops the timer
+        Lets the timer state machine check its deadline (which completes the session
+        through auto_stop_timer once it has passed) and updates the countdown label.
         """
-        self.remaining_seconds -= 1
+        self.timer_core.tick()
         self.update_countdown_display()
-        if self.remaining_seconds <= 0:
-            self.auto_stop_timer()
 
     def manually_adjust_timer(self, minutes_change):
         """
@@ -622,18 +825,8 @@ class XbitoPomodoro(QMainWindow):
             minutes_change (int): The number of minutes to adjust the timer by.
 
         """
-        # Convert minutes to seconds
-        seconds_change = minutes_change * 60
-        new_remaining_seconds = self.remaining_seconds + seconds_change
-
-        # Ensure the timer is within the 1 to 120 minutes range
-        if new_remaining_seconds < 60:
-            self.remaining_seconds = 60  # Minimum of 1 minute
-        elif new_remaining_seconds > 7200:
-            self.remaining_seconds = 7200  # Maximum of 120 minutes
-        else:
-            self.remaining_seconds = new_remaining_seconds
-
+        # The state machine keeps the timer within the 1 to 120 minutes range
+        self.timer_core.adjust(minutes_change)
         self.update_countdown_display()
 
     def update_countdown_display(self):
@@ -647,27 +840,14 @@ class XbitoPomodoro(QMainWindow):
         """
         Updates the progress bar based on the current time.
 
-        The progress bar represents the progress of the day, from 5 AM to 11 PM.
-        If the current time is before 5 AM, the progress is 0.
-        If the current time is after 11 PM, the progress is 100.
-        Otherwise, the progress is calculated based on the current time compared to the start and end time of the day.
-        """
-        current_time = datetime.now()
-        start_time = datetime.combine(
-            current_time.date(), time(5, 0)
-        )  # Day starts at 5 AM
-        end_time = datetime.combine(
-            current_time.date(), time(23, 0)
-        )  # Day ends at 11 PM
-        total_day_seconds = (end_time - start_time).total_seconds()
-        current_seconds = (current_time - start_time).total_seconds()
-        if current_time < start_time:
-            progress = 0
-        elif current_time > end_time:
-            progress = 100
-        else:
-            progress = (current_seconds / total_day_seconds) * 100
-        self.progress_bar.setValue(int(progress))
+        The progress bar represents the progress of the day, from the configured day start
+        (5 AM by default) to the day end (11 PM by default): 0 before the start and 100
+        after the end. It shows whole percents, so rather than polling the clock the job is
+        rescheduled for the exact instant the value changes next.
+        """
+        now = self.clock.now()
+        self.progress_bar.setValue(self.day_progress.percent(now))  # No repaint when unchanged
+        self.progress_bar_job.restart(self.day_progress.seconds_until_change(now))
 
     def show_dialog(self, title, text, show_snooze=False):
         """
@@ -711,7 +891,10 @@ class XbitoPomodoro(QMainWindow):
             layout.addLayout(button_layout)
 
         dialog.setLayout(layout)
-        dialog.exec()
+        # open() returns right away instead of nesting an event loop, so a dialog
+        # shown from a scheduler job does not stop the timer while it waits
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.open()
 
     def handle_snooze(self, dialog, snooze_duration=None):
         """
@@ -727,8 +910,11 @@ class XbitoPomodoro(QMainWindow):
             if hasattr(self, "power_notify"):
                 win32gui.UnregisterPowerSettingNotification(self.power_notify)
         self.click_reset_timer()
+        self.menu.shutdown()  # Let a running report export finish
+        self.events.shutdown()  # Let queued database writes finish
         event.accept()  # Ensures the window closes smoothly
 
+    @profiled
     def setup_focus_summary(self):
         """
         Sets up the focus summary label in the UI.
@@ -739,11 +925,11 @@ class XbitoPomodoro(QMainWindow):
         self.focus_summary_label.setStyleSheet("font-size: 12px;")
         self.layout.addWidget(self.focus_summary_label)
 
-        # Update focus summary initially and set up a timer to update it periodically
-        self.update_focus_summary()
-        self.focus_summary_timer = QTimer(self)
-        self.focus_summary_timer.timeout.connect(self.update_focus_summary)
-        self.focus_summary_timer.start(300000)  # Update every 5 minutes
+        # The first update runs as a startup task after the first paint,
+        # then a job updates it periodically
+        self.focus_summary_job = self.scheduler.call_every(
+            300, self.update_focus_summary, "focus_summary", background=True
+        )  # Update every 5 minutes
 
     def update_focus_summary(self):
         """
@@ -756,22 +942,19 @@ class XbitoPomodoro(QMainWindow):
         )
         self.focus_summary_label.setText(summary_text)
 
+    @profiled
     def setup_session_alert_timer(self, snooze_duration=None):
         """
-        Sets up a timer to alert the user if a session has not started within the specified snooze duration.
+        Sets up a one-shot job to alert the user if a session has not started within the specified snooze duration.
         """
         if snooze_duration is None:
             snooze_duration_milliseconds = self.session_alert_miliseconds
         else:
             snooze_duration_milliseconds = snooze_duration * 60 * 1000
-        print("Starting the session alert timer at", datetime.now())
-        print(
-            "Should alert at",
-            datetime.now() + timedelta(milliseconds=snooze_duration_milliseconds),
+        log(logging.DEBUG, "session_alert_scheduled", delay_ms=snooze_duration_milliseconds)
+        self.session_alert_job = self.scheduler.call_later(
+            snooze_duration_milliseconds / 1000, self.trigger_session_alert, "session_alert"
         )
-        self.session_alert_timer = QTimer(self)
-        self.session_alert_timer.timeout.connect(self.trigger_session_alert)
-        self.session_alert_timer.start(snooze_duration_milliseconds)
 
     def reset_session_alert_timer(self, snooze_duration=None):
         """
@@ -781,12 +964,8 @@ class XbitoPomodoro(QMainWindow):
             snooze_duration_milliseconds = self.session_alert_miliseconds
         else:
             snooze_duration_milliseconds = snooze_duration * 60 * 1000
-        print("Reset the session alert timer at", datetime.now())
-        print(
-            "Should alert at",
-            datetime.now() + timedelta(milliseconds=snooze_duration_milliseconds),
-        )
-        self.session_alert_timer.start(snooze_duration_milliseconds)
+        log(logging.DEBUG, "session_alert_reset", delay_ms=snooze_duration_milliseconds)
+        self.session_alert_job.restart(snooze_duration_milliseconds / 1000)
         self.session_alert_triggered = False  # Reset the session alert triggered flag
 
     def trigger_session_alert(self):
@@ -802,9 +981,28 @@ class XbitoPomodoro(QMainWindow):
                 show_snooze=True,
             )
 
+    def handle_clock_jump(self, jump):
+        """
+        Re-syncs the app when the scheduler notices the wall clock jumped.
+
+        This works on every platform: a suspend/resume, an NTP correction or a DST change
+        all show up as a difference between the wall-clock and monotonic clock deltas.
+        """
+        logging.info("Clock jump detected: %s", jump)
+        if jump.kind == "suspend":
+            # Where the monotonic clock stood still during suspend, the session still lost that time
+            self.timer_core.catch_up(jump.drift)
+            self.handle_resume_from_suspend()
+        self.update_date_day_label()
+        self.update_progress_bar()
+
     def handle_resume_from_suspend(self):
         """Handle computer resuming from suspend state"""
         logging.debug("System resumed from suspend")
+        # Complete the session if it ended while suspended, otherwise refresh the countdown
+        self.timer_core.tick()
+        self.update_countdown_display()
+        self.schedule_countdown()
         if not self.is_timer_running:
             # Close any existing alert dialog
             for child in self.children():
@@ -815,13 +1013,47 @@ class XbitoPomodoro(QMainWindow):
 
 
 def main():
-    logging.basicConfig(
-        level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s"
-    )
-    app = QApplication(sys.argv)
+    import daemon
+
+    if "--headless" in sys.argv:
+        sys.exit(daemon.main([arg for arg in sys.argv[1:] if arg != "--headless"]))
+    setup_logging()
+    instance = SingleInstance()
+    with startup_profile.phase("forward to running instance"):
+        reply = instance.forward(sys.argv[1:])
+    if reply is not None:
+        # Another instance owns the database, it has handled the arguments
+        print(reply)
+        sys.exit(0)
+    with startup_profile.phase("look for a headless daemon"):
+        daemon_running = daemon.is_running()
+    if daemon_running:
+        # The daemon owns the database, two processes would both write sessions to it
+        print(
+            "The headless daemon is running, control it with --headless "
+            "start|pause|reset|status or stop it to open the window",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    with startup_profile.phase("QApplication"):
+        app = QApplication(sys.argv)
+    # Listen before building the window, so a launch meanwhile finds this instance
+    if not instance.listen():
+        # Another launch may have become the running instance since forward()
+        reply = instance.forward(sys.argv[1:])
+        if reply is not None:
+            print(reply)
+            sys.exit(0)
+        # Nobody answered, the socket was left by a crashed instance
+        instance.listen(replace_stale=True)
     phrase = get_motivational_phrase()
-    main_window = XbitoPomodoro(app, phrase)
-    main_window.show()
+    with startup_profile.phase("XbitoPomodoro"):
+        main_window = XbitoPomodoro(app, phrase)
+    instance.set_handler(main_window.handle_remote_command)
+    if "--start" in sys.argv:
+        main_window.click_start_timer()
+    with startup_profile.phase("show"):
+        main_window.show()
     sys.exit(app.exec())
 
 
@@ -0,0 +1,1128 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.11.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x0c(\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x05\xdfiTXtXML\
+:com.adobe.xmp\x00\x00\
+\x00\x00\x00<?xpacket beg\
+in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
+0MpCehiHzreSzNTc\
+zkc9d\x22?> <x:xmpm\
+eta xmlns:x=\x22ado\
+be:ns:meta/\x22 x:x\
+mptk=\x22Adobe XMP \
+Core 7.1-c000 11\
+6.89d63a0, 2021/\
+11/28-21:09:33  \
+      \x22> <rdf:RD\
+F xmlns:rdf=\x22htt\
+p://www.w3.org/1\
+999/02/22-rdf-sy\
+ntax-ns#\x22> <rdf:\
+Description rdf:\
+about=\x22\x22 xmlns:x\
+mp=\x22http://ns.ad\
+obe.com/xap/1.0/\
+\x22 xmlns:dc=\x22http\
+://purl.org/dc/e\
+lements/1.1/\x22 xm\
+lns:photoshop=\x22h\
+ttp://ns.adobe.c\
+om/photoshop/1.0\
+/\x22 xmlns:xmpMM=\x22\
+http://ns.adobe.\
+com/xap/1.0/mm/\x22\
+ xmlns:stEvt=\x22ht\
+tp://ns.adobe.co\
+m/xap/1.0/sType/\
+ResourceEvent#\x22 \
+xmp:CreatorTool=\
+\x22Adobe Photoshop\
+ 22.5 (Windows)\x22\
+ xmp:CreateDate=\
+\x222023-02-08T01:3\
+1+03:00\x22 xmp:Mod\
+ifyDate=\x222023-02\
+-08T02:04:33+03:\
+00\x22 xmp:Metadata\
+Date=\x222023-02-08\
+T02:04:33+03:00\x22\
+ dc:format=\x22imag\
+e/png\x22 photoshop\
+:ColorMode=\x223\x22 p\
+hotoshop:ICCProf\
+ile=\x22sRGB IEC619\
+66-2.1\x22 xmpMM:In\
+stanceID=\x22xmp.ii\
+d:73b73640-3953-\
+8440-9b33-e43f25\
+763ca1\x22 xmpMM:Do\
+cumentID=\x22xmp.di\
+d:d61d1eaf-8c26-\
+d441-954e-1134f1\
+67e912\x22 xmpMM:Or\
+iginalDocumentID\
+=\x22xmp.did:d61d1e\
+af-8c26-d441-954\
+e-1134f167e912\x22>\
+ <xmpMM:History>\
+ <rdf:Seq> <rdf:\
+li stEvt:action=\
+\x22created\x22 stEvt:\
+instanceID=\x22xmp.\
+iid:d61d1eaf-8c2\
+6-d441-954e-1134\
+f167e912\x22 stEvt:\
+when=\x222023-02-08\
+T01:31+03:00\x22 st\
+Evt:softwareAgen\
+t=\x22Adobe Photosh\
+op 22.5 (Windows\
+)\x22/> <rdf:li stE\
+vt:action=\x22saved\
+\x22 stEvt:instance\
+ID=\x22xmp.iid:73b7\
+3640-3953-8440-9\
+b33-e43f25763ca1\
+\x22 stEvt:when=\x2220\
+23-02-08T02:04:3\
+3+03:00\x22 stEvt:s\
+oftwareAgent=\x22Ad\
+obe Photoshop 22\
+.5 (Windows)\x22 st\
+Evt:changed=\x22/\x22/\
+> </rdf:Seq> </x\
+mpMM:History> </\
+rdf:Description>\
+ </rdf:RDF> </x:\
+xmpmeta> <?xpack\
+et end=\x22r\x22?>\xf0S\xca\x94\
+\x00\x00\x05\xefIDATx\x9c\xed\x9a\xcdO\x1bG\
+\x18\xc6\x7f\x0b\xd8\xb8\x868\xfeb\x1d\x03\xf9\x80\x80\x8d\
+\x00\x89J\x11AB\x91\xaaVU@\x11\xd7\xa8\x97\xde\
+{\xea\xa1\xe4\xdfh\xe8\xbf\xd0{\xaeQ\x05\x5c\xdaC\
+\x8bD\xa2\xaaA\x02\x84\x0d\x82\x96\x82\x17\x1b\xbbvL\
+\xd8.\xb6\x93\xed\xc1\x9de\x9d\x90\x14U^\x0fQ\xfc\
+H\x96\xcc\xec\xcc\xee\xfb>\xfb\xbc\x1f3X1M\x93\
+\x0f\x19-\xb2\x0d\x90\x8d&\x01\xb2\x0d\x90\x8d&\x01\xb2\
+\x0d\x90\x8d&\x01\xb2\x0d\x90\x8d&\x01\xb2\x0d\x90\x8d&\
+\x01\xb2\x0d\x00\x88\x85C\xd2\xfaq\xe9\x04\xc4\xc2!s\
+\xf6\xee\xa84\x12\xdad<\xd4\x8ed6\xa7\xc4\xc2!\
+\xf3\xe1\xec$\xb1p\xc8LfsJ#\x9f/]\x01\
+\x02\xfb\xabE)\xcf\x95\xae\x00\x90\xab\x82\x0b\xa3\x00Y\
+p\x9c\x80x4b\xc6\xa3\x91s%8\x19a\xe0(\
+\x01\xf1h\xc4\xec\xed\xbe\xc2\xf8H?\xe7%\xa1\xd1p\
+\x94\x80\x84\x96V\xf6R\x07<]\xdb>\x17\x09\xbfl\
+\xea4\xba$:\x1e\x02\x09-\xad$\xb4\xb4\xf2tm\
+\x9b\xde\xee+g:\x17\x8fF\xccd6\xa7\xe4\x8f\x9f\
+\xd33\xeas\xda\xa4\x1a8J\x80\xddY\xa1\x86\xe9\xb1\
+\xa1\x9a\xf1x4b\xb6{<\xe7z\xebN(\xc31\
+\x02\xeceM\x8c%\xb4\xb4\xb2\xb0\xbe\xf5\x06\x09^\x8f\
+\x17\xc5\xd5F\xa0\xe3\xf2;\xef7\xd1\xd7_w\x12\x1c\
+U\xc0YY\xdd,W\xc8\x17Kg\xc6z\xc0\xe7>\
+s\x8dp~yg\x9bz\xf7\x08uk\x84D\x823\
+\xcb\x15klnq\xd5rT\x18.\x9a\x9e\x80o\x88\
+\x98\x1ab3\xff\x9c\xd7\xd7\xd9\x11\x0b\x87\xcc\x98\x1a\x22\
+\xe0s#\x14PO\x12\xeaB@<\x1a1\xc7G\xfa\
+\xe9\xea\x0d\x00p\xb8\x97\xe7\x8e\xea\x06\xce&Aq\x9d\
+>\xd6,W\xd0\x0d\xbdf\x0cN\xe3}zl\x88|\
+\xb1\xc4\xfc\xca\x06\xc0\xc5T@BK+\xf1h\xc4d\
+\xedt\xec\xe9\x1aL\x0d\x0f0{w\xf4\xad\xeb\xb2f\
+\xeb[\xaf9\xed\xb8\x80\xe2\xc4\xbf\xc6\xe2\xd1\x88\x99\xd0\
+\xd2\x8a\xfd-\x0eG\xda\x98[\x5c\x05\xaa\xce\x88&\xe9\
+X/\xa1\x1b:'\x86\xc1\xb7_\xdff\x7f\xb5\xc8z\
+\xba\x9a'\xec1\xef\xd4\x1e\xa1\xee\x9b!Q\xd6DN\
+\x101?\x0f\xcc\xde\x1d\xa5g\xd4g\xc9\xfbX/\xd1\
+\xe1u\xa3\x1bz\xcd=\x84\xf3Pu\x5cq\xb5Y\x95\
+\xa3\xde$8\xa6\x80v\x8f\x07\x00\xe3\xe8E\xcd5\xa1\
+\x86\x9eQ\x1f\x0f\xe6\x96\x98\xe8\xeb\xe7\xc9\xde.\xf7\xa6\
+n\x11/\x1d\xb3\x9e\xae0\xbf\xb2\xc1\xd5\xeb\xbd\xdc\x8f\
+\xfb\xf99SB\xcbW\x09\xdaK\x1d\x90\xd0\xd2\x17\x9b\
+\x00!\x7f\xa1\x80v\x8f\x87k\x1f\xb5\xb3\xfb\xf7\x09\x00\
+'\x86a\xcd\x1d\x1f\xe9\xe7\x8e\xea\xe6Q\xa2\xc0\xfd\xb8\
+\x9f\xf5\xf4i%\xc8\x17K<\xd9\xdb\xb5\xfe\x0e\xf8\x83\
+tx\xddu'\xa1\xae\x04\x88\xb8\xdeK\x1d\xbcq\xcd\
+,W\xb8z\xbd\x97h\xc0\x0b\x80\x96\xd7\x19\xf1w\xbe\
+1\xcf.\x7f\xbb\xdc\x05\xa1\xef\x85\x02\xc4\xdb\x02,\x87\
+\x83\xe6i\xcf\x95/\x96j\xd6\x98\x97\xdb\xb8\xa3\xbaY\
+OW\x18\x8e\xb4\xf1\xf8\x99F2\x93s,\xf3\xdb\xe1\
+X\x0e\x80\xda\xe6&\xd8\xa52\xd8\xd9y\x9a\xdc\xd4\x10\
+_}\x19g\x7f\xb5\xc8\xf7\xbfe\xb8\xdd\x1d\xb4\xde\xbe\
+(\x9ds\x8b\xab\x8e\x93\xe0\x08\x01gAd\xfe\x98\x1a\
+\x02`\xe6\xe3(\xeb\xe9\x0a?m\xef\xe1\xf5x\xb9\xdd\
+\x1dd[;\x04`3\xff\x9c\xa9\xe1\x81\x9a\xd2\x09\xce\
+\xf4\x02\x0d9\x13\x14\xed,@\x7f\xb4\xcbr,\xa6\x86\
+lI1H2\x93#\xa6\x86\x08\xf8\x83,\xaco\x01\
+\x03V\xe9\x14\xf7\xb9\x90\x9d\xe0\xbb\x10\x8fF\xcc\xe9\xb1\
+!\xfeR^\xf1\xc5ga\xf6W\x8b\x96\xf3b\x1f\x00\
+\xb0V\xa8\x96\xcbd&\x87\xe7R'\x01\x7f\xb0\xda\x05\
+\x8e\x0d\x01E\xc7\xc2\xc1q\x02\xec%1h\xb60\xbf\
+\xb2a\xd5\xfe\x96\xd6V^\xbd|\x09T\x93\xe5\x9f\x7f\
+T\xd7\x88\xdeAq\xb5\xd9Hp\x06\x0d;\x15\xfe\xe6\
+\xd3!\xab\xaf_\xc9f\x00p\xb9\x5c\xb4\xb4\xb6rb\
+\x18\xd6\xe6\xe9\xdak\xa51\x99\xcd)\xf3+\x1b\x8e\x1d\
+\x955\xe4Tx|\xa4\x9f\xef~\xac:/\xe2\xbe\xa5\
+\xf5t#d\x96+<J\x14j\xd6\x19G/\xb0\x9f\
+\x14\xd9\x9b\xa4z\xa2!\x0a\x10\xadl,6`\xc5\xfd\
+M_'\xe5r\x19\x80VO;{\xa9\x03\xae\xf9;\
+\xf1\xb8\xdb\xad\xb9'\x86A2\x9bS\x9cT\x81\xa39\
+`fr\xc2\x1c\xec\xbb\xc1\xe6\xce\xef\x0c\xf6\xdd\xa0p\
+\xa4\xd3\x15V9\xccf\xaa\xc7_\xc5j\xac\xbb\x5c.\
+\xca\x80\xc7\xddN\x7f\xb4\x8bd&G\xe1Hg\xb0\xef\
+\x063\x93\x13f\x87\xd7cm\xaa\xea\x9d\x08\x1dS\x80\
+0\x1c\xa0+\xacR8\xd29\xccf8\xccf\x98\x1a\
+\x1e \x7f\x5cU\x82\xcb\xe5b,\xacZ\xeb\xf2\xc5\x12\
+\xd3cCd\xb4\x14\xc9\xe4\x965\xfe\xc5\xe7\x9f8\xb2\
+\x1dv\x84\x00\xbb\xf3\x00\x19-EFKa\x96+L\
+\x0d\x0f\xb0\xad\x1d\x925[q\xb9\x5c\xd6\x9c\x9b\xbeN\
+\x8c\xd2I\xcd}\xd4h\xb7\xf5\xfdX7\x98\x99\x9cx\
+\xff\x92`\x87\xd7\x83\x1a\xed\xb6>\x0b\xeb[\xf8\xbbC\
+\xd6!\xc8XX%\xe0s\x13\xe8\xb8\xccn\xe1\x05\xcb\
+;\xdb\x0cG\xdax8;IFKQ8\xd29\xd6\
+\x8d\xff~\xd0\xff\x84c\x04\x08\xa3\x8fu\x03\xff\xa5\xea\
+\x86\xe80\x9b\xe1\xde\xd4-\x9e<Krb\x18t\x85\
+U\xcb\xe1\xe5\x9dm\x8b\xa4\xb9\xc5U\x1e\xcc-\x01X\
+$\xd8\x15UO8\x92\x04\x1f/-+3\x93\x13\xa6\
+ A\xc4?\xc0\x0f\x0b\xbf\xd6H\x1b\xa8\xb6\xba\x8b\xff\
+~\x8f\x04\xf1_\xf2R8\xaaV\x0e\xff%\xaf\xe5\xfc\
+\xe3\xa5\xe5\xba\xe7\x00G7C\xf6\x98\x15\x0e\xf5D\x82\
+5\x92.\x1c\xe9d\xb4\x14j\xb4\x9b\x9eH\xb0f\xbd\
+}\x9e\x13\xceC\x03v\x83v\x12\xec2~\x9d\x04\x11\
+&bN#\x9c\x87\x06n\x87\x05\x11\x1d^\xcf\xb9\x93\
+\x9a\x93\x8e\x0b4\x8c\x80\x8b\x8a\xe6Odd\x1b \x1b\
+M\x02d\x1b \x1bM\x02d\x1b \x1bM\x02d\x1b\
+ \x1bM\x02d\x1b \x1bM\x02d\x1b \x1b\x1f<\
+\x01\xff\x00\x80\xec\xf7\xfb\xafB,H\x00\x00\x00\x00I\
+END\xaeB`\x82\
+\x00\x00\x0d&\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x05\xe5iTXtXML\
+:com.adobe.xmp\x00\x00\
+\x00\x00\x00<?xpacket beg\
+in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
+0MpCehiHzreSzNTc\
+zkc9d\x22?> <x:xmpm\
+eta xmlns:x=\x22ado\
+be:ns:meta/\x22 x:x\
+mptk=\x22Adobe XMP \
+Core 7.1-c000 11\
+6.89d63a0, 2021/\
+11/28-21:09:33  \
+      \x22> <rdf:RD\
+F xmlns:rdf=\x22htt\
+p://www.w3.org/1\
+999/02/22-rdf-sy\
+ntax-ns#\x22> <rdf:\
+Description rdf:\
+about=\x22\x22 xmlns:x\
+mp=\x22http://ns.ad\
+obe.com/xap/1.0/\
+\x22 xmlns:dc=\x22http\
+://purl.org/dc/e\
+lements/1.1/\x22 xm\
+lns:photoshop=\x22h\
+ttp://ns.adobe.c\
+om/photoshop/1.0\
+/\x22 xmlns:xmpMM=\x22\
+http://ns.adobe.\
+com/xap/1.0/mm/\x22\
+ xmlns:stEvt=\x22ht\
+tp://ns.adobe.co\
+m/xap/1.0/sType/\
+ResourceEvent#\x22 \
+xmp:CreatorTool=\
+\x22Adobe Photoshop\
+ 22.5 (Windows)\x22\
+ xmp:CreateDate=\
+\x222023-02-08T01:3\
+1:01+03:00\x22 xmp:\
+ModifyDate=\x222023\
+-02-08T01:50:46+\
+03:00\x22 xmp:Metad\
+ataDate=\x222023-02\
+-08T01:50:46+03:\
+00\x22 dc:format=\x22i\
+mage/png\x22 photos\
+hop:ColorMode=\x223\
+\x22 photoshop:ICCP\
+rofile=\x22sRGB IEC\
+61966-2.1\x22 xmpMM\
+:InstanceID=\x22xmp\
+.iid:5923050c-f3\
+23-404f-8777-919\
+659b1bab3\x22 xmpMM\
+:DocumentID=\x22xmp\
+.did:97b557cf-5a\
+40-6648-b34b-5e2\
+5ff8ec5c8\x22 xmpMM\
+:OriginalDocumen\
+tID=\x22xmp.did:97b\
+557cf-5a40-6648-\
+b34b-5e25ff8ec5c\
+8\x22> <xmpMM:Histo\
+ry> <rdf:Seq> <r\
+df:li stEvt:acti\
+on=\x22created\x22 stE\
+vt:instanceID=\x22x\
+mp.iid:97b557cf-\
+5a40-6648-b34b-5\
+e25ff8ec5c8\x22 stE\
+vt:when=\x222023-02\
+-08T01:31:01+03:\
+00\x22 stEvt:softwa\
+reAgent=\x22Adobe P\
+hotoshop 22.5 (W\
+indows)\x22/> <rdf:\
+li stEvt:action=\
+\x22saved\x22 stEvt:in\
+stanceID=\x22xmp.ii\
+d:5923050c-f323-\
+404f-8777-919659\
+b1bab3\x22 stEvt:wh\
+en=\x222023-02-08T0\
+1:50:46+03:00\x22 s\
+tEvt:softwareAge\
+nt=\x22Adobe Photos\
+hop 22.5 (Window\
+s)\x22 stEvt:change\
+d=\x22/\x22/> </rdf:Se\
+q> </xmpMM:Histo\
+ry> </rdf:Descri\
+ption> </rdf:RDF\
+> </x:xmpmeta> <\
+?xpacket end=\x22r\x22\
+?>\x81\xfb\xf3'\x00\x00\x06\xe7IDATx\x9c\
+\xed[Ak\x1bG\x14\xfeVr\xd4\x80\x8bc\xcb\x91\
+m\xa4\x80\x1c\x90P\x0f))\xb1H\x83\x92[\xa19\
+\xd8`\xe81\x90cC\xa1\xd0C\xa1\xf4/\xd4\x04z\
+(\x14B\xaf\x81\x1c\x03\x06;\xd0{\xbc\xb8B6\x09\
+\xed\xa1\x8b\x05\xb1\xc0\x16R${mS\x83\x22K\xde\
+\x1e6o\xf4f4\xb2\x13\xed\xca\x1b\x88?\x10\xbb\x1a\
+\xef\xae\xde\xfb\xde\xf7\xde\xbc\x19\xc9\x86\xe38\xf8\x98\x11\
+\x0a\xda\x80\xa0qN@\xd0\x06\x04\x8ds\x02\x826 \
+h\x9c\x13\x10\xb4\x01A\xe3L\x09\x88\xe72N<\x97\
+q\xe8\x9c\x8f\x9f\xa5\x1d\x1cC\x83\xfe\x00\xee\x5cv6\
+&\xc6~\xf8qJ\xfc-;\x1b\x93\xae+\x9b\x96\x11\
+\xcfe\x9c\xb2i\x19\x83\xb6\xcf\x18d'\x18\xcfe\x1c\
+r\xba\xb2\xd3\x02\x00L\x8d\xbb\x9c\xe72a\x00@\xa9\
+\xe6`{\xf7\x18\x85\xe5\x1a\xe6\xefO\x02\x00\x16\x1fW\
+\x91\x9d\x8d\xa1\xb0\x5c\xc3\xa0I\x18\x08\x01\x14\xcd+\xb7\
+\xc6\x00t;mZm\xf1\x9e\x08HD\xddl\xdc\xde\
+=\x96\xae\xfd\xed\xd7\x8a\xf4l\xbf\x09\xf1\x95\x00r\x9c\
+\x22\x99\x8c\xb9\xb6\x92\x93\x80\x1cy\xc2\xf6\xee1r\x99\
+\xb0D\x0c\xd0!\x8a\xc8\x01\x5cu\xf8I\x82o5\x80\
+\xcb\x9d\x9c\x05BH\xc6\x8c\xb7D\xb8N\x98V[r\
+\xc8\xfd{X\x1a\xe7\x84\xf1k\xd76\x9a~\x99+\xe0\
+\x8b\x02\xe2\xb9\x8cCr\x9fIG\xc4x\x87\x88\x8e#\
+\xd7SnT_\x16\xc3B!@G\x11|\x8c\xc6\xf9\
+s\x00\xf8Z\x1b<\x13\xc0#O\xe0Q#y\x13F\
+/\xb5\xc4\xf9\xde\xfeP\xcf1@\x9f\x02\xa4\x82\xadU\
+\x1b\x80\xf7\x9a\xe0\x9b\x02T\x12\xd4*\xaf#ao\x7f\
+\xa8'!\xcf\xf2F\x17\x91:xU\x83'\x02\xd4j\
+O\xf2\xd7I[%\x018]\x0dj\x9a\x90\x22\x00\xd7\
+q @\x05\xf4\xca{\x9d\xf3@'\xf7\x81\xee\xc8\xf3\
+q@V\x88\x8a\xa7\xe6\x1bq\xbe\xb5j\x07\x9b\x02\xbc\
+\x93#p\xd9\x02.!:g{\x81\x9c\xd6\x15EN\
+(\xaf\x05^H\xf0\xbc\x168\xcdy\xc0u\x8aG\xb3\
+\xd7\xb9\xee\xdeR\xcd\x11/>\x0d\xce\xa4#\xbe(\xa0\
+o\x02\xd46\x97wr\xdb\xbb\xc7]\xd3\x19\xe0\xe6\xf4\
+\xcbbXR\xc4\xe8\xa5V\x17A\xbd0\x93\x8eH$\
+\xcc\xdf\x9f\xf4\xbc\x90\xf2\x9c\x02T\x07\x08S\xe3C\xa2\
+\xab\xe3\x8a\xb8\x9ejKEMW\x00K5\x07\xd7S\
+m1\x03\xe8\xe4\xcf\x09\x08\xb4\x06p\xe7\x1bv\x04\xb7\
+o\xba\xe3:\xa3\xd5\x02\x08\xf4&\x00\x80\xd4\x05\xea\x1a\
+# \xe0\x1a\xf0>\xcesp\x99\xbf,\x86\xa5#\xbf\
+?\x97\x09k\xd7\x0c\xfc\x1a\x9ay\xae\xdc\x1a\xf3\x94\x06\
+\x9e\x8a`\xc3\x8eH\xefM\xab\x0d\xd3jwU\xf0g\
+y\x03\xcf\xf2\xfa\x9a@\xf7\xe9\xc0\x0b\xa1\x0eT\x08\xbd\
+\x90\xe0)\x05.g&q\xfbfG\x8eS\xe3C\x22\
+\xef\xd5\x06\x86\xcbY\xad\x0f\xea\xc2\xe7$%\xe9\x16I\
+^V\x88\x9e\x14pq\xac)9\xaf\x83\xea,E\x9b\
+f\x0ar6\x11\x0d\x09\xe7\xd4\xa52?\xf2\xd9f\xf1\
+q\xd5\x8b\xf9\x00|\xe8\x03\x1avD\xe4#\x19G\xa4\
+\x94j\x8e\x88|2fHd\xf0\xb6X\xa7\x06\x9e\x16\
+\xc9\x98\x81\x5c&\x8c\xb5\x8d\xa6\xb4&\xc8\xce\xc6<\xef\
+\x0fx*\x82\xbc\x00\x02\xae\xf1\xe4<9\xc0\xe5\xac6\
+J*\x12\xd1\x10r\x99\xb0\xd8!\xa2g\xd0\xf1\x9b\xdc\
+'\xa8\xec\xb4\xc4\xf6\x1a\xd0\xbd\x9f\xf8\xbe\xe8\x8b\x80\xb2\
+i\x19[\xab\xb6p~%\x0fa\xd8L:\xa2M\x07\
+.k\x1e}\xd3j\x8b\xa8\xf2Y\x80\xc6\xc8Y\x22\x81\
+\x9e]\xd9ia\xb3\x18\x12\x8b\xa2~\xe19\x05V\xf2\
+n-\x00\xe4E\x91.\xefU\xe8r\x9d\xa3\xb2\xd3\xc2\
+\xd4\xf8PO\x12\xa6S\xc7\xc8\xce\xc6<\xa9\xa0o\x02\
+\xca\xa6e,>\xae\xa2nU%\xa3\xc8p\x82\x9a\x0a\
+j\xa1#\xa2\xb8\xe4\x094\xab\xa8\xc4&\xa2!\xf1y\
+\x89h\xc8\xd3\x9e\x80'\x05\x94M\xcb\xa0t \xf0V\
+U\x8d*\x91\xc0\x97\xb4\x1c\x89h\x08O\xcd7xj\
+\xbe\x11i\xc2\xab\xbf\xbas\xccg\x8e~\xe19\x05h\
+QDQo\xd8n\x0d\xe0D\xf0\x9c\xe7\xea\xe0\xe0\x8e\
+\xcc\xa4#B!\xb9LX\x9a.\xf93i,\x90\x14\
+ \x94M\xcb\xa0B\xb4\x92w\xf3\xb2\x17(\xf2\xbdz\
+\x86\xb5\x8d\xa6\x90\xfb\xdaF\x13\x95\x9dV\xd7t\x08\xc8\
+\x84\xd2y\xbf$\xf8\xb6-\xae\xb6\xc5\x047\xe2a\x11\
+Q\xd5yU\xc2jc\x95\x88\x86P\xaa9H\xc6\x0c\
+\xb1\xbf\x98\x8cu\xd6\x09\xbc\x19\xea\xa7\x0e\xf8\xfa\xe5(\
+\x15D\x929M\x8b\xba^^\x9d\xe6xj\xcc\xa4#\
+\xd2\x1e\x03\xe0\x16\xd3d\xcc\x10\x84\xd0\xf4I{\x12\x81\
+\x14AB\xd9\xb4\x8c\xbaU\x15\xe9@j\xe0\xaaP\xbf\
+\xd4\xe0\xdf\x15\xaa\xce\xab\xe0\x1b\xaa\xbcu&\x04Z\x03\
+\x08'E`%/\xbfW\x0b\xa1\x9a\x16D\x96\xda\xfa\
+\x02rO\xa1v\x85\xfd``_\x8e^\xceL\xa2n\
+Uq9\xe3~Oxq\xac\x89\x86\x1d\x11M\x13 \
+;\xbeY\x0cu]\xc3\xeb\x00\xad%\x80\x0e\x81\xb4E\
+\xe6eS\xe4\xcc~ \xa1K\x8b\xcdbH:6\xec\
+\x08\xeaV\x15\x0d;\xd2UTy\x1d!bTe\xf5\
+\x03_\x09x\xb0p\xd7y\xb0p\xd7\x99\x9b\x9fF\xdd\
+\xaa\x82\x8e@\xa7@\x12t\xb3\x06\xbff:u\x8c\xcd\
+bH\x90C\xd3\xa2z\x7f\xe0\xdb\xe2\x1c\x7f\xfc\xfc\xa7\
+0dn~Z\x1cU2\xc8\xf8\xbaU\x15\x0e\xd6\xad\
+*n\xecu\xa2\xcc\x179j\xa4\x0b\xcb\xb5.B\xfb\
+\x85\xef\x0a\xd0\x8d\xcf\xcdO\xa3\x5c:Dj\xeb?\xad\
+\x22\xc8\xf9\xb1\xe1K\xb8\xb1\xe7\xb8\xef\xbf\x88u9\xb9\
+\xb5j\xa3\xb0\x5cs\x9f\xc7f\x1e/6\xfbR\x04{\
+9\x0e\x00\xe5\xd2!\x0e\x96^\x01\x00F>\x1d\x06\x00\
+\xac\x8f\x1a\xf8\xeah\x04\xf6\xe1>\xd6G\x0d\xe1\xfc\xd8\
+H\x04\xf6\xc1\xdb\xcd\x94j\x19#sW\xb1\xfe\xa2\x06\
+*\xa8\xa4*\x02W\x5c\xbf\xf0u\x16P\x89\xe0\xce\x03\
+@r2\x8e\xb1\x91N\xee\xdb\x07M\xd8\x87\xfb\xc2y\
+\xc2\x8b\x8dM\x1ce'0>5\x8cxr\x18K\x8b\
+\x9b]\xce\x13\xbc\x92\xe0\xfb4\xa8#\x01\x00v*\x87\
+\xb8Px\x8d{wR\x00\x80'\xcf\x8b\x82\x10\xfb\xa0\
+\x89R\xb5\x0c\x00\xb8w'\x85\xc4\xb5\x11<|\xb4.\
+\x91\xa0\xc2\x8f\xe8\x03g\xf13\xb9\xb7\xc6\x1f,\xbd\xc2\
+O\xdf\xdd\xc0\xc3G\xeb\x00\x80\xa3\xec\x04J\x852n\
+\xa7Sx\xc2\x22\xfed\xa9\x08<w\xef\xbdPx\x0d\
+\xcc]\x1d\xa8}\x03M\x01\xc2\xbf\xbf\xff#\xce\xc9Q\
+R\x04\x91\xf2\xd9\xf7\xd7\x00t\x14C\xd0E\x9f\xf0A\
+\xd5\x80\x07\x0bw\x1d2\xa8W\x1a\x00\xb2CT#\x8e\
+\xb2\x13\xf8\xfc\xcb\x89S?\xc3/\xd9s\x0c\xa4\x06p\
+CO\x9a!\x00\xe0\xef\xbf^\xbf\x93\xf3\xc0`\x08\xf0\
+\xbd\x15\xd69\x7f\x92\xe1\xef\xe3\xfcid\xf6\x83\x81\xfe\
+TV\x05\xa9\xe3]\x1c\x19D\xb4\xb5p\x1c'\x90\xd7\
+\xb7\xbf|\xed\xd0K\x1d\xe7\xc7A\xbf\x02%\xa0\x9f\xbf\
+\xf9\xfd:\xd3\x14\xf8\x10q\xfe\x1f#A\x1b\x104\xce\
+\x09\x08\xda\x80\xa0qN@\xd0\x06\x04\x8d\x8f\x9e\x80\xff\
+\x019V\x0e\xf9w\x89\x96\xd2\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00\x16\x19\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3>a\xcb\
+\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x05\xdfiTXtXML\
+:com.adobe.xmp\x00\x00\
+\x00\x00\x00<?xpacket beg\
+in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
+0MpCehiHzreSzNTc\
+zkc9d\x22?> <x:xmpm\
+eta xmlns:x=\x22ado\
+be:ns:meta/\x22 x:x\
+mptk=\x22Adobe XMP \
+Core 7.1-c000 11\
+6.89d63a0, 2021/\
+11/28-21:09:33  \
+      \x22> <rdf:RD\
+F xmlns:rdf=\x22htt\
+p://www.w3.org/1\
+999/02/22-rdf-sy\
+ntax-ns#\x22> <rdf:\
+Description rdf:\
+about=\x22\x22 xmlns:x\
+mp=\x22http://ns.ad\
+obe.com/xap/1.0/\
+\x22 xmlns:dc=\x22http\
+://purl.org/dc/e\
+lements/1.1/\x22 xm\
+lns:photoshop=\x22h\
+ttp://ns.adobe.c\
+om/photoshop/1.0\
+/\x22 xmlns:xmpMM=\x22\
+http://ns.adobe.\
+com/xap/1.0/mm/\x22\
+ xmlns:stEvt=\x22ht\
+tp://ns.adobe.co\
+m/xap/1.0/sType/\
+ResourceEvent#\x22 \
+xmp:CreatorTool=\
+\x22Adobe Photoshop\
+ 22.5 (Windows)\x22\
+ xmp:CreateDate=\
+\x222023-02-08T01:3\
+1+03:00\x22 xmp:Mod\
+ifyDate=\x222023-02\
+-08T02:05:44+03:\
+00\x22 xmp:Metadata\
+Date=\x222023-02-08\
+T02:05:44+03:00\x22\
+ dc:format=\x22imag\
+e/png\x22 photoshop\
+:ColorMode=\x223\x22 p\
+hotoshop:ICCProf\
+ile=\x22sRGB IEC619\
+66-2.1\x22 xmpMM:In\
+stanceID=\x22xmp.ii\
+d:261c2870-6b33-\
+ff46-8d62-2e8131\
+8be547\x22 xmpMM:Do\
+cumentID=\x22xmp.di\
+d:c5af1284-9c50-\
+ff45-b4c1-5af1ef\
+438c73\x22 xmpMM:Or\
+iginalDocumentID\
+=\x22xmp.did:c5af12\
+84-9c50-ff45-b4c\
+1-5af1ef438c73\x22>\
+ <xmpMM:History>\
+ <rdf:Seq> <rdf:\
+li stEvt:action=\
+\x22created\x22 stEvt:\
+instanceID=\x22xmp.\
+iid:c5af1284-9c5\
+0-ff45-b4c1-5af1\
+ef438c73\x22 stEvt:\
+when=\x222023-02-08\
+T01:31+03:00\x22 st\
+Evt:softwareAgen\
+t=\x22Adobe Photosh\
+op 22.5 (Windows\
+)\x22/> <rdf:li stE\
+vt:action=\x22saved\
+\x22 stEvt:instance\
+ID=\x22xmp.iid:261c\
+2870-6b33-ff46-8\
+d62-2e81318be547\
+\x22 stEvt:when=\x2220\
+23-02-08T02:05:4\
+4+03:00\x22 stEvt:s\
+oftwareAgent=\x22Ad\
+obe Photoshop 22\
+.5 (Windows)\x22 st\
+Evt:changed=\x22/\x22/\
+> </rdf:Seq> </x\
+mpMM:History> </\
+rdf:Description>\
+ </rdf:RDF> </x:\
+xmpmeta> <?xpack\
+et end=\x22r\x22?>]\x9c\x88\x9b\
+\x00\x00\x0f\xe0IDATx\x9c\xed]KlT\xd7\
+\x19\xfe\xccx\x1c'\xae\x871\xf6\x5c\xfcH\x84\x09`\
+lHj\x84,\x9c\xc88\x11*4,H+\x14\xb1\
+\x00!/*5\x8e\x94E\xa5VQ6U\x17\x15\x8b\
+F\x91\xbaC\xaa\xb3D\x15]da)eA\x94J\
+H\x18T\x1cY\x88\xa8\x18;\xe6\xe1A\xc5x\xb8c\
+`\x18w\xb0\xe3\xc1v\x17\xc7\xff\xb9\xff9s\xc6\x1e\
+\xde\xe7\xfa\xdeO\x1a\xcd\xdc;w\xae\xef\xdc\xef;\xff\
+\xeb\xfcg\x5c\xb6\xb8\xb8\x88\x10\xc1\xc5\x9a\x97}\x01!\
+^.B\x01\x04\x1c\xa1\x00\x02\x8eP\x00\x01G(\x80\
+\x80#\x14@\xc0\x11\x0a \xe0\x08\x05\x10p\x84\x02\x08\
+8B\x01\x04\x1c\xa1\x00\x02\x8eP\x00\x01G(\x80\x80\
+#\x14@\xc0\x11\x0a \xe0\x08\x05\x10p\x84\x02\x088\
+B\x01\x04\x1c\xa1\x00\x02\x8eP\x00\x01G(\x80\x80#\
+\x14@\xc0\x11\x0a \xe0\x08\x05\x10p\x84\x02\x088B\
+\x01\x04\x1c\xa1\x00\x02\x8eP\x00\x01G(\x80\xc7@\xa2\
+\xa3u\xd5\xad\xa4-\x7f\xd9\x17`+8\xd9\xe9\xa1\xd1\
+\xb2DG\xebbWO\x13\x12\x1d\xad\x8b\xb4M\xcf\xfc\
+s\xe9\xa1\xd1\xb2\x17\x7f\xb5O\x8eP\x00\x06$:Z\
+\x17[\xf67(\xdb]=M\xca\xf6\xaf\xff\xe0\x14\x1c\
+G\xef\xf9I\x04\xab^\x00:!\xfa\xc86\x1d\xdf\xd5\
+\xd3\x84\xf3'&\xd0\xb2\xbf\x01m\xdb\xe7\x01x$w\
+\xf54\xa1.\x91\x07\x00\xe8\xe4g3\xf3\xcf\xfe\x0b<\
+g\xacj\x01\xd0\x08\xe5\xe6Z\x1f\xc9$\x02\x12F\xfd\
+;\x0e\x00At\xda]\x00\x00\xb4m\x9f\xc7TZ\x84\
+KD\xbe<\x87\xb3F{\xed\xf8\xca\x0a\x94\xad\x96_\
+\x08!\x029\xa14B\xc7NO\x02\x10\xa4\x12\xce\x9f\
+\x98P>_`\xca\x1d3\xe1\x00P\xbdn\x0e\x000\
+\xfec\x95\xdcW\x97\xc8cd8\x02@X\x82\xd4\x05\
+\x17\xfczl\x85\xaf\x05\xc0\xcd\xf9\xa1\x99\x18\x00\xe0\xeb\
+W\xb3\x00\x8a\x13\x0a\x00\xd7\xc7TR\xbb\xcf\xcc\x02\x00\
+~8X\xb5d\xf2\x05\xa6\xd2\xd1\x02\x01\x10\xf9\x80'\
+\x00:\xa6\xe2\x988\xcf\xc0\x9eJyL\xea\x82k\xb5\
+\x08|\xeb\x02\xf8\x08o\xef\xcf\xa1\xe7\xdd&4\xef\xac\
+\x06\x8e\x8f*\x04\x00\xc2\x84\x8f\x0c{\xdb\x9bZ\xa2\x00\
+\x84\x10\xba\xcf\xcc\xa2\xe7]a\x19N\xf4O`n\xbb\
+\xf8\xec\xc8p\x04\x09G\x88`\xe3\xd6\x1c\x00`\xfa^\
+\x85<\xc7\xf4\xbd\x0a\xd4%\xf2\x98JG12\x1cQ\
+\xae\xe1\xcf\xc7G\xa5\x10m&\x1f\xf0q\x1d =4\
+Z6vz\x12\xed\xfd9t\xbf\x11G\xf3\xcej$\
+/N\xa3\xfb\x8d\xb8\x1c\xd1\x00\x94\x11\x0dx\x96 \xed\
+.(\xe47\xef\xacF\xcf\xbbM\xa886\xbbD\xbe\
+8\x8e\xc8\x07\xc4\xe8\x9f\xbeW\xa1\x08\xa1.\x917^\
+\xc3\xa1\x99\x18(\xfexn7\xe1\x19\xc0\xd7\x16\x80^\
+_\xbd;\x03|\x93\xf2^\x03\xd8\xd5=\x83\xef\x07^\
+\x95\xc7\x8b@.*\xb7\x894@\x90O\xe8~#\x0e\
+\xf4gp\xbb\xb7Z!\x1f\x10\xa3\xde\xe4\x16\x8a]\x83\
+\x1f\xb2\x02_\x0a\x80G\xf3\x03Kf\x9c\x90z\xf8\x13\
+\x06\xf6Tb/\xe6\xb0\xab{F\x8e\xd6\xeausR\
+\x00iw\x01\x8d\xf0\x88\x22\x8c\xdf\xca\xc9}\x22\x03P\
+}<\xe0Y\x84\xf1\x1f\xab\xe4\xfe\x81=\x95\xc6k\x00\
+DVasV\xe0\xbb PO\xe5\x00\xcf\x97\x03\x82\
+\x8cM-\xc2o\xf3 \xadz\xdd\x9cB\xda\xe0y\x11\
+\xfc\xd5\xbf\xf6\x0a\xb6\xd4\x0aKq\xf5\xee\x8c$\x8f\xe2\
+\x04N>\x8f\x07\x00!\x02J\x15\xb3\x99y\xe5\x1ab\
+\xf1\x88b\x01l\x0d\x06})\x00@D\xf9\xdc\x9f\xd3\
+\xcd\xee\xec\xf2\x8e%s\xcd#w\xee\xbf\xb9\x08\x00,\
+K>\x9d\x0fP\xad\x00?n\xf0\xbc8.\x16\x8f\xc8\
+\xcfP\x0aj#\xf9\x80\x8f\x5c\x00'\x9e@7>\xed\
+F$i@\xbe\xe0}\x13\xa6\xd2Qlj\x01\x06\x00\
+e\xe4\x12\xd2\xee\x02\xea\x12\xea\xf1\x04=\xff'\x90\xf8\
+\x06\xcf\xab\xbe\xdfV\xf2\x01\x9fX\x00\xbd\xe6\xaeG\xf6\
+\x80H\xdbvu\xab>\x9d\xfb\x7f}\x1f\x87>r\xb3\
+\x99y\xc4\xe2\x91\xa5\xf41\xa2\xd4\x10\xa8\xe0\xa3\xef\xa3\
+k\x00D\xa6\xc1k\x0d\xb6\x9a\x7f\xc0'\x02\x00T\x0b\
+\xd0\xde/L\xf0\xdc\x1f+\x95\x91\x09\xc0\x18\xb9\x9b\x04\
+@\xfb\xa6\xefU(\x84\x0e\x9f\xcd\xa3\xb2^5\xe3\xa6\
+\xaa\xa0.\x02\x8a\x05\x8a\x15\x9cl\x15\x81\xaf\xea\x00]\
+=M\xb2\xe0\xf2\xa7O[e\xe5\x8dP\x97\xc8\x17\x8c\
+pN\xbei_\xf5\xba9\x85\xb4\xed\xefE\xa5;i\
+\xef\xcfI\xb1\x99\x90v\x17\x8c\xc4\x136\xb5D\x91\xba\
+\xe0ZK>\xe0\x13\x01P\xe4\xdf\xd87]Ppi\
+\xec\x9bF]\x22\xaf\x8cN\x93\x99\xa7\x02\x8en\x0d\xb8\
+?'\x5c\x1f\xcb+Bk\xec\x9b6^\x17\x09\x84D\
+\x00@y-\xf7YJ>\xe0\x83 \x90\xfc\xbf\x92\xbb\
+k\x05\x97R\xc0M>\x07\x95s\x01\xcfdw\x9f\x99\
+-\x10\xda@_F\x99+ \x81\x00\xa2\x84L\x01d\
+,\x1e\x91YI\xea\x82\x0b\xdeD\xf2\xe4w\xe1\xf9\xc1\
+j\x0b\xa0\x07\x7f\x03{*\x91z\xf8\x13\xae\xde\x9dQ\
+rv\x1e\x07L\xa5\xa3\xcb\x06}\xba\xf9\x07<\xdf\xee\
+e\x12B\x5cg\xbeI)\xc5!J5+\x8e\x15\x96\
+\x90)\x93\xe0\xb9\x7f\xfd;\x0e\xce\x9f\x98\xb0\xda\x02X\
+-\x00\xaa\xf7S.\x1d\x8bG\xa4\x08x\xce\x9ev\x17\
+0\x95\x8e\x16\x14j\x8a\x81\x8b\x84W\x08\x01!\x82b\
+B\x8b\xc5#\xa886[\xb4\x84L\x22pG\xe71\
+\x9bzVw\xe1\xf9\xc2z\x17\x00\x00\xf1fG\x8e,\
+\x12\x01\x00Y\xf1\xdb\xb8\x15F_N\xa3_\xf7\xfd:\
+\xd2\xee\x82\x12\xc4\xcd\xa6\xd4\xf2.\x91OX\xae\x84\xcc\
+as\xf0G\xb0Z\x00\x89\x8e\xd6E\xea\xd0\xe1\xb5\xf6\
+\x1f\x0e\x0a\xb2M\xa3\x9d\xca\xb3z\xad\x80&rx\x15\
+\x8f^\xef\xea\x9e\xc1\xbf\xfe)\xc4\xd2\xd9\x058\xad\x82\
+l.4\x0a\xee\xbek\xab\xc4\xbe\x115\xfb +\xf1\
+][%\x90\x022I\x17\xf1f\xe7\xe9\xbe\xfc\x0b\x82\
+\xf5u\x80DG\xeb\xe2\xa1\x99\x98\xf4\xb9\x00p\xe2\xdf\
+\x13\xf8\xe1`\x95,\xfc|?\xf0\xaaR\x16&\xe8\xcd\
+\x1d&P\xc0\x16\x8bG\xe0\x8e\xce\xe3\xfd\x8f\xbc\xf7L\
+\xb9~\xc2Y\x83\xe1\xb3y\xec\x1bQK\xc8\xdf\xb5\x09\
+\xb1d\x92.x\xd7\xf0S~\xfd\xe7\x0e\xab\x05\xa0\x93\
+OQ9\xe0\x89\x00@\x01\xf9\x09gM\x81\x15 \x01\
+\xd4%\xf2\x18<\xef\x05|D*\xef\xff\xe3\xd0\xad\x06\
+\x81D\x00\xa0\x80\xfcg\xf5\xfd_\x04\xac\x14\x00U\xfd\
+t\xf2\x09\xba\x08x|@b\xa0\xdc\x9dW\x0by\xad\
+\x80\xca\xbf<\xf27\xb9\x0e\xbd\x05\x8c\xce1\x95\x8eb\
+\xf8\xacx\xfd\xfeG^\x19\xd8\xf6\xc9\x1f\x1d\xd6e\x01\
+\x94\xfaQ\xfa7~K\x8c>\x22\x9d\x9ei\x7f63\
+\x8f\xbd\x1f\xceaSKT\x8e\xe4\xc6\xbe\xe9\xa2\xd5B\
+B,\x1eA,\x1eQ\xca\xb5\x09g\x8d$R\x07'\
+\x9f\xf0\xfeG\x90.\x83\x84\xd3\xd5\xd3$s\x7f\xdb\xbb\
+\x81\x00\x0b\x05@\xa9\x1f\xe1\xea\xdd\x99\x02\x11\xf0\xa8{\
+\xef\x87s\x8ai6\xb5g\x915\xa0Q\xcfI\xe6\xd1\
+\xfd\xc6\xad9\xec\xea\x9eA\xf5\xba9\xa5pd\x22\xdf\
+\x84\xb6\xed\xf3\xd2\x95p!<\xf6Mx\x81\xb0.\x0b\
+\xe07L\xef\xb4!\xf0\xdc|/\xd4b\x0e\xbd_J\
+\xb5\xd03\xf7\xe2\x99g\x06\x80\xd7\x03\xc8\xcf\xcd\xeb\x07\
+$\x0c\x1e`&\x1c/\x16\xe1B\xb6\x15V\xc5\x00\xa6\
+\xa5V\xd4iC\x117\xc0\xda\xbe>,,\xef\x16k\
+\xf2\xe0\xe0~\x7f\xb9\xb6o\xc2ru\x04S\xfd\x81\xc0\
+\x85`kL`\x8d\x008\xf9zT\xcf\xdb\xad\x00\x14\
+%\x9f\xd7\xf4M\xedY\x9cx\x8eRD\xb0\x1cxg\
+\xd0T:j\x9c\x10\xb2U\x04\xd6\x08\x00(\xec\xf7\xe3\
+Q9\xf9o\x00\x92|\x0e}$Rp\xb7\x12\xf9\x04\
+\xbd\xf7\x9f\xc7\x00&A\xe8\x7fO\xef\x15\x00<!\xdb\
+<\x1f`\xad\x00\x86\xcf\xe6\x95\xa2\x0cP82ur\
+tRx\xaf \xa0\xa6\x89&\xbf\xce\xcf\x0bx+}\
+^\xf9\xeb\x1a\xe3\x143\xf7\xfd\xba\x15\xd1\x8bH\xb6\x8a\
+\xc0\x9a,\x80\xc8\x1f>\x9b\xc7\xf0\xd9<\x9c\xd6\x08F\
+\x86\xc5\x83&z\x08|q\x86\x89\x18y\xce%\x02(\
+\xe5\x03\xa8\xd7\xaf4\xf2)\x95\xfc\xe9\xf7\x85&\x1d(\
+\xec\x18\xe6\xe0\x19\x81\xcd\xb0\xce\x02\xc4\x9b\x1dY\x8b\x07\
+\x0a;mx!\xc6dv\x09\xd4\xc9\xc3\xe7\xe9\x01s\
+\xa5\x8f\x9f\x17\x80\x9c\xf1\xdb\xf3\xabz$/Nc\xfc\
+V\x0e\x03\xffU\x17\x8b\x98b\x0f\x82N\xbc;*\xfe\
+\xa6\x8d\x95B\xeb\xd2@N\xbe\x0e}\x81\x06'\x817\
+pR!\x08\x00pF\xad\x16r\xa1,\xb7\x02\xd8\x94\
+J\xea)\xa2\xb7.@m\x0b\xe3\xa5e\xfaN\xee\xe8\
+<\xe2\xcd\xf6-\x12\xb1\xca\x05\xe83h\xa6>;\xc0\
+\x1bq\xfa\x5c>\x00\x85|j\xd6h\xef\xcf!\x16\x8f\
+(\x81\xe0r\xe7.\xd6\x0f`J\xf9\x12\xce\x1a\xa5\xfc\
+L\x0f?,\x0b\x03,\xb4\x00\x80\xd7U\xa3\xcf\xc45\
+\xf6-\xa5\x82\xbdQ\xa5hC\x22h\xef\x9f^q\xbd\
+\x9f~^\xc2T:*\xc8\xc3,\xd0[]\xb0^\xa0\
+\xb3\x0b\x98J\x17\x16\x8b\x08\xbcE\x0c\x00p\xc6k\x13\
+\x9bM\x09+0vz\xd2:+`\x85\x00\xf8\xe8w\
+G\xe7QY/\xf6_\x1f\xcbK\xdf\xad/\xbf\x163\
+\x81\x85#\xb2\xd4f\x0d\x820\xd5Q\xc5r\x9c\xe8\x9b\
+\x90\x22\x00\xd4\xd5F@a\xb6\xa1[\x9d\xe4\xc5\xa5\xed\
+%\x11T\xd6\xdb\x1b\x07X\xe3\x02\x08D>\x00\xd9V\
+e\xaa\xef\xeb\xdd\xb8\x80\x98\x96%\xd3=~+'\xc9\
+\xa7\xf9z\xbd{\x97\xa6\x82Mn\xa3\xb1o\x1a\xb1x\
+\xa4\x80|\x00\xb2\x0b\x99O<\xd1g\xf93\xef\x15\xac\
+\xac\x87\x95M\x22V\x09 \x93t\x95m\x1e\x10\x9a\x9a\
+4\x01\xb57\xbf\xb2^\x15\x01'\x9f\x9f\x8b\x0b\x81Z\
+\xcd\x81B\xb7\xd1\xde\x9f\x93\xee\xc5\x94-PF\xb1\xd2\
+\x8c%\xfd\x5c\x8c\x8d\xb0\xc2\x05P\x07\x0d\x1f!\xb3)\
+ \x16\x17\xaf\xf56,I*?\x07\x17\x01*\x95f\
+\x0d=\xb3\xd0\xa3\xf4\x95\xdc\x06\x95w\x8b\x05\x8e2K\
+x\xbd\xca8c\x19ov\x90\xba`g\x9b\x98\x15\x02\
+\xd0\xa1w\xd4:\xad\x11#\xa9\xd4\xca\xa5\x83D@\xaf\
+9\xf4T\xcd4\xe3\xa8,\x13\xd7\xce\xad\xd7\x1fL=\
+\x82\xfc\x1c\xd4-\x14ov\xac\xf3\xff\x80\x85\x020\xb5\
+Sg3\xf3\x0a\xa9\xfa{\xd4\xcfGk\xfa\xe8xa\
+E\x22\xca\xb1\xfa(\xa6.c\xd3\x0f<\xf0\xb4\x91\x0a\
+K\xb7{\xab1\x95\x8e\xe2\xfaX^6\x90rq\xf2\
+s\x90P)\x00\xb4\x11\xd6\xc4\x00\xe9\xa1\xd12=\x06\
+\xd0o\x9c\xd3\x1a\x91#\xda\x94g\x13\xd9\xbaU\xc8f\
+\xe6\x0b&\x84\xb8\x0b0\xad7\xa0\x15>\x00\x94\x0e#\
+j.\x89\xc5#\x18</\xce\xed\xb4Fd\xecA\x0f\
+\x93\xeb\xa1\x14\xf0q\xee\xcb\xf3\x86u\x16\x00\xf0\x82\xc1\
+x\xb3#E@73\x16\x8f`6%\x16^\x90\x18\
+t\xa1\xf0TR\x07\x11\x98>\xe8\xa5rdEx\x1b\
+8\x00\x19\xe5\x9b\x96\x89\xa5\x0fVIk#E\xa0Y\
+(wT\xec\xb7\xb9M\xdc\x1a\x0b\x00xV\xc0\xe4'\
+i\xc4\xebds\x97\xc1\xdf\xa3\xc8\x9b\xf6\xcd\xa6\xd4\x91\
+lZ\xf5\xbb\xa9%j\x9c6.\x96\x81\xe8\xd7G\x16\
+\x8a\x1e\xfc\xef\xeb\xd6\xcd\x16X%\x00\xc0\xeb\xa6-\xc5\
+%\x98\xe0\x8e\xce\x1bo\xf6\xbe\x91\xc2\x05\x9f\xed\xfd\xb9\
+\xa2%[\xbe\x10\xc4\x94V\x16\xfb\xdb\x1c\xdc\x0a-'\
+\xee\x97\x09+]\x80\x8eL\xd2\x05\x92\x85\x85\x94R\xd6\
+\xdfQ0\x08\xac\xdc+hJ\xf5L\x19\x88\xc9\xbd\x88\
+)g\xb3\xfb\xb1\xad\xfc\xcba\x9d\x05\xe0\xe0\xa3F\xb7\
+\x08\xfa(\xa7m}\x94\x91+(6\x92Mi\xa4\xfe\
+S\xb2\x14\xe4q\xf2\xc9\xf7\xeb\x9fwZ#\x98M\x95\
+&N\x1b`\xb5\x00\x00u\x81E1\x11\x10\xe9\x9c|\
+\x93\x0b\xe1\x91:\x8f\xd2gS\x9e\xf9.\xd6\xc4\xb1\xfd\
+\xbd\xa8$_O-\xf93G\xea\x82k\xad\xef'X\
+\xd5\x10R*\xf4\x9fy_\xc9\xb4\x9a\xa6\x9a\x01/\xb3\
+\xd0k\x08\x04\xfe\xa3Q\xfa>}?P8\xea\xfd\xb0\
+N\xd0z\x0b`\x82n\x15J\xfd\x5c&\xa9\x8eH\x1a\
+\xf5\xc5\xd2\xc9\xe5\xc0\xc9\xe7\xc4\x9bF\xbc\xad\xe4\x03>\
+\x09\x02\x9f\x04\x1f\x7f\xf1AI\xa6m\xec\xf4\xa4\xfc'\
+\x11\x00d}A\xf8\xf1\xf9e;\x948\x8a\x8d\xfe\xd2\
+\xaf\xf8\xe5`\xd5\x08`9\xc2\xdb\xdci\x8c\x00\xe8|\
+\xb8\x80\xc1\xd7<\xa3\xc7Gk\xb1\xa0\xcdd%\xb8(\
+\xf4\xd1o\xbb\xc9\xd7\xe1K\x17\xc0\xf1\xf1\x17\x1f,\x16\
+#\xff?\x83\x1e\xc1\x9d\x0f\x17PS\xb5\x16\xfb\xcb\xaa\
+\x15\xe2;\x1f.(\xd3\xb5\x99\xa4[T\x0c\xb4\x7f\xa5\
+\x9f\x80\xf1\x0b\xf9\x80\x8f\x05P\x8c\xf8\xdb7\xd5\x0a\xdf\
+\xe8\xf1\xcb\xa8\xa8(GM\xd5Z\xd4\xc4D\x13\xe9\xe1\
+\xb5\xb5\xc8$]\xec/\xabFM\xd5Zt>\x5c\xc0\
+r)&`6\xf1\xfa\xb3\x9f\x88'\xf8\xce\x05\xac\xe4\
+\xdb\xef\xa6\x96\x96\x8d\x9f\x1aG\x14@EE9\x1aj\
+\x1cI\xfe\xfd\xdc\x03\xd4\xc4\x128\xbc\xb6Vlg\xe7\
+\x84\x08r\x0f0\xb8$\x8a\xd3\x8b\xea\xef\x02\xf2\xb9\x09\
+\xda>xh\x03\xfa\xbf\xbe\xf9L\xbf\xdb\xcb\x80o\x04\
+PjP\x07\x08\xf2wli\xc6\xfd\xec\x1c&\xef\xbb\
+\xa8\x89U`\xdb\xfar\x5c\xb9\xf3H\x1eC\xdb5\xb1\
+\x0a)\x82\xc3K\xaf\x0f\xaf\xad\xc5?\x96&p\x88l\
+\x00\xe8\xff\xfa\xa6R\x8d\xe4\xfb\xfd8\xfa\x01\x1f\xb9\x80\
+\xaf>\xff\xb6\xa4\x1b\x1c\x1dr\x15\xf2\xb7mx]\x92\
+\xbdm}9\xdelH`\xdb\xfaB\xdd\xdf\xcf=\xc0\
+\xb6\xf5\xe5\xb8\x9f{ E\x90I\xbahs\xa7\xa5[\
+9xh\x83\x22\x08\x82\xbe\xed'\xf8F\x00+\x81\x02\
+\xbe|\x87\x83KW\x93\xb8y\xe76~\xf7\x9b\x9fK\
+\xb2oL\xa6\x0b>C\xef\x91{\x00\x80\x03;\x1a\x14\
+\x11\x1c\xd9\xbd\x19\xd9S\xe3\xf2\xfc\xc5\xc8~\x1c\x0be\
+\x13|S\x09\x5c\xe9\x06\xffg\xd0Em}\x15\xb2\xa7\
+\xc6\xf1\xd9';\x01\x00\x13\x97\xc5\x7f\xee\xbar\xe7\x11\
+nL\xa6q`GC\xc1\xe7\xc82\x90{ Q\x9c\
+\xba$~\xdc!\xfb\xbf\x1c\xf2\x1d\x0e\xde\xee,m>\
+\xbfTKe\x0b|a\x01J\x1d]\xd9S\xe38\xb2\
+{3&.g1q9\x8b+w\x1eI\xf2{\x8f\
+n\x05\x00%\x0e\xe0\xd8\xb6\xbe\x1c7&\xd3\xf2\xfd\x03\
+;\x1a\xd0{t+>\xfbd'\xa2Cb\xf4\xf3\xb4\
+\xf2i\xaf\xd5\x16X\x1f\x04>\xc9\x0d=y\xee\x1a\x00\
+ \xf63\xd1\xf5\xd3{t\xab\x14\x04\xa1\xe9\xad\x98b\
+!\xb6\xad/G\xef\xd1\xad\xe8\xfb\xfb\x8f\xb81\x09\xbc\
+\xd9\x90\x00 \xde\xff\xec\x93\x9d\xf8\xf2\xf8E\xa0cy\
++\xe0\xb7\xd1\x0f\xf8\xc8\x05\x00\xa5\xb9\x81\xe8\x90\x8b|\
+\x87\x83\xe8\x90\xab\xb8\x82+w\x1e\xe1\xd2\xd5$vl\
+i\xc6\xbe_\xac\x93\xfbO\x9e\xbb\x86\x1d[\x9a\xa5\xe9\
+ozK\xfc\x07\xd2/\xffvQ\x9e\xf7\xc8\xee\xcd8\
+y\xee\x1aZ?}\xab\xe8\xdf\xf6#\xf9\x80O\x5c@\
+\xa9x\xbb\xd3A\xec\xc0FD\x87\x5c\x1c\xd9\xbd\x19\x80\
+J>\x05\x88:.]MJwAV\x81\xc4\x93\xef\
+pp\xf2\xdc5\xe4W\x18\xfd~3\xfd\x04\xeb]\x00\
+\xc7W\x9f\x7f[\xf687Z'\xbf\xb6\xbej\xc9\xa8\
+Cq\x09\xf9\x0e\x07\x97\x86\x92K\xef4\x03\xf2(\xa0\
+\xb6\xbe\x0a8\xb0\x11\x8d\x1b\x8a\xff\x18\x14\x8d\xfe\x8f\xbf\
+\xf8`\xd1o\x96`U\xb9\x00\xc2\xed\x9b9dO\x8d\
+\xcbm\x8a\xe2i\xff\x91\xdd\x9b\x15a\xbc\xdd\xe9\xc8\x00\
+\x8f\x02>\x00\x88\xad@<\xe0_\xd3O\xf0\x95\x008\
+V\x12\xc3\xed\x9b9Y\x16\xe6)\x1c\x17\x87)\xbd#\
+!\xd4\xd6W\xadH>\xc1\xcf\x22\xf0\xad\x00\x08O\xe2\
+{\xf9\x84Q\xa9$spW\xe4g\xf2\x81U \x00\
+\xe0\xc5\x05`~'\xdb\x04_\x05\x81&\xbc\x08\xf2W\
+#\xf1\x04_[\x80bf\x98G\xe3O\x22\x10\xd3g\
+W\xab\x08|-\x80\xc7A12K%\xd9\x8f)^\
+IX\x5c\x5c\x0c\xcc\xe3\xb7\x7f\xf9\xe5\xe2\xd3\xbc\xbf\x1a\
+\x1f\x81\xb1\x00!\xccXU\xa5\xe0\x10\x8f\x8fP\x00\x01\
+G(\x80\x80#\x14@\xc0\x11\x0a \xe0\x08\x05\x10p\
+\x84\x02\x088B\x01\x04\x1c\xa1\x00\x02\x8eP\x00\x01G\
+(\x80\x80#\x14@\xc0\x11\x0a \xe0\x08\x05\x10p\x84\
+\x02\x088B\x01\x04\x1c\xa1\x00\x02\x8eP\x00\x01G(\
+\x80\x80#\x14@\xc0\x11\x0a \xe0\x08\x05\x10p\x84\x02\
+\x088\xfe\x0f\x19e$Pk\x8e\x9e\xa1\x00\x00\x00\x00\
+IEND\xaeB`\x82\
+\x00\x00\x13\x10\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3>a\xcb\
+\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x05\xdfiTXtXML\
+:com.adobe.xmp\x00\x00\
+\x00\x00\x00<?xpacket beg\
+in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
+0MpCehiHzreSzNTc\
+zkc9d\x22?> <x:xmpm\
+eta xmlns:x=\x22ado\
+be:ns:meta/\x22 x:x\
+mptk=\x22Adobe XMP \
+Core 7.1-c000 11\
+6.89d63a0, 2021/\
+11/28-21:09:33  \
+      \x22> <rdf:RD\
+F xmlns:rdf=\x22htt\
+p://www.w3.org/1\
+999/02/22-rdf-sy\
+ntax-ns#\x22> <rdf:\
+Description rdf:\
+about=\x22\x22 xmlns:x\
+mp=\x22http://ns.ad\
+obe.com/xap/1.0/\
+\x22 xmlns:dc=\x22http\
+://purl.org/dc/e\
+lements/1.1/\x22 xm\
+lns:photoshop=\x22h\
+ttp://ns.adobe.c\
+om/photoshop/1.0\
+/\x22 xmlns:xmpMM=\x22\
+http://ns.adobe.\
+com/xap/1.0/mm/\x22\
+ xmlns:stEvt=\x22ht\
+tp://ns.adobe.co\
+m/xap/1.0/sType/\
+ResourceEvent#\x22 \
+xmp:CreatorTool=\
+\x22Adobe Photoshop\
+ 22.5 (Windows)\x22\
+ xmp:CreateDate=\
+\x222023-02-08T01:3\
+1+03:00\x22 xmp:Mod\
+ifyDate=\x222023-02\
+-08T02:05:50+03:\
+00\x22 xmp:Metadata\
+Date=\x222023-02-08\
+T02:05:50+03:00\x22\
+ dc:format=\x22imag\
+e/png\x22 photoshop\
+:ColorMode=\x223\x22 p\
+hotoshop:ICCProf\
+ile=\x22sRGB IEC619\
+66-2.1\x22 xmpMM:In\
+stanceID=\x22xmp.ii\
+d:6c293c5b-135f-\
+3d48-8098-40caba\
+5fd63a\x22 xmpMM:Do\
+cumentID=\x22xmp.di\
+d:dd6dc769-4de3-\
+2748-a5c0-2bed63\
+096713\x22 xmpMM:Or\
+iginalDocumentID\
+=\x22xmp.did:dd6dc7\
+69-4de3-2748-a5c\
+0-2bed63096713\x22>\
+ <xmpMM:History>\
+ <rdf:Seq> <rdf:\
+li stEvt:action=\
+\x22created\x22 stEvt:\
+instanceID=\x22xmp.\
+iid:dd6dc769-4de\
+3-2748-a5c0-2bed\
+63096713\x22 stEvt:\
+when=\x222023-02-08\
+T01:31+03:00\x22 st\
+Evt:softwareAgen\
+t=\x22Adobe Photosh\
+op 22.5 (Windows\
+)\x22/> <rdf:li stE\
+vt:action=\x22saved\
+\x22 stEvt:instance\
+ID=\x22xmp.iid:6c29\
+3c5b-135f-3d48-8\
+098-40caba5fd63a\
+\x22 stEvt:when=\x2220\
+23-02-08T02:05:5\
+0+03:00\x22 stEvt:s\
+oftwareAgent=\x22Ad\
+obe Photoshop 22\
+.5 (Windows)\x22 st\
+Evt:changed=\x22/\x22/\
+> </rdf:Seq> </x\
+mpMM:History> </\
+rdf:Description>\
+ </rdf:RDF> </x:\
+xmpmeta> <?xpack\
+et end=\x22r\x22?>DI\x12\x80\
+\x00\x00\x0c\xd7IDATx\x9c\xed\x5cMlSW\
+\x16\xfebc\xd7\x90\x89k\x18lL\x00\x85\x0c\x948\
+$#\x10\x8a\x08\x15\x90\x0a\x0dLY\x0c#\xa1\x0e\x1b\
+\x84\xd8M\xa9\xc4\xba\xea\xa6\xd2h$\x16S\xcd\x1ai\
+\xd2%\x1auC\x11R\x87\x05U\xa6B\x90\x22~\x14\
+\xa1 \x12\xe2\x84B\x5c\x954\xc6/\xa4\x19\x1b\x13\x13\
+\x93x\x16/\xe7\xfa\xbc\xeb\xe7\x10\xa0\x04\xdfw\xef'\
+Y\xb1\x9f\x9f\xed$\xdfw\xcf\xf9\xee9\xe7\xb9\xaeT\
+*\xc1@_\xf8\xde\xf6/`\xf0va\x04\xa09\x8c\
+\x004\x87\x11\x80\xe60\x02\xd0\x1cF\x00\x9a\xc3\x08@\
+s\x18\x01h\x0e#\x00\xcda\x04\xa09\x8c\x004\x87\
+\x11\x80\xe60\x02\xd0\x1cF\x00\x9a\xc3\x08@s\x18\x01\
+h\x0e#\x00\xcda\x04\xa09\x8c\x004\x87\x11\x80\xe6\
+0\x02\xd0\x1cF\x00\x9a\xc3\x08@s\x18\x01h\x0e#\
+\x00\xcda\x04\xa09\x8c\x004\x87\x11\x80\xe60\x02\xd0\
+\x1cF\x00\x9a\xc3\x08`\x11\x88v$<{\x0d\xbd\xd6\
+\x02\xa8F,\x1d\x8fv$J\xd1\x8eDi\xcb\xc1\xb5\
+\x9e\x15\xc1\xb2\xb7\xfd\x0b,58\x91\x9cX\xab/Y\
+G\xf7w\x1f_\x87hG\xa2td:\x0c\x008{\
+q\xfc\xad\xfc\xaeK\x01-\x04\x10\xedH\x94\x88`\x22\
+\xf5\xf6\xe1z\x00\xb6\x08\xe8\x9c\xdd\xc7\xd7\x01\x00\xac\xcc\
+\x1c\x8eL\x87q\xfc}\xfb1\xae\x01?\x9fhp\x88\
+\xc7\xeaK\xd6-\xe5\xdf\xf0\xa6P\xe7\xf5\xaf\x88\xa1\x10\
+>rq\x5c\x90\xda\xbc\xa3\x01\x7f?\x9d\x14\x22\x00\x80\
+h\xac\x9c\x0d\x1b\xbbs\x82\xfc\xe6\x1d\x0d\x18\xbd\x95\xc3\
+\x99kc\x8e\xf3G.\x8e{B\x04\x9e\xf6\x00\xb4b\
+\x89\xfc\xae\x0d\x11Ah\xd7\x86\x08\xb6\x9d\xcf\x03\x00v\
+\xee\x9d\x16\xafi\xec\xb6\x9f\x03l\xf2\x09\xfc|\xc0\x99\
+>T\x86'S\x00\x11C\xe1\x1d\x00p>\x8f\x91\xc7\
+\xd3\xc07i\x00\xb0\xef\xa3L~sK\x1e\xb9\xc9\xa0\
+\xe39B\xeaa\xbe\xe2\x98W\x22\x80\xe7\x04\xc0s9\
+\xc1\xca\xcc\xa1w_\x08{/\x15\xc4\xb1\xf4\xd3g\xe8\
+\xdd\x17\xc2~\xcc\x00\x80 _>\x0f\xb0\x05A\xe7o\
+\x9aO\x15#({\x8b7\xf8\xe7\xbcqx\xd2\x03T\
+\x13AvjV\x90\xdb\xbb/\x84\xce\xdd\xc0\x84\x15\x10\
+\xab\xbfa\xd5\x0cr\x93A\xdc\xb8\x0a\xec\xbdT@|\
+\xc5;\x00\xcab\xd9\xb4%P\xf1YW\xcf\x8c)\x1d\
+\x09<%\x00\xb7\xd0O\xe6\xae\xb9\xc5\xce\xdf\xff\xfd\x8f\
+\xbd\xd2;w;_\xdb\xb0jF\xdc\xe7\x22\x00l\xb1\
+\xec?d??:\x5c6\x82\x8d\xdd9\x00\xc0\xd9\xe5\
+Y\x00j\xee\x0c<\x93\x02\xc8\xed\xcb \xe2\x09\xfb\x0f\
+\xcd\xcc\x93X\x5c\xf0\xfd:w\x03\xbd\x08\x89\xd7P\x8a\
+X\x1d\xb5_\x17<U\x10;\x0a\xcc\xef(TL\x09\
+\x9e\x8d\x00|[G\x22\x18\x1d\xaew\x10\x08\x003\x9f\
+\xdb$\xcb\x11`!\x04O\x15\xd0\xb5!\x82}\x7f\x8e\
+c\xf4V\x0e\xa9\x87y\x5c\xf9i\x0ag\x97g\x95\x8b\
+\x02\x9e\xda\x06\xd2?\x9f\x93oe\xe6p\xb3w9r\
+\x93\xc1\x8a\xd5\xfb\xb7\x93\x09!\x04\x19\x0d\xabf\xc4\x8d\
+c\xc2\xb2}\xc0\xc8\xe3i\x5c\xfa&\xed\xbaCP\x09\
+\x9e\x12\x80l\xfe\xac\xcc\x1c\x00\xa0\xb5mV\x1c\xa3\xd5\
+\xcb\xeb\x01\xc1S\x05\xb1\xea\xc9\x0cr\x90\x10&\xac\x00\
+VG\x8b\xe8\xdd\x17B\xfa\xe93\x8c<\x9ev\xec\x10\
+T\x84g<\x00\x81H\xe7\x18\x1a\xf4\x8b\xa8\xd0\x88\x82\
+k=\x80H\xa7\x9d\x00\x17\x01\x19?\x8a \xe4\x0f\xb8\
+I\x0cG\xfc\x08\xcf\x17\x87TJ\x03\xca\x0a\x807q\
+\xe8\xb1l\x02i\xe5OX\x01X\x999Dc\xbe\x17\
+\xd6\x03\x80\xb2\x08dP\x04\x00\x9c&1\x1c\xf1\xff\xaa\
+\x7f\xdbRBI\x13\xe8\xe8\xd4\xcd\x1b\xafhG\xa2\x14\
+\xd9\x18\x13\xe7|\xf0Q\xf9|\xca\xdbD\x9e\xbc\xc5\xa3\
+-\xe1BF\x90\xea\x05\x04\xbe\x1d\xbc?Rt\x88@\
+\xa5*\xa1r\x02 \xf2yS\xe7\xec\xf2,\xb6\x1c\x5c\
+\x8bL\xd2^\xf1\x9c\xfc\xa1A\x9b\x18\xee\x03\x00[\x04\
+\x00\xc4\xfe>7\x19\x14B!\xa2\xb9\x08d_\x008\
+E`e\xe602\xdf6V\x85|@\xb1\x14@\xe4\
+\xcb&\x0e?\x01\xb7\xd9y\x97\xcf\x01\xb1\x84M|4\
+\xe6s\xf8\x02\xf2\x03\xfb\x0f\x95W3\xdf\xe3OX\x81\
+\x8a\x9cO\xe7\xc8\x11\x82\xd2\x0a\x81\xba\x8e*A)\x01\
+\x10\xdcL\x1c\x81\x13\x0f\x00\x83W\x88\xc4\xca<\xcd\xeb\
+\x02\x1c\xcd-y\x8c\x0e\xd7;r>\x00\xdc\xec]\x8e\
+h\xcc'\x8e\xb5\xb6\xcdbh\x10\xe2\xf3\xdc\x0ch\xad\
+C\xb9m`\xb5-Xk\xdbl\x05\xf9\x04:\xde\xda\
+6+\x9e\xa3UN)\x82@\xe1\x9f~NX\x01L\
+X\x01\x0c\x0d\xfa\x1d\xa6\x92@\xc7\x88|\xd5\xda\xc4\xca\
+\x09 }=#D 7i\x88\x0cn\xd6>\xf8\xc8\
+>n\xafV'\xd9r\x08\xe7\xc4\xca\x88\xc6|\x18\x1a\
+\xf4\x0b\xa2\x83\xa7\x0a\x08\x9e*`h\xd0\x8f\xec\xd4l\
+\xd5\xd7\xd5:\x941\x81\xf26\x8f\xfe\xe9\xdc\xc4\x11(\
+W\xbb\x1d\xa3\x95oe\xe6\xc4\x80\xc7\xcf'\x1aD\xfe\
+\x07P\xd5\xed\x13\xf9\xdb\xce\xe7\x1d&\x94\x8a@\xe9\xeb\
+\x19\xe1\x03T1\x82\xcaD\x00\xab/Y\xc7\x0dV8\
+\xe2\x17\xe4\x03\xee.\x9d\x17w\x08\xcd-yA>\x95\
+\x83\x1b\xbbs\xa2V\x00T\x92\xces\xfb\xb6\xf3\xf9\x0a\
+\x13J[\xca\xf8\xae\x98R\xe4\x03\x0a\x09\x80\x10\x8d\xf9\
+\x10\x8d\xf9\x1cc\x5c\x80s\xb5\xf3\xfb\xdc\xd5\x036\xb9\
+n$Rk\x97\x9f\xc7\xc1E\xe0\xd6\x07H_\xcf\xbc\
+\xfe\x1f\xf7\x16\xa0D\x0a\xe0\xe3\xda2d\x17/\x87\xff\
+\x86U3\x15d6v\xe7\x10_\xf1\x0e\xb6\xfcv9\
+\x80\xf2\xc4\x0f\x0d}\x92/\x90\x0b<\x00\x90I\xce\xe2\
+\xc0\x90sX\xa4\xa75\x84\x03Cv\x14P\xad#X\
+\xf3\x02p+\xf1R\xee\xa6V.\xe0\x9e\x028xT\
+\xb8|\x0e\xae$\xd2nA|v\xccW!\x82\xec\xd4\
+,\x0ai\x08\xc2\x89|\x9a\x22>smL)\x11\xd4\
+\xbc\x00\x00\xa7\x08d\x036\xf3y\xc8\x95|\xb7\xae\x9e\
+\x9b\x08\x00\x9b\xc4P\x1c\x15Ds\xd0st\xbc`\x97\
+!\x1c\xe4\xf3\x11rUD\xa0\x8c\x07\x88\xc6|\xae\xb9\
+[\xee\xe7\x8f\x0e\xd7\x8b\x90\xbf\xd0`G,\xe1GO\
+kH\xac\xfcp\xa4\xbc\x9d\xa3\x92r8\xe2w\x15\xc5\
+\xa6-\x01\xc4\x12~\x1c\x18*T\x1d!?2\x1dV\
+\xa2\x1eP\xf3\x95@\xb9\xc7\xefV\x05\x94s<\x1f\xf1\
+\xa6\x1a\x7fsK\xbe\xa2\xb2\xd7\xd6eo\xfb\xee\x8f\x94\
+\x8fEc>Atvj\x16\x9d\xbb!\xf6\xfaTo\
+\x90\x0d!\x87j\x03\x225-\x00\x99\xfcj\xad\xdcN\
+\x97=\xbc\xdc\xd2%\x91\xf0\xed\x1ea\xd3\x96\x00\x06\xaf\
+\x14\x11\x8a\xdbbpN\xff\x16\xd1\xda6[Q$\xda\
+\xb9w\x1a\x17\x92e\xf3G C\xd9\xd3\x1a\x02R\xd9\
+W\xff\xe3\x97\x08J\xa4\x80\xabg\xc6`e\xe6\x10\x8e\
+\xf8+\xaa\x80\xd4\xcau\xab\xe9\x138\xe1\x8d\xdd9a\
+\x22\xf9qJ\x03\x14\xf2\x9b[\xf2\x22jp4\xb7\xe4\
+\xb1s\xef4F\x87\xeb\xd1\xd6\x15@Okei\xba\
+\xa75\x84\xa9TF\x09\x0fP\xf3&\x90\x1b@\xbe=\
+\x03*G\xbb\xab\xf5\xecWG\x8b\x18\x1a\xf4W\x18\xc8\
+\xdb\x87\xebE\xbe\x07l\x11\xc8\xf5\x05\xfe>\xd5\xde[\
+6\x94\xaa\x90\x0f\xd4\xb8\x00\x88|\xee\xc8\xb9)\xe3=\
+~>\xf6\xd5\xdc\x92\x17\x9d;\x02]\xf3'O\xf2\x92\
+\x08Bq\xe7\xfb\x93\x10\xaa\xcd\x04\xc8\x9d\xc4\xcb\xe7\xec\
+\x9f\xb4\x95T\xa5\x22X\xd3\x02\x00l\x11\xc4w\xd9\x93\
+>\xe1\x88\xdf\xd1v\xe5\x0d\x1e^\xd7\x07\x9c\x03\xa1\x13\
+V\xa0j\xf1\x87v\x01\xdc\xe4\x01\xee)\xc5\xad\xc7\x00\
+8\x9bH\x0e\x83\xa8\x80\x08jZ\x00\x9c|\x00\x0e\x17\
+NQ!\x1c)\x87v\x00\x15\x97qS\x94xQ\xf1\
+'\x1a\xf3\x89r0\x89\x88D\xc0\x89\x97\x87B\xf8\xce\
+\x82\x84p\x7f\xa4\x88\xf4u5\xd2\x80\x12&\x10\x80c\
+u\xf2\x94\xc0\xc9o\xde\xd1\x80\xe3\xef\xaf\x13\xd1\x80Z\
+\xb8\x00\x10\x8aC\x186\x22\x9f\xc2>P\xfeN\x00j\
+\x0e\x016\xa1\x9cp\xb7qq\x8e\xd5\xd1\xa2\x88\x00\xf1\
+]1%\xea\x005-\x00\xab/Y\x97\xbe\x9e\x11U\
+7\xc0\xb9g\xdf{\xa9z!\x86\x8b\x80\xe6\xffH\x04\
+D~!m\x17}\xaa5\x87\xe4\xcb\xcar\x93\xc1\xaa\
+\xd3\xc2\x1c\xe1\x88_\x99\x08P\xf3u\x00\x9a\xf4\x1d\xbc\
+R\x14\x85\x1b\xc7\x04\xee\x22\x0b1T\xe9#\xe2\x09m\
+]\x01`\xc8\xfdZ\x01\x82l\xf8H\x04\xb4\xeb\xa0\xf1\
+1\x15G\xc2j\xda\x03\x00\xe5N \xf7\x02$\x00\xde\
+\x99s3w$\x18N\x0c5sB\xf1rZ\x19\xbc\
+Rt\xf5\x07\xf4z\xc0i\x0a\xdd\xf2>A5\x13X\
+\xd3)\x00\xa8\x1c\xb1\xe6\xe4\xf3\xbc.\x17bb\x09\xbf\
+#]\xc8\xa0(0x\xa5(\xfa\x02\xdc\x1fp\xf2\x01\
+'\xd1\x8d\xdd9\xd1\x83\x90w\x0b\xd9\xa9Y\xa5&\x83\
+k^\x00\x1c4tA\xc5\x1bZ\xc9\x0b\x99\xbb\xfb#\
+E\x87i\xe4\xe1\xff\xea\x991\xb1\x0b\xe0\xcd!\x22\x7f\
+u\xb4(\x08\xe6\xb3\x80\xf2\x85\xa5\xf2\xd4\x90J\x93A\
+J\x08\x80\xcc \x00G\xe5\x8e\x88\xe6\xe6\x0ep\x92L\
+\xa0\xd7M\xa52\xe2\xa7<c\xd8\xd6\x15p\x90\xcf\x11\
+\x8d\xf9\xaa^XJ\x05'*W\xab\x04%\x04\x00\xbc\
+\xf8j\x9bX\xc2/n\x80S(\x04Y\x04\x80\x9d\xa7\
+y\x84\xb8?R\x5c\xd0\xcc-\xf6\xb2p\xb3\x0d|\x83\
+\x98Je0\x95rn\x0f9\x89<\x05\x00\x95\x11\xa1\
+\xf3\xe9\x1c:\x9f\x96/\xe5*\xa4\xed\x1by\x06^?\
+\xe0\xb9\xbf\x9a\xdf\x90?\xdf-\x02\xd5*\x94\x12\x80\xd5\
+\x97\xac\xa3F\x0b\xdd'\xd0?\xdd\x8d\x08\x1e\xf6\xad\xbe\
+d]\xf6\x89\xbd\xbf\xef|Z\xb9\xd2\xe5/\x82\x92;\
+\x86\xb2\xdf\xe0cd\xfc\xb3U\xa9\x03(%\x00\xc0=\
+\x15\xc8\xfe\x80O\xe8\x12\x11\x8b\xe9\xd0\xc9\x93\xbd\xfc\xa2\
+\x0f\x12\x82<I\x94\x9d\x9au\xec6\xdcRO-\xa3\
+\xa6\x0bA/\x02\xff\x82g\xc0^\xe1\xf1x\xb9^@\
+\xa4\x7f\xfc\xc5\x87\xa5\xc3G\x9a\xf0\xf1\x17\x1f:r\xf2\
+\xca\xfaw\x81RN\x9cK\xa0\xad!\x91\xcf\x07C\xa9\
+\x98\xc4A\xbb\x91B\xda~\x1f~\x99z\xad\xa3\xe6\x0b\
+A\x8b\x05\xffBh\xfay\xf8H\x93\xeb\xb9\xc9\xd3\x03\
+\x08\xff\xa6\xde\x16\x00\x80\x8b\xa5\x1c:\x9f\xce\xe1\xc6\x0a\
+\x9f\x83<\x22\x95\xb7\x8a\xe5aQ\x9e\xefIp*}\
+K\x88g\x04@\x90W9\x00\xdc\xb9\x91\xc1\xef;m\
+b\x93\xa7\x07\x00\x00Mk\x1a+^\xfbK\xfe\x7fB\
+\x04\xf2J\xe6\xab\x9eH\x0f\xc5\xed\xb4A\xe7\xabB:\
+\x87r\x1e`!\xb8\x91OH\x9e\x1e\x10+?\x18\x5c\
+\x86\x95\xe1rS\x87\xee\xaf\xac\x7f\x17\x07\xeb\x1a0\x95\
+\xca\xe0\xf0\x91&\xb8\x99\xccW\xf5\x17\xb5\x0aOD\x80\
+\x85\x88\x07l\xf2\xb7\xbf\xb7\x11\x0f\xc6-\x14f\x9ea\
+k\xd3z\x00\xc0/\xd9\x19\x87\x10\xe8\xf1\xdd\x1f\x1fb\
+f\xe69\x12'\xdbq\xfe\xec\x8fb\x85\x13T^\xf1\
+2\x94\x17\xc0\x8b\xc8\x07l\x01\x04\x83\xb6\xdf\xdd\xda\xb4\
+\x1e[\xd7,\xc3\xddG\xcf\xc5\xf3\xf4\xf8\xc1\xb8\x85?\
+m_\x8b\xafo\xa6\xb0\xb5i=\xfa\xef\xa5\x84\x08\xb8\
+\x9f\x90\x1f\x7f\xf9\xd9\xb7\xca\x0aAy\x01\x00\x0b\xe7\xfd\
+\xe4\xe9\x01|\xfa\xc9\x0e\x00\xc0\xd8\x80=\xa6}\xf7\xd1\
+s\x87\x08d\x01\x00\xc0\xd77S\xf8\xcb\xce\x8d\xf8\xea\
+\xfb\x1f\x908\xd9^\xf5\xb3U&\x1f\xf0\x80\x00\xaaE\
+\x80;72\x08\xf4ept\xcffqL&\xf9B\
+\xff\xb8\xb8O\xcf\x03\xb6 \xd6\xb5\x87\xf1\xcf\x7f\xddZ\
+\x90|\x82\xca\x22P\xda\x04.\x14\xfe\xc9\xf5\xdf}\xf4\
+\x1c_}\xff\x03.\xf4\x8f\xe3\xc1\xb8\x85\x13\xc7Z\xc4\
+\xf1\xdf\xad\x8d:^\xb3u\xcd2<\x18\xb7p\xf7\xd1\
+s\x8c\x0dd\xf1\xe9';\xc4\xae\xe1\xce\x8d\xea\x97\x7f\
+/&\x0d\xd5*\x94\x15\xc0b\xfe\xe9\x89\x93\xed\x22\x8f\
+g\x9f\xe4q\xe2X\x0b\xc6\x06\xb2\x22\x12\x1c\xf8\xc3*\
+\x00\xe5\x95\xbf\xae=\x8c\x13\xc7Z\xaa\x8a\xe0u\x7f\x9f\
+Z\x84gS\x80\x8c\xe4\xe9\x01\x1c\xdd\xb3Y\x90O\x91\
+\xa0\xe7\xbbI\xf4\xdfK\x01\x00\xb6\xbf\xb7Q\x88\xa2\xfb\
+\xdf\xc3\xc8>\xc9\xe3\xe8\x9e\xcd\x9e\xf6\x01\xcaF\x00\xc2\
+\xcb\xfc\xf3\xef>z\x8e\xfe{)A\xfe\xd8@\x16\xfd\
+\xf7R(v\xc4P\xec\x88\xa1\xff^\x0a=\xdfMb\
+l \x8b\xec\x93<\x12'\xdb=M>\xa0x/\xe0\
+e\x908\xd9\x8e\xfe\xf9PN\xbb\x81\x0ar;c\xf3\
+\xe7lt\xbc\xce\xcb\xd0&\x05pPa\x88\xfc\x81\xdb\
+\xf3^w\xff\x04\xa5\x05\xc0\xc9\xff\xf2\xb3o\xeb^F\
+\x0c\x8b%\xb9\x1a\xbc@>\xa0\xb8\x00\xdc\xb0\xd4n\x5c\
+u!x\xd2\x03\xbcl4x\x95\xf7\x7fS\xef\xbd\xd4\
+\xf0\x5c\x04p\xc3\xeb\x8a\xc1K\x84\xcb\xd0B\x00\x1c\xb2\
+o\xe0\xc7\xe91\x9d\xe3e\xe2\x05J\xa5\x92v\xb7\xbf\
+\xfe\xe3\x8f\xa5_\xf3<\x95o\xdaE\x00\x03'\x94\xaf\
+\x04\x1a\xbc\x1e\x8c\x004\x87\x11\x80\xe60\x02\xd0\x1cF\
+\x00\x9a\xc3\x08@s\x18\x01h\x0e#\x00\xcda\x04\xa0\
+9\x8c\x004\x87\x11\x80\xe60\x02\xd0\x1cF\x00\x9a\xc3\
+\x08@s\x18\x01h\x0e#\x00\xcda\x04\xa09\x8c\x00\
+4\x87\x11\x80\xe60\x02\xd0\x1cF\x00\x9a\xc3\x08@s\
+\x18\x01h\x0e#\x00\xcda\x04\xa09\x8c\x004\x87\x11\
+\x80\xe60\x02\xd0\x1cF\x00\x9a\xe3\xff2F\xe2\xea\xc2\
+\x87-\xbd\x00\x00\x00\x00IEND\xaeB`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x04\
+\x00\x07\xb8\xb5\
+\x00t\
+\x00r\x00e\x00e\
+\x00\x0f\
+\x0a\xf0\xed\x87\
+\x00t\
+\x00r\x00e\x00e\x00_\x00s\x00t\x00a\x00g\x00e\x001\x00.\x00p\x00n\x00g\
+\x00\x0f\
+\x0a\xe9\xed\x87\
+\x00t\
+\x00r\x00e\x00e\x00_\x00s\x00t\x00a\x00g\x00e\x002\x00.\x00p\x00n\x00g\
+\x00\x0f\
+\x0a\xeb\xed\x87\
+\x00t\
+\x00r\x00e\x00e\x00_\x00s\x00t\x00a\x00g\x00e\x004\x00.\x00p\x00n\x00g\
+\x00\x0f\
+\x0a\xea\xed\x87\
+\x00t\
+\x00r\x00e\x00e\x00_\x00s\x00t\x00a\x00g\x00e\x003\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x002\x00\x00\x00\x00\x00\x01\x00\x00\x0c,\
+\x00\x00\x01\x965\x0dv\xc8\
+\x00\x00\x00z\x00\x00\x00\x00\x00\x01\x00\x00/s\
+\x00\x00\x01\x965\x0dv\xc8\
+\x00\x00\x00V\x00\x00\x00\x00\x00\x01\x00\x00\x19V\
+\x00\x00\x01\x965\x0dv\xc8\
+\x00\x00\x00\x0e\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x965\x0dv\xc8\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -0,0 +1,238 @@
+import calendar
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import date, timedelta
+
+from PySide6.QtWidgets import QWidget
+from PySide6.QtGui import QPainter, QColor, QImage, QFont
+from PySide6.QtCore import Qt, QRectF, QSize, Signal
+
+from db import fetch_daily_focus_seconds
+from metrics import PAINT_TIME, timed
+
+HEADER_HEIGHT = 28  # Month name
+WEEKDAY_HEIGHT = 18  # Day names
+ROWS = 6  # Weeks a month can touch
+MAX_CACHED_MONTHS = 12
+FULL_SHADE_MINUTES = 120  # Days with this much Focus get the darkest shade
+
+def month_start(day):
+    return day.replace(day=1)
+
+
+def add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_days(month):
+    return calendar.monthrange(month.year, month.month)[1]
+
+
+def render_month(month, focus_seconds, width, height, dpr, colors):
+    """
+    Paint a month into a QImage: the month name, the day names and one cell
+    per day with its number and its Focus minutes, shaded by minutes.
+
+    Only uses QImage, so it can run on a worker thread. colors is a dict with
+    the "text" and "focus" QColors, read from the palette by the caller.
+    """
+    image = QImage(int(width * dpr), int(height * dpr), QImage.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(dpr)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    painter.setPen(colors["text"])
+    title_font = QFont(painter.font())
+    title_font.setBold(True)
+    painter.setFont(title_font)
+    painter.drawText(QRectF(0, 0, width, HEADER_HEIGHT), Qt.AlignCenter, month.strftime("%B %Y"))
+    painter.setFont(QFont())
+
+    cell_width = width / 7
+    cell_height = (height - HEADER_HEIGHT - WEEKDAY_HEIGHT) / ROWS
+    for weekday in range(7):
+        painter.drawText(
+            QRectF(weekday * cell_width, HEADER_HEIGHT, cell_width, WEEKDAY_HEIGHT),
+            Qt.AlignCenter,
+            calendar.day_abbr[weekday],
+        )
+    focus = QColor(colors["focus"])
+    for index, seconds in enumerate(focus_seconds):
+        row, weekday = divmod(month.weekday() + index, 7)
+        cell = QRectF(
+            weekday * cell_width,
+            HEADER_HEIGHT + WEEKDAY_HEIGHT + row * cell_height,
+            cell_width,
+            cell_height,
+        ).adjusted(1, 1, -1, -1)
+        minutes = round(seconds / 60)
+        if minutes:
+            focus.setAlphaF(0.2 + 0.8 * min(minutes, FULL_SHADE_MINUTES) / FULL_SHADE_MINUTES)
+            painter.fillRect(cell, focus)
+        painter.drawText(cell.adjusted(3, 2, -3, -2), Qt.AlignLeft | Qt.AlignTop, str(index + 1))
+        if minutes:
+            painter.drawText(cell.adjusted(3, 2, -3, -2), Qt.AlignRight | Qt.AlignBottom, f"{minutes}m")
+    painter.end()
+    return image
+
+
+class CalendarWidget(QWidget):
+    """
+    A month calendar of the Focus minutes of each day.
+
+    A month's data comes from one range query over the daily_stats table and
+    is painted once into an image per widget size; a repaint is a single
+    blit. Whenever a month is shown, the months before and after it are
+    fetched and painted on a worker thread, so moving to them is instant.
+    The worker is started by the first prefetch and stopped by shutdown(),
+    which closing the widget calls.
+    """
+
+    monthReady = Signal(object, object, object)  # month, focus seconds, (generation, key, image)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.month = None
+        self.focus_seconds = OrderedDict()  # month -> array of seconds per day
+        self.images = OrderedDict()  # (month, width, height, dpr) -> QImage
+        self.pending = set()  # Image keys being prefetched
+        self.generation = 0  # Bumped by refresh(), older prefetches are dropped
+        self.prefetcher = None
+        self.futures = []  # Prefetches submitted to the prefetcher
+        self.monthReady.connect(self.store_prefetched)
+
+    def sizeHint(self):
+        return QSize(7 * 56, HEADER_HEIGHT + WEEKDAY_HEIGHT + ROWS * 40)
+
+    def show_month(self, day):
+        self.month = month_start(day)
+        self.update()
+        self.prefetch_neighbours()
+
+    def prefetch_neighbours(self):
+        for month in (add_months(self.month, -1), add_months(self.month, 1)):
+            self.prefetch(month)
+
+    def next_month(self):
+        self.show_month(add_months(self.month, 1))
+
+    def previous_month(self):
+        self.show_month(add_months(self.month, -1))
+
+    def refresh(self):
+        """Forget the loaded months, after the sessions changed."""
+        self.wait_for_prefetches()
+        self.generation += 1
+        self.focus_seconds.clear()
+        self.images.clear()
+        if self.month is not None:
+            self.show_month(self.month)
+
+    def invalidate_months(self, months):
+        """Forget only the given months, after the sessions of some of their days changed."""
+        self.wait_for_prefetches()
+        self.generation += 1
+        for month in months:
+            self.focus_seconds.pop(month, None)
+        for key in [key for key in self.images if key[0] in months]:
+            del self.images[key]
+        if self.month is not None:
+            self.show_month(self.month)
+
+    def image_key(self, month):
+        return (month, self.width(), self.height(), self.devicePixelRatioF())
+
+    def colors(self):
+        return {"text": self.palette().windowText().color(), "focus": QColor(0, 200, 0)}
+
+    def load(self, month):
+        return fetch_daily_focus_seconds(month, month + timedelta(days=month_days(month) - 1))
+
+    def prefetch(self, month):
+        key, colors = self.image_key(month), self.colors()
+        if key in self.pending or key in self.images:
+            return
+        self.pending.add(key)
+        data = self.focus_seconds.get(month)
+        if self.prefetcher is None:
+            # One worker is enough: it only prefetches the months next to the one shown
+            self.prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="calendar")
+        self.futures = [future for future in self.futures if not future.done()]
+        self.futures.append(
+            self.prefetcher.submit(
+                self.prefetch_in_background, month, data, key, colors, self.generation
+            )
+        )
+
+    def wait_for_prefetches(self):
+        """Drop the queued prefetches and wait for the one running, if any."""
+        for future in self.futures:
+            future.cancel()
+        wait(self.futures)
+        self.futures = []
+        self.pending.clear()
+
+    def shutdown(self):
+        """Stop the prefetcher, the next prefetch starts it again."""
+        self.wait_for_prefetches()
+        if self.prefetcher is not None:
+            self.prefetcher.shutdown()
+            self.prefetcher = None
+
+    def prefetch_in_background(self, month, data, key, colors, generation):
+        try:
+            if data is None:
+                data = self.load(month)
+            image = render_month(month, data, key[1], key[2], key[3], colors)
+            self.monthReady.emit(month, data, (generation, key, image))
+        except RuntimeError:
+            pass  # The widget was deleted meanwhile
+        except Exception as e:
+            logging.error("Could not prefetch %s: %s", month, e)
+
+    def store_prefetched(self, month, data, rendered):
+        generation, key, image = rendered
+        if generation != self.generation:
+            return  # Read before the last refresh
+        self.pending.discard(key)
+        self.cache(self.focus_seconds, month, data)
+        if key == self.image_key(month):  # Not resized meanwhile
+            self.cache(self.images, key, image)
+
+    def cache(self, cache, key, value):
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > MAX_CACHED_MONTHS:
+            cache.popitem(last=False)
+
+    def month_image(self, month):
+        key = self.image_key(month)
+        image = self.images.get(key)
+        if image is None:
+            data = self.focus_seconds.get(month)
+            if data is None:
+                data = self.load(month)
+                self.cache(self.focus_seconds, month, data)
+            image = render_month(month, data, self.width(), self.height(), key[3], self.colors())
+        self.cache(self.images, key, image)
+        return image
+
+    def resizeEvent(self, event):
+        # Images are only valid for the size they were painted for
+        self.images.clear()
+        super().resizeEvent(event)
+        if self.month is not None:
+            self.prefetch_neighbours()
+
+    def closeEvent(self, event):
+        self.shutdown()
+        super().closeEvent(event)
+
+    @timed(PAINT_TIME, widget="CalendarWidget")
+    def paintEvent(self, event):
+        if self.month is None:
+            return
+        painter = QPainter(self)
+        painter.drawImage(0, 0, self.month_image(self.month))
+        painter.end()
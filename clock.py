@@ -0,0 +1,253 @@
+import heapq
+import itertools
+import time
+from datetime import datetime, timedelta
+
+
+class SystemClock:
+    """
+    The real clock: wall time from datetime, monotonic time from the OS and
+    timers backed by QTimer.
+    """
+
+    def now(self):
+        return datetime.now()
+
+    def today(self):
+        return self.now().date()
+
+    def monotonic(self):
+        return time.monotonic()
+
+    def timestamp(self):
+        """Wall time as seconds since the epoch (UTC, unaffected by DST)."""
+        return time.time()
+
+    def utc_offset(self):
+        """Current offset of local time from UTC, in seconds."""
+        return datetime.now().astimezone().utcoffset().total_seconds()
+
+    def timer(self, callback, parent=None, precise=False):
+        """
+        Create a stopped QTimer whose timeout calls callback.
+
+        Precise timers never fire early, coarse ones may fire up to 5% early or late.
+        """
+        from PySide6.QtCore import QTimer, Qt
+
+        timer = QTimer(parent)
+        if precise:
+            timer.setTimerType(Qt.PreciseTimer)
+        timer.timeout.connect(callback)
+        return timer
+
+
+class VirtualTimer:
+    """
+    Stand-in for QTimer driven by a VirtualClock.
+
+    Supports the subset of the QTimer API the app uses: start, stop,
+    isActive, interval, setInterval, setSingleShot and remainingTime.
+    """
+
+    def __init__(self, clock, callback):
+        self.clock = clock
+        self.callback = callback
+        self._interval = 0
+        self._single_shot = False
+        self._entry = None
+
+    def start(self, msec=None):
+        if msec is not None:
+            self._interval = msec
+        self.stop()
+        self._entry = self.clock._schedule(self._interval / 1000, self._fire)
+
+    def stop(self):
+        if self._entry is not None:
+            self.clock._cancel(self._entry)
+            self._entry = None
+
+    def isActive(self):
+        return self._entry is not None
+
+    def interval(self):
+        return self._interval
+
+    def setInterval(self, msec):
+        self._interval = msec
+
+    def setSingleShot(self, single_shot):
+        self._single_shot = single_shot
+
+    def isSingleShot(self):
+        return self._single_shot
+
+    def remainingTime(self):
+        if self._entry is None:
+            return -1
+        return max(0, int(round((self._entry[0] - self.clock.monotonic()) * 1000)))
+
+    def _fire(self):
+        self._entry = None
+        if not self._single_shot:
+            # Like QTimer, the next timeout is scheduled before the callback runs
+            self._entry = self.clock._schedule(self._interval / 1000, self._fire)
+        self.callback()
+
+
+class VirtualClock:
+    """
+    A clock that only moves when advance() is called, for tests and simulations.
+
+    Wall time and monotonic time move together. Timers fire deterministically, in deadline order, while the clock is advanced.
+    suspend(), jump() and set_utc_offset() move the wall clock on its own, to
+    simulate a laptop sleeping, an NTP correction or a DST change.
+    """
+
+    def __init__(self, start=None, utc_offset=0):
+        self._now = start or datetime(2024, 1, 1, 8, 0)
+        self._utc_offset = utc_offset
+        self._monotonic = 0.0
+        self._queue = []
+        self._counter = itertools.count()
+
+    def now(self):
+        return self._now
+
+    def today(self):
+        return self._now.date()
+
+    def monotonic(self):
+        return self._monotonic
+
+    def timestamp(self):
+        return (self._now - datetime(1970, 1, 1)).total_seconds() - self._utc_offset
+
+    def utc_offset(self):
+        return self._utc_offset
+
+    def suspend(self, seconds):
+        """
+        Simulate a system suspend: wall time moves, monotonic time does not
+        and no timer fires, like CLOCK_MONOTONIC on Linux.
+        """
+        self._now += timedelta(seconds=seconds)
+
+    def jump(self, seconds):
+        """Simulate the wall clock being set forward (or back) by seconds."""
+        self._now += timedelta(seconds=seconds)
+
+    def set_utc_offset(self, utc_offset):
+        """Simulate a DST or time zone change: local time shifts, UTC does not."""
+        self._now += timedelta(seconds=utc_offset - self._utc_offset)
+        self._utc_offset = utc_offset
+
+    def timer(self, callback, parent=None, precise=False):
+        return VirtualTimer(self, callback)
+
+    def _schedule(self, seconds, callback):
+        entry = [self._monotonic + max(0.0, seconds), next(self._counter), callback]
+        heapq.heappush(self._queue, entry)
+        return entry
+
+    def _cancel(self, entry):
+        # Lazy deletion: cancelled entries are skipped when they reach the top
+        entry[2] = None
+
+    def _set_monotonic(self, value):
+        self._now += timedelta(seconds=value - self._monotonic)
+        self._monotonic = value
+
+    def advance(self, seconds):
+        """Move time forward, firing every callback that falls due on the way."""
+        target = self._monotonic + seconds
+        while self._queue and self._queue[0][0] <= target:
+            due, _, callback = heapq.heappop(self._queue)
+            if callback is None:
+                continue
+            self._set_monotonic(max(due, self._monotonic))
+            callback()
+        self._set_monotonic(target)
+
+    def advance_to(self, when):
+        """Move time forward to the given datetime."""
+        self.advance(max(0.0, (when - self._now).total_seconds()))
+
+    def pending(self):
+        """Number of callbacks waiting to fire."""
+        return sum(1 for entry in self._queue if entry[2] is not None)
+
+
+class ClockJump:
+    """
+    A discontinuity between wall-clock and monotonic time.
+
+    kind is "suspend", "clock_jump" or "utc_offset". drift is how many more
+    seconds the wall clock moved than the monotonic clock, missed is how late
+    the check ran compared to when it was expected.
+    """
+
+    def __init__(self, kind, drift, missed=0.0):
+        self.kind = kind
+        self.drift = drift
+        self.missed = missed
+
+    def __repr__(self):
+        return f"<ClockJump {self.kind} drift={self.drift:.1f}s missed={self.missed:.1f}s>"
+
+
+class ClockJumpDetector:
+    """
+    Detects suspend/resume, wall-clock jumps (NTP, manual changes) and DST
+    changes by comparing how far the wall and monotonic clocks moved since
+    the previous check. Works the same on every platform.
+    """
+
+    def __init__(self, clock, threshold=2.0, suspend_threshold=30.0):
+        self.clock = clock
+        self.threshold = threshold  # Ignore drift below this, e.g. NTP slewing
+        self.suspend_threshold = suspend_threshold
+        self._sample()
+
+    def _sample(self):
+        self._monotonic = self.clock.monotonic()
+        self._timestamp = self.clock.timestamp()
+        self._utc_offset = self.clock.utc_offset()
+
+    def check(self, missed=0.0):
+        """
+        Compare the clocks with the previous check and return a ClockJump, or None.
+
+        missed is how late the caller woke up compared to the deadline it asked
+        for. Where the monotonic clock keeps running during suspend (Windows),
+        a suspend shows up as a very late wakeup rather than as drift.
+        """
+        previous_offset = self._utc_offset
+        drift = (self.clock.timestamp() - self._timestamp) - (
+            self.clock.monotonic() - self._monotonic
+        )
+        self._sample()
+        if drift >= self.suspend_threshold or missed >= self.suspend_threshold:
+            return ClockJump("suspend", max(drift, 0.0), missed)
+        if abs(drift) >= self.threshold:
+            return ClockJump("clock_jump", drift, missed)
+        if self._utc_offset != previous_offset:
+            return ClockJump("utc_offset", self._utc_offset - previous_offset, missed)
+        return None
+
+
+_clock = SystemClock()
+
+
+def get_clock():
+    """Return the clock used by the app and the database helpers."""
+    return _clock
+
+
+def set_clock(clock):
+    """Replace the process-wide clock and return the previous one."""
+    global _clock
+    previous = _clock
+    _clock = clock
+    return previous
@@ -0,0 +1,11 @@
+import pytest
+
+import db
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    """Keep the database in a temporary folder, so tests never write to the real one"""
+    monkeypatch.setattr(db, "get_app_path", lambda: str(tmp_path))
+    monkeypatch.setattr(db, "_db_ready", False)
+    return tmp_path
@@ -0,0 +1,413 @@
+"""
+Headless timer daemon.
+
+Runs the same Focus / Rest cycle as the GUI, with session persistence and
+alerts, but without any window. Clients talk to it over a local socket (a Unix
+domain socket, or localhost TCP where those are not available) with one JSON
+object per line:
+
+    {"command": "start"}
+    {"command": "pause"}
+    {"command": "reset"}
+    {"command": "adjust", "minutes": 5}
+    {"command": "status"}
+    {"command": "subscribe"}
+
+Every command is answered with {"ok": true, "status": {...}} or
+{"ok": false, "error": "..."}. After "subscribe" the connection stays open and
+receives {"event": name, "status": {...}} lines whenever the timer changes, so
+any number of clients can follow one timer without polling the database.
+
+Usage:
+    python daemon.py [--address PATH|HOST:PORT]          run the daemon
+    python daemon.py start|pause|reset|status|watch      control it
+    python daemon.py adjust MINUTES
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import socket
+import sys
+import tempfile
+from datetime import time
+
+from clock import SystemClock, get_clock
+import metrics
+import subscribers
+from db import ensure_db, get_settings
+from diagnostics import setup_logging
+from events import EventBus, TimerPublisher, load_plugins
+from scheduler import Scheduler
+from sound import play_bell_sound
+from timer_core import PomodoroTimer
+
+DEFAULT_PORT = 47625
+SESSION_ALERT_SECONDS = 10 * 60  # Alert when no session was started for 10 minutes
+COMMANDS = ("start", "pause", "reset", "adjust", "status", "subscribe")
+
+
+class AsyncioTimer:
+    """
+    Stand-in for QTimer running on an asyncio event loop, for processes
+    without a Qt event loop such as the headless daemon.
+    """
+
+    def __init__(self, callback, loop=None):
+        self.loop = loop or asyncio.get_running_loop()
+        self.callback = callback
+        self._interval = 0
+        self._single_shot = False
+        self._handle = None
+
+    def start(self, msec=None):
+        if msec is not None:
+            self._interval = msec
+        self.stop()
+        self._handle = self.loop.call_later(self._interval / 1000, self._fire)
+
+    def stop(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def isActive(self):
+        return self._handle is not None
+
+    def interval(self):
+        return self._interval
+
+    def setInterval(self, msec):
+        self._interval = msec
+
+    def setSingleShot(self, single_shot):
+        self._single_shot = single_shot
+
+    def isSingleShot(self):
+        return self._single_shot
+
+    def remainingTime(self):
+        if self._handle is None:
+            return -1
+        return max(0, int(round((self._handle.when() - self.loop.time()) * 1000)))
+
+    def _fire(self):
+        self._handle = None
+        if not self._single_shot:
+            self._handle = self.loop.call_later(self._interval / 1000, self._fire)
+        self.callback()
+
+
+class AsyncioClock(SystemClock):
+    """The real clock, with timers on the running asyncio event loop instead of QTimer."""
+
+    def timer(self, callback, parent=None, precise=False):
+        # asyncio timers are not coarsened, so precise needs no special handling
+        return AsyncioTimer(callback)
+
+
+def default_address():
+    """Unix socket in the user's runtime directory, or a localhost port on Windows."""
+    if not hasattr(socket, "AF_UNIX") or sys.platform == "win32":
+        return ("127.0.0.1", DEFAULT_PORT)
+    directory = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(directory, f"xbitopomo-{os.getuid()}.sock")
+
+
+def parse_address(text):
+    """"HOST:PORT" becomes a TCP address, anything else is a socket path."""
+    host, _, port = text.rpartition(":")
+    if host and port.isdigit():
+        return (host, int(port))
+    return text
+
+
+class TimerDaemon:
+    """
+    The authoritative timer: a PomodoroTimer driven by a Scheduler, with the
+    same event bus subscribers (persistence, sounds, plugins) as the GUI.
+
+    Listeners are called with every message to broadcast, the socket server
+    registers one per subscribed connection.
+    """
+
+    def __init__(self, clock=None):
+        self.clock = clock or get_clock()
+        settings = get_settings(
+            {
+                "focus_duration": 1800,
+                "short_break_duration": 300,
+                "long_break_duration": 900,
+                "sessions_before_long_break": 2,
+            }
+        )
+        self.timer = PomodoroTimer(
+            settings["focus_duration"],
+            settings["short_break_duration"],
+            settings["long_break_duration"],
+            settings["sessions_before_long_break"],
+            clock=self.clock.monotonic,
+        )
+        self.events = EventBus()
+        TimerPublisher(self.events, self.timer, self.clock)
+        subscribers.register(self.events)
+        load_plugins(self.events)
+        self.listeners = []
+        self.scheduler = Scheduler(self.clock)
+        self.scheduler.clock_jump_listeners.append(self.handle_clock_jump)
+        self.completion_job = self.scheduler.call_later(
+            0, self.check_completion, "completion", start=False
+        )
+        self.session_alert_job = self.scheduler.call_later(
+            SESSION_ALERT_SECONDS, self.trigger_session_alert, "session_alert"
+        )
+        self.scheduler.call_daily(time(0, 0), self.timer.reset_day, "date_rollover")
+        for event in ("started", "paused", "reset", "adjusted", "completed", "day_reset"):
+            self.timer.on(event, lambda *args, event=event: self.broadcast(event))
+        self.timer.on("completed", self.handle_completed)
+
+    def status(self):
+        """Snapshot of the timer state, as sent to clients."""
+        remaining = self.timer.remaining_seconds
+        return {
+            "session_type": self.timer.session_type,
+            "label": self.timer.label,
+            "is_running": self.timer.is_running,
+            "remaining_seconds": remaining,
+            # Lets clients count down on their own between events
+            "ends_at": self.clock.timestamp() + remaining if self.timer.is_running else None,
+            "completed_sessions": self.timer.completed_sessions,
+        }
+
+    def broadcast(self, event):
+        message = {"event": event, "status": self.status()}
+        for listener in list(self.listeners):
+            listener(message)
+
+    def handle_command(self, message):
+        """Run one command and return the reply."""
+        command = message.get("command") if isinstance(message, dict) else None
+        if command not in COMMANDS:
+            return {"ok": False, "error": f"Unknown command: {command}"}
+        if command == "start":
+            self.start()
+        elif command == "pause":
+            self.timer.pause()
+            self.completion_job.cancel()
+            self.session_alert_job.restart()
+        elif command == "reset":
+            self.timer.reset()
+            self.completion_job.cancel()
+            self.session_alert_job.restart()
+        elif command == "adjust":
+            try:
+                minutes = int(message.get("minutes", 0))
+            except (TypeError, ValueError):
+                return {"ok": False, "error": "minutes must be an integer"}
+            self.timer.adjust(minutes)
+            self.schedule_completion()
+        return {"ok": True, "status": self.status()}
+
+    def start(self):
+        if self.timer.is_running:
+            return
+        self.timer.start()
+        self.session_alert_job.cancel()
+        self.schedule_completion()
+
+    def schedule_completion(self):
+        if self.timer.is_running:
+            self.completion_job.restart(self.timer.deadline - self.clock.monotonic())
+
+    def check_completion(self):
+        self.timer.tick()
+        self.schedule_completion()
+
+    def handle_completed(self, finished_type, next_type):
+        self.completion_job.cancel()
+        self.session_alert_job.restart()
+
+    def trigger_session_alert(self):
+        if not self.timer.is_running:
+            self.play(play_bell_sound)
+            self.broadcast("alert")
+
+    def handle_clock_jump(self, jump):
+        logging.info("Clock jump detected: %s", jump)
+        if jump.kind == "suspend":
+            self.timer.catch_up(jump.drift)
+            self.check_completion()
+
+    def play(self, melody):
+        """Play a sound without blocking the event loop, when there is one."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            melody()
+        else:
+            loop.run_in_executor(None, melody)
+
+
+async def handle_connection(daemon, reader, writer):
+    queue = None
+    try:
+        while line := await reader.readline():
+            try:
+                message = json.loads(line)
+            except ValueError:
+                reply = {"ok": False, "error": "Invalid JSON"}
+            else:
+                reply = daemon.handle_command(message)
+            writer.write(json.dumps(reply).encode() + b"\n")
+            await writer.drain()
+            if reply["ok"] and message.get("command") == "subscribe":
+                queue = asyncio.Queue()
+                daemon.listeners.append(queue.put_nowait)
+                break
+        if queue is not None:
+            await stream_events(queue, reader, writer)
+    except ConnectionError:
+        pass  # The client went away
+    finally:
+        if queue is not None:
+            daemon.listeners.remove(queue.put_nowait)
+        writer.close()
+
+
+async def stream_events(queue, reader, writer):
+    """Forward queued events to the client until it disconnects."""
+    disconnected = asyncio.ensure_future(reader.read())
+    try:
+        while True:
+            next_message = asyncio.ensure_future(queue.get())
+            await asyncio.wait(
+                {next_message, disconnected}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if disconnected.done():
+                next_message.cancel()
+                return
+            writer.write(json.dumps(next_message.result()).encode() + b"\n")
+            await writer.drain()
+    finally:
+        disconnected.cancel()
+
+
+async def serve(daemon, address=None):
+    """Start the control API server for daemon and return it."""
+    address = address or default_address()
+
+    async def handler(reader, writer):
+        await handle_connection(daemon, reader, writer)
+
+    if isinstance(address, tuple):
+        return await asyncio.start_server(handler, *address)
+    remove_stale_socket(address)
+    return await asyncio.start_unix_server(handler, address)
+
+
+def remove_stale_socket(address):
+    """
+    Remove the socket file left behind by a daemon that did not exit cleanly.
+    Raises OSError when a daemon still answers on it.
+    """
+    try:
+        connect(address, timeout=0.5).close()
+    except (ConnectionRefusedError, FileNotFoundError):
+        if os.path.exists(address):
+            os.remove(address)
+        return
+    raise OSError(f"A daemon is already listening on {address}")
+
+
+async def run(address=None):
+    ensure_db()
+    daemon = TimerDaemon(AsyncioClock())
+    metrics.setup(daemon.scheduler)
+    server = await serve(daemon, address)
+    logging.info("Daemon listening on %s", address or default_address())
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        daemon.events.shutdown()
+
+
+def connect(address=None, timeout=2.0):
+    address = address or default_address()
+    if isinstance(address, tuple):
+        return socket.create_connection(address, timeout=timeout)
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(timeout)
+    client.connect(address)
+    return client
+
+
+def send_command(message, address=None, timeout=2.0):
+    """Send one command to a running daemon and return its reply."""
+    with connect(address, timeout) as client:
+        client.sendall(json.dumps(message).encode() + b"\n")
+        return json.loads(client.makefile("rb").readline())
+
+
+def is_running(address=None):
+    """Whether a daemon answers on address."""
+    try:
+        return send_command({"command": "status"}, address, timeout=0.5)["ok"]
+    except (OSError, ValueError):
+        return False
+
+
+def gui_is_running():
+    """Whether the windowed app is running, it owns the database then."""
+    from single_instance import SingleInstance  # Qt is only needed for this check
+
+    return SingleInstance().forward(["--status"]) is not None
+
+
+def watch(address=None):
+    """Yield the daemon's events as they happen."""
+    with connect(address, timeout=None) as client:
+        client.sendall(b'{"command": "subscribe"}\n')
+        for line in client.makefile("rb"):
+            yield json.loads(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless xbitopomo timer")
+    parser.add_argument(
+        "command", nargs="?", default="serve", choices=("serve", "watch") + COMMANDS[:-1]
+    )
+    parser.add_argument("minutes", nargs="?", type=int, default=0)
+    parser.add_argument("--address", type=parse_address, default=None)
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        setup_logging()
+        if gui_is_running():
+            logging.error("xbitopomo is already running with a window, quit it to run headless")
+            return 1
+        try:
+            asyncio.run(run(args.address))
+        except KeyboardInterrupt:
+            pass
+        except OSError as e:
+            logging.error("Could not start the daemon: %s", e)
+            return 1
+        return 0
+    try:
+        if args.command == "watch":
+            for message in watch(args.address):
+                print(json.dumps(message))
+            return 0
+        reply = send_command({"command": args.command, "minutes": args.minutes}, args.address)
+    except OSError as e:
+        print(f"Could not reach the daemon: {e}", file=sys.stderr)
+        return 1
+    print(json.dumps(reply))
+    return 0 if reply["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
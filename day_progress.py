@@ -0,0 +1,62 @@
+"""
+How far the day has gone, between a configurable start and end time.
+
+The progress bar shows whole percents, so its value only changes 100 times a
+day. Instead of polling the clock, the app asks next_change() for the exact
+instant the value changes next and sleeps until then.
+"""
+
+from datetime import datetime, time, timedelta
+
+DEFAULT_DAY_START = time(5, 0)
+DEFAULT_DAY_END = time(23, 0)
+
+
+def minutes_to_time(minutes):
+    """A time of day from the minutes after midnight it is stored as in the settings."""
+    return time(minutes // 60, minutes % 60)
+
+
+def time_to_minutes(value):
+    return value.hour * 60 + value.minute
+
+
+class DayProgress:
+    """Whole percent of the day gone by: 0 before start, 100 after end."""
+
+    def __init__(self, start=DEFAULT_DAY_START, end=DEFAULT_DAY_END):
+        if end <= start:
+            raise ValueError(f"The day must end after it starts, got {start} - {end}")
+        self.start = start
+        self.end = end
+
+    def bounds(self, now):
+        """Start and end of the day that now falls in, as datetimes."""
+        return datetime.combine(now.date(), self.start), datetime.combine(now.date(), self.end)
+
+    def percent(self, now):
+        start, end = self.bounds(now)
+        if now <= start:
+            return 0
+        if now >= end:
+            return 100
+        # Integer microseconds, floats would put some boundaries a hair off
+        return _microseconds(now - start) * 100 // _microseconds(end - start)
+
+    def next_change(self, now):
+        """The first instant after now at which percent() returns another value."""
+        start, end = self.bounds(now)
+        if now >= end:
+            # Back to 0 at midnight
+            return datetime.combine(now.date() + timedelta(days=1), time(0, 0))
+        span = _microseconds(end - start)
+        next_percent = self.percent(now) + 1
+        # Ceiling division: the first microsecond that reaches next_percent
+        return start + timedelta(microseconds=-(-span * next_percent // 100))
+
+    def seconds_until_change(self, now):
+        return (self.next_change(now) - now).total_seconds()
+
+
+def _microseconds(delta):
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
@@ -1,8 +1,13 @@
 import sqlite3
 import sys
 import os
+import threading
+from array import array
 from datetime import datetime, timedelta, date
 
+from clock import get_clock
+from metrics import DB_LATENCY, timed
+
 # Register date adapter explicitly to fix Python 3.12 deprecation warning
 def adapt_date(val):
     return val.isoformat()
@@ -35,6 +40,100 @@ def get_conn():
         detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
     )
 
+# Seconds of Focus in a session row, 0 while it has not ended
+FOCUS_SECONDS_SQL = """
+    CASE WHEN {row}.end_time IS NULL THEN 0
+    ELSE CAST(ROUND((JULIANDAY({row}.end_time) - JULIANDAY({row}.start_time)) * 86400) AS INTEGER) END
+"""
+
+# daily_stats is derived from session_feedback: every write to a session adjusts its day
+DAILY_STATS_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS daily_stats_insert AFTER INSERT ON session_feedback
+    WHEN NEW.start_time IS NOT NULL
+    BEGIN
+        INSERT INTO daily_stats (day, sessions, focus_seconds)
+        VALUES (DATE(NEW.start_time), 1, {FOCUS_SECONDS_SQL.format(row="NEW")})
+        ON CONFLICT(day) DO UPDATE SET
+            sessions = sessions + 1, focus_seconds = focus_seconds + excluded.focus_seconds;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS daily_stats_update AFTER UPDATE ON session_feedback
+    BEGIN
+        UPDATE daily_stats
+        SET sessions = sessions - 1, focus_seconds = focus_seconds - {FOCUS_SECONDS_SQL.format(row="OLD")}
+        WHERE day = DATE(OLD.start_time);
+        INSERT INTO daily_stats (day, sessions, focus_seconds)
+        SELECT DATE(NEW.start_time), 1, {FOCUS_SECONDS_SQL.format(row="NEW")}
+        WHERE NEW.start_time IS NOT NULL
+        ON CONFLICT(day) DO UPDATE SET
+            sessions = sessions + 1, focus_seconds = focus_seconds + excluded.focus_seconds;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS daily_stats_delete AFTER DELETE ON session_feedback
+    BEGIN
+        UPDATE daily_stats
+        SET sessions = sessions - 1, focus_seconds = focus_seconds - {FOCUS_SECONDS_SQL.format(row="OLD")}
+        WHERE day = DATE(OLD.start_time);
+    END
+    """,
+]
+
+# From version 3 every session write also bumps session_write_version and stamps the
+# rows it touched with it, so readers can fetch only what changed since a version
+WRITE_VERSION_SQL = "(SELECT value FROM settings WHERE key = 'session_write_version')"
+BUMP_WRITE_VERSION_SQL = (
+    "UPDATE settings SET value = value + 1 WHERE key = 'session_write_version';"
+)
+SESSION_WRITE_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS daily_stats_insert AFTER INSERT ON session_feedback
+    WHEN NEW.start_time IS NOT NULL
+    BEGIN
+        {BUMP_WRITE_VERSION_SQL}
+        UPDATE session_feedback SET version = {WRITE_VERSION_SQL} WHERE rowid = NEW.rowid;
+        INSERT INTO daily_stats (day, sessions, focus_seconds, version)
+        VALUES (DATE(NEW.start_time), 1, {FOCUS_SECONDS_SQL.format(row="NEW")}, {WRITE_VERSION_SQL})
+        ON CONFLICT(day) DO UPDATE SET
+            sessions = sessions + 1,
+            focus_seconds = focus_seconds + excluded.focus_seconds,
+            version = excluded.version;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS daily_stats_update AFTER UPDATE OF start_time, end_time ON session_feedback
+    BEGIN
+        {BUMP_WRITE_VERSION_SQL}
+        UPDATE session_feedback SET version = {WRITE_VERSION_SQL} WHERE rowid = NEW.rowid;
+        UPDATE daily_stats
+        SET sessions = sessions - 1,
+            focus_seconds = focus_seconds - {FOCUS_SECONDS_SQL.format(row="OLD")},
+            version = {WRITE_VERSION_SQL}
+        WHERE day = DATE(OLD.start_time);
+        INSERT INTO daily_stats (day, sessions, focus_seconds, version)
+        SELECT DATE(NEW.start_time), 1, {FOCUS_SECONDS_SQL.format(row="NEW")}, {WRITE_VERSION_SQL}
+        WHERE NEW.start_time IS NOT NULL
+        ON CONFLICT(day) DO UPDATE SET
+            sessions = sessions + 1,
+            focus_seconds = focus_seconds + excluded.focus_seconds,
+            version = excluded.version;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS daily_stats_delete AFTER DELETE ON session_feedback
+    BEGIN
+        {BUMP_WRITE_VERSION_SQL}
+        UPDATE daily_stats
+        SET sessions = sessions - 1,
+            focus_seconds = focus_seconds - {FOCUS_SECONDS_SQL.format(row="OLD")},
+            version = {WRITE_VERSION_SQL}
+        WHERE day = DATE(OLD.start_time);
+    END
+    """,
+]
+
 def get_db_version():
     """Get the current database version"""
     conn = get_conn()
@@ -90,6 +189,50 @@ def run_migrations():
         conn.commit()
         conn.close()
 
+    if current_version < 2:
+        # Migration to version 2: per-day aggregates, kept up to date by triggers
+        conn = get_conn()
+        c = conn.cursor()
+        c.execute("""
+            CREATE TABLE IF NOT EXISTS daily_stats
+            (day TEXT PRIMARY KEY, sessions INTEGER NOT NULL, focus_seconds INTEGER NOT NULL)
+        """)
+        c.execute("DELETE FROM daily_stats")
+        c.execute(f"""
+            INSERT INTO daily_stats (day, sessions, focus_seconds)
+            SELECT DATE(start_time), COUNT(*), SUM({FOCUS_SECONDS_SQL.format(row="session_feedback")})
+            FROM session_feedback
+            WHERE start_time IS NOT NULL
+            GROUP BY DATE(start_time)
+        """)
+        for statement in DAILY_STATS_TRIGGERS:
+            c.execute(statement)
+        c.execute(
+            "INSERT OR REPLACE INTO settings (key, value) VALUES ('db_version', 2)"
+        )
+        conn.commit()
+        conn.close()
+
+    if current_version < 3:
+        # Migration to version 3: a high-water mark on session writes
+        conn = get_conn()
+        c = conn.cursor()
+        c.execute("ALTER TABLE session_feedback ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+        c.execute("ALTER TABLE daily_stats ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+        c.execute(
+            "INSERT OR REPLACE INTO settings (key, value) VALUES ('session_write_version', 0)"
+        )
+        for trigger in ("daily_stats_insert", "daily_stats_update", "daily_stats_delete"):
+            c.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        for statement in SESSION_WRITE_TRIGGERS:
+            c.execute(statement)
+        c.execute(
+            "INSERT OR REPLACE INTO settings (key, value) VALUES ('db_version', 3)"
+        )
+        conn.commit()
+        conn.close()
+
+@timed(DB_LATENCY)
 def init_db():
     """Initialize the database and run any pending migrations"""
     # Run migrations first
@@ -106,12 +249,34 @@ def init_db():
         """CREATE TABLE IF NOT EXISTS settings
                  (key TEXT PRIMARY KEY, value INTEGER)"""
     )
+    # The session history pages through sessions by start time
+    c.execute(
+        "CREATE INDEX IF NOT EXISTS session_feedback_start_time ON session_feedback (start_time)"
+    )
     conn.commit()
     conn.close()
 
+_db_ready = False
+_db_ready_lock = threading.Lock()  # The calendar also reads from its prefetch thread
+
+
+def ensure_db():
+    """Run init_db once per process. The app calls it from an idle task after the
+    first paint; data functions call it in case they run before that."""
+    global _db_ready
+    if _db_ready:
+        return
+    with _db_ready_lock:
+        if not _db_ready:
+            init_db()
+            _db_ready = True
+
+
+@timed(DB_LATENCY)
 def insert_pomodoro_session(start_time, end_time, _unused):
     if not start_time:
         return  # Do not proceed if start_time is not set
+    ensure_db()
     # Function to insert a session record into the database
     conn = get_conn()
     c = conn.cursor()
@@ -123,9 +288,11 @@ def insert_pomodoro_session(start_time, end_time, _unused):
     conn.close()
 
 
+@timed(DB_LATENCY)
 def update_pomodoro_session(start_time, end_time, _unused):
     if not start_time:
         return  # Do not proceed if start_time is not set
+    ensure_db()
     # Function to update a session record in the database
     conn = get_conn()
     c = conn.cursor()
@@ -137,29 +304,16 @@ def update_pomodoro_session(start_time, end_time, _unused):
     conn.close()
 
 
-def fetch_last_10_report_sessions():
-    # Function to fetch the last 10 sessions from the database
-    conn = get_conn()
-    conn.row_factory = sqlite3.Row  # This allows us to access columns by name
-    c = conn.cursor()
-    c.execute(
-        "SELECT * FROM session_feedback WHERE end_time is not null ORDER BY start_time DESC LIMIT 10"
-    )
-    rows = c.fetchall()
-    conn.close()
-    # Convert rows to a list of dictionaries
-    sessions = [dict(row) for row in rows]
-    return sessions
-
-
+@timed(DB_LATENCY)
 def fetch_focus_summary():
     """
     Fetches a summary of Focus activity for the last week, yesterday, and today.
     """
+    ensure_db()
     conn = get_conn()
     cursor = conn.cursor()
 
-    today = datetime.now().date()
+    today = get_clock().today()
     yesterday = today - timedelta(days=1)
     week_ago = today - timedelta(days=7)
 
@@ -204,7 +358,9 @@ def fetch_focus_summary():
     return {"week_avg": week_avg, "yesterday": yesterday_total, "today": today_total}
 
 
+@timed(DB_LATENCY)
 def save_setting(key, value):
+    ensure_db()
     conn = get_conn()
     c = conn.cursor()
     c.execute(
@@ -215,15 +371,37 @@ def save_setting(key, value):
 
 
 def get_setting(key, default_value):
+    return get_settings({key: default_value})[key]
+
+
+@timed(DB_LATENCY)
+def get_settings(defaults):
+    """
+    Read several settings with a single query.
+
+    Takes a dict of {key: default_value} and returns a dict with the stored values.
+    This does not wait for migrations: before the first init_db there are no
+    settings yet, so the defaults are returned.
+    """
+    settings = dict(defaults)
     conn = get_conn()
     c = conn.cursor()
-    c.execute("SELECT value FROM settings WHERE key = ?", (key,))
-    result = c.fetchone()
-    conn.close()
-    return result[0] if result else default_value
+    try:
+        c.execute(
+            f"SELECT key, value FROM settings WHERE key IN ({','.join('?' * len(defaults))})",
+            list(defaults),
+        )
+        settings.update(c.fetchall())
+    except sqlite3.OperationalError:
+        pass  # The settings table does not exist yet
+    finally:
+        conn.close()
+    return settings
 
 
+@timed(DB_LATENCY)
 def delete_setting(key):
+    ensure_db()
     conn = get_conn()
     c = conn.cursor()
     c.execute("DELETE FROM settings WHERE key = ?", (key,))
@@ -231,35 +409,186 @@ def delete_setting(key):
     conn.close()
 
 
-def fetch_yearly_daily_session_counts():
+def _fetch_daily_stat(column, start_date, end_date):
+    """One daily_stats column for each day from start_date to end_date (inclusive), as an array."""
+    ensure_db()
+    conn = get_conn()
+    c = conn.cursor()
+    values = array("q", [0] * ((end_date - start_date).days + 1))
+    c.execute(
+        f"SELECT day, {column} FROM daily_stats WHERE day BETWEEN ? AND ? AND {column} > 0",
+        (start_date.isoformat(), end_date.isoformat()),
+    )
+    for day, value in c.fetchall():
+        values[(date.fromisoformat(day) - start_date).days] = value
+    conn.close()
+    return values
+
+
+@timed(DB_LATENCY)
+def fetch_daily_session_counts(start_date, end_date):
+    """
+    Returns an array with the number of sessions started on each day from
+    start_date to end_date (inclusive), one entry per day.
+    """
+    return _fetch_daily_stat("sessions", start_date, end_date)
+
+
+@timed(DB_LATENCY)
+def fetch_daily_focus_seconds(start_date, end_date):
     """
-    Returns a dictionary of { date_string (YYYY-MM-DD): session_count }
-    for each day in the last 365 days.
+    Returns an array with the seconds of Focus completed on each day from
+    start_date to end_date (inclusive), one entry per day.
     """
+    return _fetch_daily_stat("focus_seconds", start_date, end_date)
+
+
+@timed(DB_LATENCY)
+def fetch_first_session_date():
+    """The day of the first recorded session, or None when there is none."""
+    ensure_db()
     conn = get_conn()
     c = conn.cursor()
+    c.execute("SELECT MIN(day) FROM daily_stats WHERE sessions > 0")
+    first_day = c.fetchone()[0]
+    conn.close()
+    return date.fromisoformat(first_day) if first_day else None
 
-    # Prepare a dict for all days in the last year, initialized with 0
-    from datetime import datetime, timedelta
 
-    today = datetime.now().date()
-    daily_counts = {}
-    for i in range(365):
-        day = today - timedelta(days=i)
-        daily_counts[day.strftime("%Y-%m-%d")] = 0
+# Columns the session history can be sorted by
+SESSION_SORT_COLUMNS = {
+    "start_time": "start_time",
+    "end_time": "end_time",
+    "duration": FOCUS_SECONDS_SQL.format(row="session_feedback"),
+}
 
-    # Count sessions per day
+
+@timed(DB_LATENCY)
+def fetch_sessions_page(after=None, limit=200, sort="start_time", descending=True, prefix=""):
+    """
+    Returns one page of completed sessions as (rowid, start_time, end_time, focus_seconds)
+    tuples, sorted by the sort column and then by rowid.
+
+    Pages use keyset pagination: after is (sort value, rowid) of the last row of the
+    previous page, so every page costs an index seek however deep it is. prefix keeps
+    only the sessions whose start time starts with it, e.g. "2024-07".
+    """
+    column = SESSION_SORT_COLUMNS[sort]
+    direction = "DESC" if descending else "ASC"
+    conditions = ["end_time IS NOT NULL"]
+    parameters = []
+    if prefix:
+        # A range rather than LIKE, so the start_time index is used
+        conditions.append("start_time >= ? AND start_time < ?")
+        parameters += [prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)]
+    if after is not None:
+        conditions.append(f"({column}, rowid) {'<' if descending else '>'} (?, ?)")
+        parameters.extend(after)
+    ensure_db()
+    conn = get_conn()
+    c = conn.cursor()
     c.execute(
-        """
-        SELECT DATE(start_time) as sdate, COUNT(*) as cnt
+        f"""
+        SELECT rowid, start_time, end_time, {SESSION_SORT_COLUMNS["duration"]}
         FROM session_feedback
-        WHERE DATE(start_time) >= DATE('now', '-365 day')
-        GROUP BY DATE(start_time)
-        """
+        WHERE {" AND ".join(conditions)}
+        ORDER BY {column} {direction}, rowid {direction}
+        LIMIT ?
+        """,
+        parameters + [limit],
     )
-    for row in c.fetchall():
-        if row[0] in daily_counts:
-            daily_counts[row[0]] = row[1]
+    rows = c.fetchall()
+    conn.close()
+    return rows
+
+
+@timed(DB_LATENCY)
+def fetch_session_write_version():
+    """The number of session writes so far, it grows with every insert, update and delete."""
+    ensure_db()
+    conn = get_conn()
+    c = conn.cursor()
+    c.execute(f"SELECT {WRITE_VERSION_SQL}")
+    version = c.fetchone()[0] or 0
+    conn.close()
+    return version
+
 
+@timed(DB_LATENCY)
+def fetch_daily_stats_since(version):
+    """(day, sessions, focus_seconds) of every day whose sessions changed after version."""
+    ensure_db()
+    conn = get_conn()
+    c = conn.cursor()
+    c.execute(
+        "SELECT day, sessions, focus_seconds FROM daily_stats WHERE version > ? ORDER BY day",
+        (version,),
+    )
+    rows = [(date.fromisoformat(day), sessions, focus_seconds) for day, sessions, focus_seconds in c.fetchall()]
+    conn.close()
+    return rows
+
+
+@timed(DB_LATENCY)
+def count_completed_sessions():
+    ensure_db()
+    conn = get_conn()
+    c = conn.cursor()
+    c.execute("SELECT COUNT(*) FROM session_feedback WHERE end_time IS NOT NULL")
+    count = c.fetchone()[0]
+    conn.close()
+    return count
+
+
+def iter_completed_sessions(batch_size=500):
+    """
+    Yields every completed session as (start_time, end_time, focus_seconds), oldest
+    first, reading batch_size rows at a time so the history is never all in memory.
+    """
+    ensure_db()
+    conn = get_conn()
+    try:
+        c = conn.cursor()
+        c.execute(
+            f"""
+            SELECT start_time, end_time, {SESSION_SORT_COLUMNS["duration"]}
+            FROM session_feedback
+            WHERE end_time IS NOT NULL
+            ORDER BY start_time, rowid
+            """
+        )
+        while True:
+            rows = c.fetchmany(batch_size)
+            if not rows:
+                break
+            yield from rows
+    finally:
+        conn.close()
+
+
+@timed(DB_LATENCY)
+def fetch_session_epochs():
+    """
+    Every session, oldest first, as two parallel arrays: start times in seconds since
+    1970-01-01 in local time (so // 86400 gives the local day), and Focus seconds,
+    -1 for sessions that never ended.
+    """
+    ensure_db()
+    conn = get_conn()
+    c = conn.cursor()
+    c.execute(
+        f"""
+        SELECT CAST(strftime('%s', start_time) AS INTEGER),
+               CASE WHEN end_time IS NULL THEN -1
+               ELSE MAX(0, {FOCUS_SECONDS_SQL.format(row="session_feedback")}) END
+        FROM session_feedback
+        WHERE start_time IS NOT NULL
+        ORDER BY start_time
+        """
+    )
+    starts, focus_seconds = array("q"), array("q")
+    for start, seconds in c.fetchall():
+        starts.append(start)
+        focus_seconds.append(seconds)
     conn.close()
-    return daily_counts
+    return starts, focus_seconds
@@ -0,0 +1,171 @@
+"""
+Structured logging and diagnostics.
+
+setup_logging() sends log records to:
+- a fixed-size in-memory ring buffer, kept unformatted so a record costs
+  little more than appending it to a deque,
+- a rotating log file written by a background thread, so the GUI thread never
+  waits on disk,
+- stderr, when there is one (the windowed build has none).
+
+The level comes from the XBITO_LOG_LEVEL environment variable (INFO by
+default). Below that level logging calls return right away.
+
+log() writes key-value records: log(logging.INFO, "session_alert_reset",
+delay=600) is rendered as "session_alert_reset delay=600". dump_diagnostics()
+writes the ring buffer and a snapshot of the app state to a file, for bug
+reports.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import platform
+import queue
+import sys
+from collections import deque
+
+from clock import get_clock
+from db import get_app_path
+
+LEVEL_ENV_VAR = "XBITO_LOG_LEVEL"
+RING_BUFFER_SIZE = 2000
+LOG_FILE_NAME = "xbitopomo.log"
+LOG_FILE_MAX_BYTES = 1024 * 1024
+LOG_FILE_BACKUPS = 3
+
+_ring_buffer = None
+_listener = None
+
+
+def _keep_arguments(record):
+    """
+    Leave the message unformatted, it is only %-formatted when a line is written
+    or read. Tuple arguments are already immutable; a mapping is copied.
+    """
+    if isinstance(record.args, dict):
+        record.args = dict(record.args)
+
+
+class RingBufferHandler(logging.Handler):
+    """Keeps the last capacity records in memory, only formatting them into lines when read."""
+
+    def __init__(self, capacity=RING_BUFFER_SIZE):
+        super().__init__()
+        self.records = deque(maxlen=capacity)
+
+    def emit(self, record):
+        _keep_arguments(record)
+        self.records.append(record)
+
+    def lines(self):
+        return [self.format(record) for record in list(self.records)]
+
+
+class BackgroundQueueHandler(logging.handlers.QueueHandler):
+    """Hands records to the file writer thread, which formats them."""
+
+    def prepare(self, record):
+        _keep_arguments(record)
+        return record
+
+
+class KeyValueFormatter(logging.Formatter):
+    """Renders a record as "time level logger message key=value ..."."""
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s %(name)s %(message)s")
+
+    def format(self, record):
+        text = super().format(record)
+        fields = getattr(record, "fields", None)
+        if fields:
+            text += " " + " ".join(f"{key}={value!r}" for key, value in fields.items())
+        return text
+
+
+def log(level, event, **fields):
+    """Log an event with key-value fields. Costs a level check when the level is disabled."""
+    logger = logging.getLogger()
+    if logger.isEnabledFor(level):
+        logger.log(level, event, extra={"fields": fields}, stacklevel=2)
+
+
+def configured_level():
+    name = os.environ.get(LEVEL_ENV_VAR, "INFO").upper()
+    level = logging.getLevelName(name)
+    return level if isinstance(level, int) else logging.INFO
+
+
+def setup_logging(log_dir=None, level=None):
+    """Install the ring buffer, the background file writer and the console handler."""
+    global _ring_buffer, _listener
+    if _ring_buffer is not None:
+        return _ring_buffer  # Already set up
+    level = configured_level() if level is None else level
+    formatter = KeyValueFormatter()
+    root = logging.getLogger()
+    root.setLevel(level)
+
+    _ring_buffer = RingBufferHandler()
+    _ring_buffer.setFormatter(formatter)
+    root.addHandler(_ring_buffer)
+
+    log_path = os.path.join(log_dir or get_app_path(), LOG_FILE_NAME)
+    try:
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_path, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUPS, delay=True
+        )
+    except OSError as e:
+        logging.error("Cannot write the log file %s: %s", log_path, e)
+    else:
+        file_handler.setFormatter(formatter)
+        records = queue.SimpleQueue()
+        root.addHandler(BackgroundQueueHandler(records))
+        _listener = logging.handlers.QueueListener(records, file_handler)
+        _listener.start()
+        atexit.register(stop_logging)
+
+    if sys.stderr is not None:
+        console = logging.StreamHandler()
+        console.setFormatter(formatter)
+        root.addHandler(console)
+    return _ring_buffer
+
+
+def stop_logging():
+    """Flush the records still queued for the log file."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def recent_lines():
+    """The records in the ring buffer, oldest first."""
+    return _ring_buffer.lines() if _ring_buffer is not None else []
+
+
+def dump_diagnostics(path, sections=None):
+    """
+    Write environment details, the given sections ({title: text}) and the
+    recent log records to path. Returns the path.
+    """
+    from PySide6 import __version__ as pyside_version
+
+    lines = [
+        f"Generated: {get_clock().now().isoformat()}",
+        f"Python: {sys.version.split()[0]} ({platform.platform()})",
+        f"PySide6: {pyside_version}",
+        f"Frozen: {getattr(sys, 'frozen', False)}",
+        f"Log level: {logging.getLevelName(logging.getLogger().level)}",
+        "",
+    ]
+    for title, text in (sections or {}).items():
+        lines += [f"== {title} ==", str(text), ""]
+    lines.append("== Recent log ==")
+    lines += recent_lines()
+    with open(path, "w", encoding="utf-8") as dump_file:
+        dump_file.write("\n".join(lines) + "\n")
+    return path
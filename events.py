@@ -0,0 +1,298 @@
+"""
+In-process event bus for the session lifecycle.
+
+The timer publishes what happens (a session started, was paused, completed,
+...) and side effects such as persistence and sounds subscribe to it. Threaded
+subscribers run on a small worker pool, so a slow consumer never delays the
+timer or the GUI. Events reach each subscriber in the order they were
+published, and every subscriber has its own latency statistics.
+
+Integrations are plain modules with a register(bus) function. Besides the
+built-in ones in subscribers.py, modules listed in XBITO_PLUGINS (comma
+separated) are imported and registered by load_plugins().
+"""
+
+import importlib
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from timer_core import FOCUS
+
+SESSION_STARTED = "session_started"
+PAUSED = "paused"
+RESUMED = "resumed"
+ADJUSTED = "adjusted"
+COMPLETED = "completed"
+BREAK_STARTED = "break_started"
+DAY_ROLLED_OVER = "day_rolled_over"
+EVENTS = (SESSION_STARTED, PAUSED, RESUMED, ADJUSTED, COMPLETED, BREAK_STARTED, DAY_ROLLED_OVER)
+
+PLUGINS_ENV_VAR = "XBITO_PLUGINS"
+
+
+class Event:
+    """An event name with its data, stamped with the time it was published."""
+
+    def __init__(self, name, data):
+        self.name = name
+        self.data = data
+        self.published_at = time.perf_counter()
+
+    def __repr__(self):
+        return f"<Event {self.name} {self.data}>"
+
+
+class SubscriberStats:
+    """
+    Latency accounting for one subscriber.
+
+    wait is the time an event spent queued before the subscriber got to it,
+    run the time the subscriber took to handle it. Both are in seconds.
+    """
+
+    def __init__(self):
+        self.delivered = 0
+        self.errors = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_run = 0.0
+        self.max_run = 0.0
+
+    def record(self, wait, run):
+        self.delivered += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self.total_run += run
+        self.max_run = max(self.max_run, run)
+
+    @property
+    def mean_wait(self):
+        return self.total_wait / self.delivered if self.delivered else 0.0
+
+    @property
+    def mean_run(self):
+        return self.total_run / self.delivered if self.delivered else 0.0
+
+    def as_dict(self):
+        return {
+            "delivered": self.delivered,
+            "errors": self.errors,
+            "mean_wait_ms": self.mean_wait * 1000,
+            "max_wait_ms": self.max_wait * 1000,
+            "mean_run_ms": self.mean_run * 1000,
+            "max_run_ms": self.max_run * 1000,
+        }
+
+
+class Subscription:
+    """A callback subscribed to some events, with its own queue and stats."""
+
+    def __init__(self, bus, callback, events, name, threaded):
+        self.bus = bus
+        self.callback = callback
+        self.events = frozenset(events) if events else None  # None means every event
+        self.name = name or getattr(callback, "__qualname__", repr(callback))
+        self.threaded = threaded
+        self.stats = SubscriberStats()
+        self.pending = deque()
+        self.draining = False  # A worker is handling this subscription's queue
+
+    def wants(self, event_name):
+        return self.events is None or event_name in self.events
+
+    def cancel(self):
+        self.bus.unsubscribe(self)
+
+    def __repr__(self):
+        return f"<Subscription {self.name}>"
+
+
+class EventBus:
+    """
+    Delivers published events to subscribers.
+
+    Threaded subscribers are called on the worker pool, one event at a time
+    per subscriber. The others are called right away in the publishing thread,
+    which is what GUI code needs.
+    """
+
+    def __init__(self, max_workers=2):
+        self.max_workers = max_workers
+        self._subscriptions = []
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._in_flight = 0  # Events queued or running on the worker pool
+        self._executor = None  # Started on the first threaded delivery
+
+    def subscribe(self, callback, events=None, name=None, threaded=True):
+        """Call callback(event) for the given event names, or for all events."""
+        subscription = Subscription(self, callback, events, name, threaded)
+        with self._lock:
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def subscriptions(self):
+        with self._lock:
+            return list(self._subscriptions)
+
+    def publish(self, name, **data):
+        """Publish an event. Returns once inline subscribers are done, never waits for threaded ones."""
+        event = Event(name, data)
+        for subscription in self.subscriptions():
+            if not subscription.wants(name):
+                continue
+            if subscription.threaded:
+                self._enqueue(subscription, event)
+            else:
+                self._deliver(subscription, event)
+        return event
+
+    def _enqueue(self, subscription, event):
+        with self._lock:
+            subscription.pending.append(event)
+            self._in_flight += 1
+            if subscription.draining:
+                return  # The worker already draining this queue will get to it
+            subscription.draining = True
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="events")
+            executor = self._executor
+        executor.submit(self._drain, subscription)
+
+    def _drain(self, subscription):
+        while True:
+            with self._lock:
+                if not subscription.pending:
+                    subscription.draining = False
+                    return
+                event = subscription.pending.popleft()
+            try:
+                self._deliver(subscription, event)
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+                    if self._in_flight == 0:
+                        self._idle.notify_all()
+
+    def _deliver(self, subscription, event):
+        started = time.perf_counter()
+        try:
+            subscription.callback(event)
+        except Exception as e:
+            subscription.stats.errors += 1
+            logging.error("Subscriber %s failed on %s: %s", subscription.name, event.name, e)
+        finished = time.perf_counter()
+        subscription.stats.record(started - event.published_at, finished - started)
+
+    def flush(self, timeout=None):
+        """Wait until threaded subscribers have handled every event. Returns False on timeout."""
+        with self._lock:
+            return self._idle.wait_for(lambda: self._in_flight == 0, timeout)
+
+    def stats(self):
+        """Latency statistics of every subscriber, by name."""
+        return {subscription.name: subscription.stats for subscription in self.subscriptions()}
+
+    def shutdown(self, wait=True):
+        """Stop the worker pool, by default after the queued events were handled."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+class TimerPublisher:
+    """
+    Publishes the lifecycle events of a PomodoroTimer on an EventBus.
+
+    The state machine only knows about starts and stops; this tells new
+    sessions from resumed ones and Focus sessions from breaks, and keeps the
+    wall-clock start time that persistence needs.
+    """
+
+    def __init__(self, bus, timer, clock):
+        self.bus = bus
+        self.timer = timer
+        self.clock = clock
+        self.start_time = None  # Wall-clock start of the current session
+        self.paused = False
+        timer.on("started", self.on_started)
+        timer.on("paused", self.on_paused)
+        timer.on("reset", self.on_reset)
+        timer.on("adjusted", self.on_adjusted)
+        timer.on("completed", self.on_completed)
+        timer.on("day_reset", self.on_day_reset)
+
+    def now(self):
+        return self.clock.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    def on_started(self, session_type):
+        if self.paused:
+            self.paused = False
+            self.bus.publish(
+                RESUMED, session_type=session_type, remaining=self.timer.remaining_seconds
+            )
+            return
+        self.start_time = self.now()
+        name = SESSION_STARTED if session_type == FOCUS else BREAK_STARTED
+        self.bus.publish(
+            name,
+            session_type=session_type,
+            start_time=self.start_time,
+            duration=self.timer.remaining_seconds,
+        )
+
+    def on_paused(self, remaining):
+        self.paused = True
+        self.bus.publish(PAUSED, session_type=self.timer.session_type, remaining=remaining)
+
+    def on_reset(self):
+        # The next start is a new session, the abandoned one stays open in the database
+        self.paused = False
+        self.start_time = None
+
+    def on_adjusted(self, remaining):
+        self.bus.publish(ADJUSTED, session_type=self.timer.session_type, remaining=remaining)
+
+    def on_completed(self, finished_type, next_type):
+        self.paused = False
+        self.bus.publish(
+            COMPLETED,
+            finished_type=finished_type,
+            next_type=next_type,
+            start_time=self.start_time,
+            end_time=self.now(),
+            completed_sessions=self.timer.completed_sessions,
+        )
+        self.start_time = None
+
+    def on_day_reset(self):
+        self.bus.publish(DAY_ROLLED_OVER, date=self.clock.today().isoformat())
+
+
+def load_plugins(bus, modules=None):
+    """
+    Import integration modules and call their register(bus).
+
+    By default the modules are read from the XBITO_PLUGINS environment
+    variable. A plugin that fails to load is logged and skipped.
+    """
+    if modules is None:
+        modules = [name.strip() for name in os.environ.get(PLUGINS_ENV_VAR, "").split(",")]
+    loaded = []
+    for module_name in filter(None, modules):
+        try:
+            importlib.import_module(module_name).register(bus)
+            loaded.append(module_name)
+        except Exception as e:
+            logging.error("Could not load plugin %s: %s", module_name, e)
+    return loaded
@@ -0,0 +1,280 @@
+from datetime import date, timedelta
+
+from PySide6.QtWidgets import QWidget, QToolTip
+from PySide6.QtGui import QPainter, QColor, QImage, QPixmap
+from PySide6.QtCore import Qt, QEvent, QRect, QSize, Signal
+
+from activity_pyramid import ActivityPyramid, DAY, WEEK, MONTH, LEVELS
+from metrics import PAINT_TIME, timed
+
+CELL_SIZE = 10
+CELL_GAP = 2
+MONTH_CELL_WIDTH = 3 * CELL_SIZE + 2 * CELL_GAP  # Month cells are wider, there are only 12 a year
+LEFT_MARGIN = 30  # Room for the day names or the years
+TOP_MARGIN = 16  # Room for the month names
+DAY_LABELS = {0: "Mon", 2: "Wed", 4: "Fri"}
+SHADES = 5
+# Sessions in a cell that get the darkest shade, per zoom level
+DARKEST_COUNT = {DAY: 5, WEEK: 25, MONTH: 100}
+
+
+# Shade 0 is never painted, shade 5 is DARKEST_COUNT sessions or more
+SHADE_COLORS = [QColor(0, 200, 0, shade * 40) for shade in range(SHADES + 1)]
+
+
+class HeatmapGrid:
+    """
+    The geometry and the painting of one level of a pyramid, without a widget,
+    so a heatmap can also be painted into an image on a worker thread.
+    """
+
+    def __init__(self, pyramid, level):
+        self.pyramid = pyramid
+        self.level = level
+
+    def weeks(self):
+        return (len(self.pyramid.days) + 6) // 7 if self.pyramid else 0
+
+    def grid_size(self):
+        """(columns, rows) of the level."""
+        if self.pyramid is None:
+            return 0, 0
+        if self.level == DAY:
+            return self.weeks(), 7
+        return self.pyramid.columns(self.level), len(self.pyramid.years(self.level))
+
+    def cell_width(self):
+        return MONTH_CELL_WIDTH if self.level == MONTH else CELL_SIZE
+
+    def size(self):
+        columns, rows = self.grid_size()
+        return QSize(
+            LEFT_MARGIN + columns * (self.cell_width() + CELL_GAP),
+            TOP_MARGIN + rows * (CELL_SIZE + CELL_GAP),
+        )
+
+    def cell_index(self, column, row):
+        if self.level == DAY:
+            return column * 7 + row
+        return row * self.pyramid.columns(self.level) + column
+
+    def cell_rect(self, index):
+        if self.level == DAY:
+            column, row = divmod(index, 7)
+        else:
+            row, column = divmod(index, self.pyramid.columns(self.level))
+        return QRect(
+            LEFT_MARGIN + column * (self.cell_width() + CELL_GAP),
+            TOP_MARGIN + row * (CELL_SIZE + CELL_GAP),
+            self.cell_width(),
+            CELL_SIZE,
+        )
+
+    def shade_index(self, count):
+        return min(SHADES, -(-count * SHADES // DARKEST_COUNT[self.level]))
+
+    def draw_row_label(self, painter, row, text):
+        y = TOP_MARGIN + row * (CELL_SIZE + CELL_GAP) - 2
+        painter.drawText(QRect(0, y, LEFT_MARGIN - 4, CELL_SIZE + 4), Qt.AlignLeft | Qt.AlignVCenter, text)
+
+    def draw_column_label(self, painter, column, text):
+        x = LEFT_MARGIN + column * (self.cell_width() + CELL_GAP)
+        painter.drawText(QRect(x, 0, 4 * CELL_SIZE, TOP_MARGIN), Qt.AlignLeft | Qt.AlignVCenter, text)
+
+    def render(self, painter, text_color):
+        if self.pyramid is None:
+            return
+        painter.setPen(text_color)
+        if self.level == DAY:
+            for weekday, name in DAY_LABELS.items():
+                self.draw_row_label(painter, weekday, name)
+            last_month_shown = None
+            for week in range(self.weeks()):
+                monday = self.pyramid.start + timedelta(weeks=week)
+                if monday.month != last_month_shown:
+                    label = monday.strftime("%b") if monday.month != 1 else monday.strftime("%Y")
+                    self.draw_column_label(painter, week, label)
+                    last_month_shown = monday.month
+        else:
+            for row, year in enumerate(self.pyramid.years(self.level)):
+                self.draw_row_label(painter, row, str(year))
+            for month in range(1, 13):
+                first = date(2001, month, 1)  # 2001 starts on a Monday, so its weeks line up with months
+                column = first.isocalendar()[1] - 1 if self.level == WEEK else month - 1
+                self.draw_column_label(painter, column, first.strftime("%b"))
+        # One drawRects call per shade rather than one fill per cell
+        cells_by_shade = [[] for _ in SHADE_COLORS]
+        for index, count in enumerate(self.pyramid.counts(self.level)):
+            if count > 0:
+                cells_by_shade[self.shade_index(count)].append(self.cell_rect(index))
+        painter.setPen(Qt.NoPen)
+        for shade, cells in zip(SHADE_COLORS, cells_by_shade):
+            if cells:
+                painter.setBrush(shade)
+                painter.drawRects(cells)
+
+
+def render_heatmap(pyramid, level, text_color, dpr=1.0):
+    """A level of pyramid painted into a QImage, safe to call off the GUI thread."""
+    grid = HeatmapGrid(pyramid, level)
+    size = grid.size()
+    image = QImage(int(size.width() * dpr), int(size.height() * dpr), QImage.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(dpr)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    grid.render(painter, text_color)
+    painter.end()
+    return image
+
+
+class HeatmapWidget(QWidget):
+    """
+    A contributions graph at three zoom levels.
+
+    DAY shows one cell per day, a column per week with Monday on top. WEEK and
+    MONTH show a row per year, with a cell per week or month. Every level is
+    read from an ActivityPyramid, so zooming never recounts the sessions.
+
+    Each level is painted into a pixmap once per data, size and device pixel
+    ratio, so repaints, scrolling and switching back to a level are a single
+    blit. Tooltips are found by hit-testing the mouse position against the
+    grid instead of having a widget per cell. Ctrl+wheel zooms.
+    """
+
+    levelChanged = Signal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pyramid = None
+        self.level = DAY
+        self.rendered = {}  # level -> ((width, height, dpr), pixmap)
+
+    def set_pyramid(self, pyramid):
+        self.pyramid = pyramid
+        self.invalidate()
+
+    def set_counts(self, start_date, counts):
+        """
+        Show counts (sessions per day, one per day from start_date). The grid starts on
+        the Monday on or before start_date.
+        """
+        end_date = start_date + timedelta(days=len(counts) - 1)
+        self.set_pyramid(ActivityPyramid.from_daily_counts(start_date, end_date, counts))
+
+    def invalidate(self):
+        """Call after changing the pyramid, the levels are painted again when shown."""
+        self.rendered.clear()
+        self.fit_contents()
+
+    def set_level(self, level):
+        if level == self.level:
+            return
+        self.level = level
+        self.fit_contents()
+        self.levelChanged.emit(level)
+
+    def fit_contents(self):
+        """Take the size of the current level, also when shown in a scroll area"""
+        self.updateGeometry()
+        self.resize(self.sizeHint())
+        self.update()
+
+    @property
+    def start_date(self):
+        return self.pyramid.start if self.pyramid else None
+
+    @property
+    def counts(self):
+        return self.pyramid.counts(self.level) if self.pyramid else []
+
+    def grid(self):
+        return HeatmapGrid(self.pyramid, self.level)
+
+    def weeks(self):
+        return self.grid().weeks()
+
+    def grid_size(self):
+        """(columns, rows) of the current level."""
+        return self.grid().grid_size()
+
+    def cell_width(self):
+        return self.grid().cell_width()
+
+    def sizeHint(self):
+        return self.grid().size()
+
+    def minimumSizeHint(self):
+        return self.sizeHint()
+
+    def cell_index(self, column, row):
+        return self.grid().cell_index(column, row)
+
+    def cell_rect(self, index):
+        return self.grid().cell_rect(index)
+
+    def index_at(self, pos):
+        """The index of the cell under pos in the current level, or None."""
+        column, x = divmod(pos.x() - LEFT_MARGIN, self.cell_width() + CELL_GAP)
+        row, y = divmod(pos.y() - TOP_MARGIN, CELL_SIZE + CELL_GAP)
+        columns, rows = self.grid_size()
+        if not (0 <= column < columns and 0 <= row < rows):
+            return None  # Outside the grid
+        if x >= self.cell_width() or y >= CELL_SIZE:
+            return None  # In a gap
+        index = self.cell_index(column, row)
+        return index if self.pyramid.exists(self.level, index) else None
+
+    def tooltip_text(self, index):
+        count = self.counts[index]
+        first, last = self.pyramid.period(self.level, index)
+        if self.level == DAY:
+            return f"{first.strftime('%B %d')}: {count}"
+        if self.level == WEEK:
+            year, week, _ = first.isocalendar()
+            days = f"{first.strftime('%b %d')} - {last.strftime('%b %d')}"
+            return f"Week {week} {year} ({days}): {count}"
+        return f"{first.strftime('%B %Y')}: {count}"
+
+    def event(self, event):
+        if event.type() == QEvent.ToolTip:
+            index = self.index_at(event.pos())
+            if index is None:
+                QToolTip.hideText()
+                event.ignore()
+            else:
+                QToolTip.showText(event.globalPos(), self.tooltip_text(index), self, self.cell_rect(index))
+            return True
+        return super().event(event)
+
+    def wheelEvent(self, event):
+        if not event.modifiers() & Qt.ControlModifier:
+            super().wheelEvent(event)  # Let a scroll area pan
+            return
+        step = -1 if event.angleDelta().y() > 0 else 1  # Up zooms in, towards days
+        position = LEVELS.index(self.level) + step
+        if 0 <= position < len(LEVELS):
+            self.set_level(LEVELS[position])
+        event.accept()
+
+    def rendered_pixmap(self):
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr)
+        cached = self.rendered.get(self.level)
+        if cached is None or cached[0] != key:
+            pixmap = QPixmap(self.size() * dpr)
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            self.render_graph(painter)
+            painter.end()
+            cached = self.rendered[self.level] = (key, pixmap)
+        return cached[1]
+
+    def render_graph(self, painter):
+        self.grid().render(painter, self.palette().windowText().color())
+
+    @timed(PAINT_TIME, widget="HeatmapWidget")
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self.rendered_pixmap())
+        painter.end()
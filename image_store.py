@@ -0,0 +1,56 @@
+"""
+Process-wide store of decoded and scaled images.
+
+Every widget asks the store instead of decoding files itself, so an image is
+decoded once per process however many widgets show it (a new TreeWidget is
+built every day). Entries are keyed by path, pixel size and device pixel
+ratio, decoded on first use and dropped least recently used first once there
+are more than max_entries.
+
+QPixmap is only usable from the GUI thread, and so is this store.
+"""
+
+import logging
+from collections import OrderedDict
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QPixmap
+
+max_entries = 32
+_pixmaps = OrderedDict()  # (path, width, height, dpr) -> QPixmap, least recently used first
+_stats = {"hits": 0, "misses": 0}
+
+
+def pixmap(path, width=None, height=None, dpr=1.0):
+    """
+    The image at path, decoded, or smooth-scaled to fit width x height pixels
+    (keeping its aspect ratio) and tagged with the device pixel ratio dpr.
+    """
+    key = (path, width, height, dpr)
+    cached = _pixmaps.get(key)
+    if cached is not None:
+        _pixmaps.move_to_end(key)
+        _stats["hits"] += 1
+        return cached
+    _stats["misses"] += 1
+    if width is None:
+        result = QPixmap(path)
+        if result.isNull():
+            logging.error("Failed to load image: %s", path)
+    else:
+        result = pixmap(path).scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        result.setDevicePixelRatio(dpr)
+    _pixmaps[key] = result
+    while len(_pixmaps) > max_entries:
+        _pixmaps.popitem(last=False)
+    return result
+
+
+def discard(path=None):
+    """Drop every entry of path, or everything."""
+    for key in [key for key in _pixmaps if path is None or key[0] == path]:
+        del _pixmaps[key]
+
+
+def stats():
+    return {"entries": len(_pixmaps), **_stats}
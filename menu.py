@@ -2,25 +2,24 @@ from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
     QLabel,
-    QTableWidget,
-    QTableWidgetItem,
-    QAbstractItemView,
-    QHeaderView,
     QPushButton,
     QSpinBox,
+    QTimeEdit,
     QHBoxLayout,
-    QWidget,
-    QGridLayout,
 )
 from PySide6.QtGui import QAction
-from PySide6.QtCore import Qt
 import sys
 import os
+import logging
+import json
 from db import (
-    fetch_last_10_report_sessions,
-    fetch_yearly_daily_session_counts,
+    get_app_path,
     save_setting,
 )
+from clock import get_clock
+from diagnostics import dump_diagnostics
+import metrics
+import image_store
 
 # Import Windows registry modules
 import platform
@@ -31,6 +30,7 @@ if platform.system() == "Windows":
 class AppMenu:
     def __init__(self, parent):
         self.parent = parent
+        self.report_dialog = None
         self.setup_menu()
     def setup_menu(self):
         menu_bar = self.parent.menuBar()
@@ -56,6 +56,14 @@ class AppMenu:
             startup_action.triggered.connect(self.toggle_startup)
             menu.addAction(startup_action)
 
+        power_action = QAction("Power Usage", self.parent)
+        power_action.triggered.connect(self.show_power_dialog)
+        menu.addAction(power_action)
+
+        diagnostics_action = QAction("Dump Diagnostics", self.parent)
+        diagnostics_action.triggered.connect(self.dump_diagnostics)
+        menu.addAction(diagnostics_action)
+
         send_to_back_action = QAction("Send to Back", self.parent)
         send_to_back_action.triggered.connect(self.parent.send_to_back)
         menu.addAction(send_to_back_action)
@@ -87,6 +95,53 @@ class AppMenu:
         """
         self.parent.show_dialog("About", about_text)
 
+    def show_power_dialog(self):
+        """Show how often the app wakes up and what it has scheduled."""
+        scheduler = self.parent.scheduler
+        jobs = "".join(
+            f"<li>{job.name}{' (background)' if job.background else ''}: "
+            f"in {job.due_in():.0f} s</li>"
+            for job in scheduler.jobs()
+        )
+        power_text = f"""
+        <p>Power save mode: <b>{'on' if scheduler.power_save else 'off'}</b></p>
+        <p>Wakeups per hour: <b>{scheduler.wakeups_per_hour():.1f}</b></p>
+        <p>Scheduled jobs:</p>
+        <ul>{jobs}</ul>
+        """
+        self.parent.show_dialog("Power Usage", power_text)
+
+    def dump_diagnostics(self):
+        """Write the recent log and the state of the timer, jobs and subscribers to a file."""
+        parent = self.parent
+        timer = parent.timer_core
+        subscribers = "\n".join(
+            f"{name}: {stats.as_dict()}" for name, stats in parent.events.stats().items()
+        )
+        sections = {
+            "Timer": (
+                f"{timer.label}, {timer.remaining_seconds} s left, "
+                f"{'running' if timer.is_running else 'stopped'}, "
+                f"{timer.completed_sessions} sessions completed today"
+            ),
+            "Scheduler": (
+                f"Power save: {parent.scheduler.power_save}, "
+                f"wakeups per hour: {parent.scheduler.wakeups_per_hour():.1f}\n"
+                + "\n".join(repr(job) for job in parent.scheduler.jobs())
+            ),
+            "Event subscribers": subscribers,
+            "Metrics": json.dumps(metrics.snapshot()["metrics"], indent=1),
+            "Image store": image_store.stats(),
+        }
+        file_name = get_clock().now().strftime("xbitopomo-diagnostics-%Y%m%d-%H%M%S.txt")
+        try:
+            path = dump_diagnostics(os.path.join(get_app_path(), file_name), sections)
+        except OSError as e:
+            logging.error("Could not write diagnostics: %s", e)
+            parent.show_dialog("Diagnostics", f"Could not write diagnostics: {e}")
+            return
+        parent.show_dialog("Diagnostics", f"Diagnostics written to {path}")
+
     def show_settings_dialog(self):
         settings_dialog = QDialog(self.parent)
         settings_dialog.setWindowTitle("Settings")
@@ -137,6 +192,18 @@ class AppMenu:
         sessions_layout.addWidget(self.parent.sessions_spinbox)
         layout.addLayout(sessions_layout)
 
+        # The progress bar shows how much of this span of the day has gone by
+        day_layout = QHBoxLayout()
+        day_label = QLabel("Day from / to:")
+        self.parent.day_start_edit = QTimeEdit(self.parent.day_progress.start)
+        self.parent.day_start_edit.setDisplayFormat("HH:mm")
+        self.parent.day_end_edit = QTimeEdit(self.parent.day_progress.end)
+        self.parent.day_end_edit.setDisplayFormat("HH:mm")
+        day_layout.addWidget(day_label)
+        day_layout.addWidget(self.parent.day_start_edit)
+        day_layout.addWidget(self.parent.day_end_edit)
+        layout.addLayout(day_layout)
+
         button_layout = QHBoxLayout()
         save_button = QPushButton("Save")
         save_button.clicked.connect(self.parent.save_settings)
@@ -150,130 +217,19 @@ class AppMenu:
         settings_dialog.exec()
 
     def show_report_dialog(self):
-        report_dialog = QDialog(self.parent)
-        report_dialog.setWindowTitle("Report")
-        report_dialog.setMinimumWidth(550)
-        report_dialog.setMinimumHeight(500)
-
-        layout = QVBoxLayout()
-        title_layout = QVBoxLayout()
-        title_label = QLabel("<h1>Report</h1>")
-        title_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(title_label)
-
-        subtitle_label_year = QLabel("<h2>Sessions in the last year</h2>")
-        subtitle_label_year.setAlignment(Qt.AlignCenter)
-        layout.addWidget(subtitle_label_year)
-
-        # Create a "contribution-like" grid widget
-        daily_counts = fetch_yearly_daily_session_counts()
-
-        # Find Monday on or before the day 12 months ago
-        from datetime import datetime, timedelta
-
-        today = datetime.now().date()
-        start_date = today.replace(day=1) - timedelta(days=365)
-        while start_date.weekday() != 0:  # 0 = Monday
-            start_date -= timedelta(days=1)
-
-        # Create "contribution-like" grid
-        contrib_widget = QWidget()
-        contrib_layout = QGridLayout(contrib_widget)
-        contrib_layout.setSpacing(2)
+        # Built on first use, then kept hidden between uses and only refreshed
+        if self.report_dialog is None:
+            # Imported here, the report widgets are not needed to show the timer
+            from report_dialog import ReportDialog
 
-        # Day labels at left for Monday, Wednesday, Friday
-        day_labels = {0: "Mon", 2: "Wed", 4: "Fri"}
-
-        # Fill chart up to today
-        current = start_date
-        col_index = 0
-        last_month_shown = None
-
-        while current <= today:
-            week_of_year = (current - start_date).days // 7
-            row = current.weekday()  # 0..6 for Mon..Sun
-            if week_of_year != col_index:
-                col_index = week_of_year
-            # Label for day of week (left side)
-            if row in day_labels and col_index == 0:
-                label_day = QLabel(day_labels[row])
-                contrib_layout.addWidget(label_day, row + 1, 0)
-            # Month label on top if it's the first day (Monday) of a new month
-            if row == 0:  # Monday
-                month_label = current.strftime("%b")
-                if month_label != last_month_shown:
-                    lbl = QLabel(month_label)
-                    lbl.setAlignment(Qt.AlignCenter)
-                    contrib_layout.addWidget(lbl, 0, col_index + 1)
-                    last_month_shown = month_label
-
-            # Create the colored cell
-            date_str = current.strftime("%Y-%m-%d")
-            count = daily_counts.get(date_str, 0)
-            shade = min(count, 5) * 40
-            cell = QLabel()
-            cell.setToolTip(f"{current.strftime('%B %d')}: {count}")
-            cell.setStyleSheet(
-                f"background-color: rgba(0, 200, 0, {shade});"
-                "min-width: 10px; min-height: 10px;"
-            )
-            contrib_layout.addWidget(cell, row + 1, col_index + 1)
-            current += timedelta(days=1)
-
-        layout.addWidget(contrib_widget)
-
-        subtitle_label_last_10 = QLabel("<h2>Last 10 Sessions details</h2>")
-        subtitle_label_last_10.setAlignment(Qt.AlignCenter)
-        layout.addWidget(subtitle_label_last_10)
-
-        table_widget = QTableWidget()
-        table_widget.setColumnCount(2)  # Reduced from 3 to 2 columns
-        table_widget.setHorizontalHeaderLabels(["Start Time", "End Time"])  # Removed "Feeling"
-
-        report_sessions = fetch_last_10_report_sessions()
-        table_widget.setRowCount(len(report_sessions))
-        for row, session in enumerate(report_sessions):
-            start_time = QTableWidgetItem(session["start_time"])
-            end_time = QTableWidgetItem(session["end_time"])
-
-            table_widget.setItem(row, 0, start_time)
-            table_widget.setItem(row, 1, end_time)
-
-        table_widget.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        table_widget.setSelectionBehavior(QAbstractItemView.SelectRows)
-        table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        table_widget.setAlternatingRowColors(True)
-        table_widget.setStyleSheet("QTableWidget { border: 1px solid #ddd; }")
-        table_widget.setColumnWidth(0, 200)
-        table_widget.setColumnWidth(1, 200)
-        table_widget.verticalHeader().setDefaultSectionSize(30)
-
-        layout.addWidget(table_widget)
-
-        close_button = QPushButton("Close")
-        close_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 10px 20px;
-                border: none;
-                border-radius: 5px;
-                text-align: center;
-                text-decoration: none;
-                display: inline-block;
-                font-size: 16px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """
-        )
-        close_button.clicked.connect(report_dialog.accept)
-        layout.addWidget(close_button)
+            self.report_dialog = ReportDialog(self.parent)
+        self.report_dialog.refresh()
+        self.report_dialog.exec()
 
-        report_dialog.setLayout(layout)
-        report_dialog.exec()
+    def shutdown(self):
+        """Stop the report's background work, before the app exits."""
+        if self.report_dialog is not None:
+            self.report_dialog.shutdown()
 
     def toggle_startup(self, state):
         """
@@ -320,7 +276,7 @@ class AppMenu:
             winreg.CloseKey(registry_key)
             return True
         except Exception as e:
-            print(f"Error modifying startup registry: {e}")
+            logging.error("Error modifying startup registry: %s", e)
             return False
             
     def is_startup_enabled(self):
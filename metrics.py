@@ -0,0 +1,293 @@
+"""
+Built-in metrics.
+
+Histograms of timer lateness (countdown tick jitter against the monotonic
+clock), GUI thread stalls, database latency per db.py function, paint times
+per widget and audio render/play times, plus the process RSS.
+
+They are always collected, an observation is a few additions under a lock.
+Exposing them is optional:
+- XBITO_METRICS_PORT=9464 serves Prometheus text on http://127.0.0.1:9464/metrics
+- XBITO_METRICS_SNAPSHOT=path writes a JSON snapshot to path every minute
+"""
+
+import bisect
+import functools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+PORT_ENV_VAR = "XBITO_METRICS_PORT"
+SNAPSHOT_ENV_VAR = "XBITO_METRICS_SNAPSHOT"
+SNAPSHOT_INTERVAL_SECONDS = 60
+STALL_THRESHOLD_SECONDS = 0.05  # Event loop delays below this are not stalls
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_registry = []
+
+
+class Histogram:
+    """Cumulative histogram in seconds, with one series per combination of label values."""
+
+    def __init__(self, name, help_text, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series = {}  # label values -> [bucket counts..., count, sum, max]
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def observe(self, value, **labels):
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0, 0.0]
+            if index < len(self.buckets):
+                series[index] += 1
+            series[-3] += 1
+            series[-2] += value
+            series[-1] = max(series[-1], value)
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of the enclosed block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def series(self):
+        """[(labels dict, bucket counts, count, sum, max)] for every series."""
+        with self._lock:
+            items = [(key, list(values)) for key, values in self._series.items()]
+        return [
+            (dict(zip(self.labelnames, key)), values[: len(self.buckets)], values[-3], values[-2], values[-1])
+            for key, values in items
+        ]
+
+    def prometheus_lines(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for labels, bucket_counts, count, total, _ in self.series():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative += bucket_count
+                lines.append(f"{self.name}_bucket{_labels(labels, le=bound)} {cumulative}")
+            lines.append(f"{self.name}_bucket{_labels(labels, le='+Inf')} {count}")
+            lines.append(f"{self.name}_sum{_labels(labels)} {total}")
+            lines.append(f"{self.name}_count{_labels(labels)} {count}")
+        return lines
+
+    def snapshot(self):
+        return [
+            {
+                "labels": labels,
+                "count": count,
+                "sum": total,
+                "mean": total / count if count else 0.0,
+                "max": maximum,
+            }
+            for labels, _, count, total, maximum in self.series()
+        ]
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+
+class Gauge:
+    """A value read from a function whenever metrics are collected."""
+
+    def __init__(self, name, help_text, function):
+        self.name = name
+        self.help_text = help_text
+        self.function = function
+        _registry.append(self)
+
+    def value(self):
+        try:
+            return self.function()
+        except Exception as e:
+            logging.debug("Could not read gauge %s: %s", self.name, e)
+            return None
+
+    def prometheus_lines(self):
+        value = self.value()
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} gauge"]
+        if value is not None:
+            lines.append(f"{self.name} {value}")
+        return lines
+
+    def snapshot(self):
+        return self.value()
+
+    def reset(self):
+        pass
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels, **extra):
+    pairs = {**labels, **extra}
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs.items()) + "}"
+
+
+def timed(histogram, **labels):
+    """Decorator observing every call's duration, labelled function=<name> by default."""
+
+    def decorator(func):
+        call_labels = labels or {"function": func.__name__}
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with histogram.time(**call_labels):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def current_rss_bytes():
+    """Resident set size of this process, or None where it cannot be read."""
+    if sys.platform.startswith("linux"):
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return counters.WorkingSetSize
+        return None
+    import resource
+
+    # Peak rather than current RSS, in bytes on macOS
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+TIMER_LATENESS = Histogram(
+    "xbito_timer_lateness_seconds",
+    "How late scheduled jobs ran against their monotonic deadline (countdown tick jitter).",
+    ("job",),
+)
+GUI_STALL = Histogram(
+    "xbito_gui_stall_seconds",
+    "Event loop stalls: how long a timer wakeup was delayed beyond 50 ms.",
+)
+DB_LATENCY = Histogram(
+    "xbito_db_latency_seconds", "Duration of db.py calls.", ("function",)
+)
+PAINT_TIME = Histogram(
+    "xbito_paint_seconds", "Duration of paintEvent per widget.", ("widget",)
+)
+AUDIO_LATENCY = Histogram(
+    "xbito_audio_seconds", "Time to render or play a melody.", ("stage", "melody")
+)
+RSS = Gauge("xbito_resident_memory_bytes", "Resident set size of the process.", current_rss_bytes)
+
+
+def render_prometheus():
+    """Every metric in the Prometheus text exposition format."""
+    lines = []
+    for metric in _registry:
+        lines += metric.prometheus_lines()
+    return "\n".join(lines) + "\n"
+
+
+def snapshot():
+    return {
+        "timestamp": time.time(),
+        "metrics": {metric.name: metric.snapshot() for metric in _registry},
+    }
+
+
+def write_snapshot(path):
+    """Write a JSON snapshot atomically, so readers never see half a file."""
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "w") as snapshot_file:
+        json.dump(snapshot(), snapshot_file, indent=1)
+    os.replace(temporary_path, path)
+
+
+def reset():
+    for metric in _registry:
+        metric.reset()
+
+
+def start_http_server(port, host="127.0.0.1"):
+    """Serve /metrics from a daemon thread. Only binds to localhost by default."""
+    # Imported here, it is only needed when the exporter is turned on
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsRequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = render_prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logging.debug("Metrics request: " + format, *args)
+
+    server = ThreadingHTTPServer((host, port), MetricsRequestHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+    return server
+
+
+def setup(scheduler):
+    """Start the exporters requested in the environment. Snapshots run as a background job."""
+    port = os.environ.get(PORT_ENV_VAR)
+    if port:
+        try:
+            start_http_server(int(port))
+            logging.info("Serving metrics on http://127.0.0.1:%s/metrics", port)
+        except (OSError, ValueError) as e:
+            logging.error("Could not serve metrics on port %s: %s", port, e)
+    path = os.environ.get(SNAPSHOT_ENV_VAR)
+    if path:
+
+        def write_metrics_snapshot():
+            try:
+                write_snapshot(path)
+            except OSError as e:
+                logging.error("Could not write metrics snapshot %s: %s", path, e)
+
+        scheduler.call_every(
+            SNAPSHOT_INTERVAL_SECONDS, write_metrics_snapshot, "metrics_snapshot", background=True
+        )
@@ -0,0 +1,253 @@
+"""
+The Report window: the sessions heatmap, the session history and the Focus calendar.
+
+The window is built once and hidden between uses. Opening it again only reads
+what changed since it was last shown: every session write bumps a version in
+the database and stamps the daily_stats rows it touched, so refresh() fetches
+the days written after the version it last saw and patches them into the
+heatmap and the calendar. Nothing is read when no session was written.
+"""
+
+import logging
+import os
+from datetime import timedelta
+
+from PySide6.QtWidgets import (
+    QDialog,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QTableView,
+    QLineEdit,
+    QTabWidget,
+    QWidget,
+    QAbstractItemView,
+    QHeaderView,
+    QPushButton,
+    QScrollArea,
+    QFrame,
+    QButtonGroup,
+    QProgressBar,
+    QFileDialog,
+)
+from PySide6.QtCore import Qt
+
+from db import (
+    fetch_daily_session_counts,
+    fetch_daily_stats_since,
+    fetch_first_session_date,
+    fetch_session_write_version,
+)
+from clock import get_clock
+from heatmap_widget import HeatmapWidget
+from activity_pyramid import ActivityPyramid, LEVELS
+from session_history import SessionHistoryModel
+from calendar_widget import CalendarWidget, month_start
+from report_export import ReportExporter
+
+
+class ReportDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.version = None  # Session write version the report shows, None before the first refresh
+        self.setWindowTitle("Report")
+        self.setMinimumWidth(550)
+        self.setMinimumHeight(500)
+
+        layout = QVBoxLayout()
+        title_label = QLabel("<h1>Report</h1>")
+        title_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(title_label)
+
+        # The overview and the calendar are tabs, the calendar is only painted when opened
+        tabs = QTabWidget()
+        overview_page = QWidget()
+        overview_layout = QVBoxLayout(overview_page)
+        tabs.addTab(overview_page, "Overview")
+
+        subtitle_label_year = QLabel("<h2>Sessions</h2>")
+        subtitle_label_year.setAlignment(Qt.AlignCenter)
+        overview_layout.addWidget(subtitle_label_year)
+
+        # A "contribution-like" graph of the whole history, at least the last 12 months
+        self.heatmap = HeatmapWidget()
+        contrib_scroll = QScrollArea()
+        contrib_scroll.setWidget(self.heatmap)
+        contrib_scroll.setAlignment(Qt.AlignCenter)
+        contrib_scroll.setFrameShape(QFrame.NoFrame)
+
+        # Zoom levels, Ctrl+wheel on the graph also switches them
+        zoom_layout = QHBoxLayout()
+        zoom_layout.addStretch()
+        zoom_buttons = QButtonGroup(self)
+        for level in LEVELS:
+            zoom_button = QPushButton(level.capitalize())
+            zoom_button.setCheckable(True)
+            zoom_button.setChecked(level == self.heatmap.level)
+            zoom_button.clicked.connect(lambda _, level=level: self.heatmap.set_level(level))
+            zoom_buttons.addButton(zoom_button)
+            zoom_layout.addWidget(zoom_button)
+        self.heatmap.levelChanged.connect(
+            lambda level: zoom_buttons.buttons()[LEVELS.index(level)].setChecked(True)
+        )
+        zoom_layout.addStretch()
+        overview_layout.addLayout(zoom_layout)
+        overview_layout.addWidget(contrib_scroll)
+        # Show the most recent days first, also after zooming
+        contrib_scrollbar = contrib_scroll.horizontalScrollBar()
+        contrib_scrollbar.rangeChanged.connect(lambda _, maximum: contrib_scrollbar.setValue(maximum))
+
+        subtitle_label_history = QLabel("<h2>Session history</h2>")
+        subtitle_label_history.setAlignment(Qt.AlignCenter)
+        overview_layout.addWidget(subtitle_label_history)
+
+        self.history_model = SessionHistoryModel(self)
+        filter_edit = QLineEdit()
+        filter_edit.setPlaceholderText("Filter by start date, e.g. 2024-07")
+        filter_edit.textChanged.connect(self.history_model.set_prefix)
+        overview_layout.addWidget(filter_edit)
+
+        # Rows are read from the database page by page while scrolling
+        table_widget = QTableView()
+        table_widget.setModel(self.history_model)
+        table_widget.setSortingEnabled(True)
+        table_widget.sortByColumn(0, Qt.DescendingOrder)
+        table_widget.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table_widget.setSelectionBehavior(QAbstractItemView.SelectRows)
+        table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        table_widget.setAlternatingRowColors(True)
+        table_widget.setStyleSheet("QTableView { border: 1px solid #ddd; }")
+        table_widget.verticalHeader().setDefaultSectionSize(30)
+        table_widget.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+
+        overview_layout.addWidget(table_widget)
+
+        calendar_page = QWidget()
+        calendar_layout = QVBoxLayout(calendar_page)
+        self.calendar = CalendarWidget()
+        navigation_layout = QHBoxLayout()
+        for text, action in (
+            ("<", self.calendar.previous_month),
+            ("Today", lambda: self.calendar.show_month(get_clock().today())),
+            (">", self.calendar.next_month),
+        ):
+            navigation_button = QPushButton(text)
+            navigation_button.clicked.connect(action)
+            navigation_layout.addWidget(navigation_button)
+        calendar_layout.addLayout(navigation_layout)
+        calendar_layout.addWidget(self.calendar, 1)
+        self.calendar.show_month(get_clock().today())
+        tabs.addTab(calendar_page, "Calendar")
+        layout.addWidget(tabs)
+
+        # Exports run in the background, the dialog can be closed meanwhile
+        export_layout = QHBoxLayout()
+        self.export_button = QPushButton("Export...")
+        self.export_button.clicked.connect(self.choose_export_folder)
+        export_layout.addWidget(self.export_button)
+        self.export_progress = QProgressBar()
+        self.export_progress.hide()
+        export_layout.addWidget(self.export_progress, 1)
+        self.export_status = QLabel()
+        export_layout.addWidget(self.export_status, 1)
+        layout.addLayout(export_layout)
+        self.exporter = ReportExporter(self)
+        self.exporter.progress.connect(self.show_export_progress)
+        self.exporter.finished.connect(lambda paths: self.end_export(f"Exported to {os.path.dirname(paths[0])}"))
+        self.exporter.failed.connect(lambda error: self.end_export(f"Export failed: {error}"))
+
+        close_button = QPushButton("Close")
+        close_button.setStyleSheet(
+            """
+            QPushButton {
+                background-color: #4CAF50;
+                color: white;
+                padding: 10px 20px;
+                border: none;
+                border-radius: 5px;
+                text-align: center;
+                text-decoration: none;
+                display: inline-block;
+                font-size: 16px;
+            }
+            QPushButton:hover {
+                background-color: #45a049;
+            }
+        """
+        )
+        close_button.clicked.connect(self.accept)
+        layout.addWidget(close_button)
+
+        self.setLayout(layout)
+
+    def refresh(self):
+        """Bring the report up to date with the sessions, reading only what changed."""
+        # Read the version first: a write landing during the refresh is fetched
+        # again next time, and applying a day twice is harmless as values are absolute
+        version = fetch_session_write_version()
+        today = get_clock().today()
+        pyramid = self.heatmap.pyramid
+        if pyramid is None or today > pyramid.end:
+            self.rebuild(today)
+        elif version != self.version:
+            changed = fetch_daily_stats_since(self.version)
+            if any(not pyramid.contains(day) for day, _, _ in changed):
+                self.rebuild(today)  # An edit before the first day shown
+            else:
+                logging.debug("Report: %d days changed since version %s", len(changed), self.version)
+                for day, sessions, _ in changed:
+                    pyramid.set(day, sessions)
+                self.heatmap.invalidate()
+                self.calendar.invalidate_months({month_start(day) for day, _, _ in changed})
+        if version != self.version:
+            self.history_model.refresh()
+        self.version = version
+
+    def done(self, result):
+        # Prefetching months is of no use while the report is hidden
+        self.calendar.shutdown()
+        super().done(result)
+
+    def closeEvent(self, event):
+        self.calendar.shutdown()  # Also when closed while hidden
+        super().closeEvent(event)
+
+    def shutdown(self):
+        """Stop the background work, waiting for an export still running, before the app exits."""
+        self.calendar.shutdown()
+        self.exporter.shutdown()
+
+    def choose_export_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Export the report to")
+        if folder:
+            self.export(folder)
+
+    def export(self, folder):
+        """Write the report files into folder on a worker thread."""
+        self.export_button.setEnabled(False)
+        self.export_status.clear()
+        self.export_progress.setValue(0)
+        self.export_progress.show()
+        return self.exporter.start(folder)
+
+    def show_export_progress(self, done, total):
+        self.export_progress.setMaximum(total)
+        self.export_progress.setValue(done)
+
+    def end_export(self, status):
+        self.export_progress.hide()
+        self.export_status.setText(status)
+        self.export_button.setEnabled(True)
+
+    def rebuild(self, today):
+        """Read the whole history again, on the first refresh and when the day changed."""
+        start_date = today.replace(day=1) - timedelta(days=365)
+        first_session_date = fetch_first_session_date()
+        if first_session_date is not None:
+            start_date = min(start_date, first_session_date)
+        self.heatmap.set_pyramid(
+            ActivityPyramid.from_daily_counts(
+                start_date, today, fetch_daily_session_counts(start_date, today)
+            )
+        )
+        self.calendar.refresh()
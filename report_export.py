@@ -0,0 +1,168 @@
+"""
+Export of the report to files: the heatmap of the last year as a PNG, the Focus
+summary and the session history as CSV, and all of them in a single HTML file
+with the heatmap inlined, so it can be mailed or archived on its own.
+
+Exports run on a worker thread. Sessions are streamed from the database and
+written to the CSV and the HTML as they are read, and the heatmap is painted
+into a QImage rather than a widget, so a history of any size is never held in
+memory and the timer keeps ticking while it is written.
+"""
+
+import base64
+import csv
+import html
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtGui import QColor
+
+from activity_pyramid import ActivityPyramid, DAY
+from clock import get_clock
+from db import (
+    count_completed_sessions,
+    fetch_daily_session_counts,
+    fetch_focus_summary,
+    iter_completed_sessions,
+)
+from heatmap_widget import render_heatmap
+
+HEATMAP_FILE = "xbitopomo-heatmap.png"
+SUMMARY_FILE = "xbitopomo-summary.csv"
+SESSIONS_FILE = "xbitopomo-sessions.csv"
+HTML_FILE = "xbitopomo-report.html"
+PROGRESS_EVERY = 500  # Sessions written between progress updates
+TEXT_COLOR = QColor(51, 51, 51)  # Exports are read on a white page
+
+# (label, key in fetch_focus_summary)
+SUMMARY_ROWS = [
+    ("Focus Time (avg/day last week)", "week_avg"),
+    ("Yesterday", "yesterday"),
+    ("Today", "today"),
+]
+
+def export_report(folder, progress=None):
+    """
+    Write the heatmap, summary, sessions and HTML files into folder. progress, if
+    given, is called with (done, total) steps, where every session is a step.
+    Returns the paths written.
+    """
+    total = count_completed_sessions() + 2  # The heatmap and the summary
+    done = 0
+
+    def report_progress():
+        if progress is not None:
+            progress(done, total)
+
+    today = get_clock().today()
+    start_date = today.replace(day=1) - timedelta(days=365)
+    pyramid = ActivityPyramid.from_daily_counts(
+        start_date, today, fetch_daily_session_counts(start_date, today)
+    )
+    heatmap_path = os.path.join(folder, HEATMAP_FILE)
+    if not render_heatmap(pyramid, DAY, TEXT_COLOR).save(heatmap_path, "PNG"):
+        raise OSError(f"Could not write {heatmap_path}")
+    done += 1
+    report_progress()
+
+    summary = fetch_focus_summary()
+    summary_path = os.path.join(folder, SUMMARY_FILE)
+    with open(summary_path, "w", newline="", encoding="utf-8") as summary_file:
+        writer = csv.writer(summary_file)
+        writer.writerow(["Metric", "Minutes"])
+        for label, key in SUMMARY_ROWS:
+            writer.writerow([label, f"{summary[key]:.1f}"])
+    done += 1
+    report_progress()
+
+    with open(heatmap_path, "rb") as heatmap_file:
+        heatmap_data = base64.b64encode(heatmap_file.read()).decode("ascii")
+    sessions_path = os.path.join(folder, SESSIONS_FILE)
+    html_path = os.path.join(folder, HTML_FILE)
+    with open(sessions_path, "w", newline="", encoding="utf-8") as sessions_file, open(
+        html_path, "w", encoding="utf-8"
+    ) as html_file:
+        writer = csv.writer(sessions_file)
+        writer.writerow(["Start Time", "End Time", "Minutes"])
+        html_file.write(html_header(today, summary, heatmap_data))
+        for start_time, end_time, seconds in iter_completed_sessions():
+            minutes = f"{seconds / 60:.0f}"
+            writer.writerow([start_time, end_time, minutes])
+            html_file.write(
+                f"<tr><td>{html.escape(start_time)}</td><td>{html.escape(end_time)}</td>"
+                f"<td class=\"minutes\">{minutes}</td></tr>\n"
+            )
+            done += 1
+            if done % PROGRESS_EVERY == 0:
+                report_progress()
+        html_file.write("</table>\n</body>\n</html>\n")
+    done = total
+    report_progress()
+    return [heatmap_path, summary_path, sessions_path, html_path]
+
+
+def html_header(today, summary, heatmap_data):
+    """The HTML file up to the session table's header row, the rows are streamed after it."""
+    summary_rows = "".join(
+        f"<tr><td>{label}</td><td class=\"minutes\">{summary[key]:.1f}</td></tr>\n"
+        for label, key in SUMMARY_ROWS
+    )
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Xbito - Pomodoro Timer report, {today.isoformat()}</title>
+<style>
+body {{ font-family: Arial, sans-serif; color: #333; margin: 20px; }}
+table {{ border-collapse: collapse; margin-bottom: 20px; }}
+td, th {{ border: 1px solid #ddd; padding: 4px 10px; }}
+.minutes {{ text-align: right; }}
+</style>
+</head>
+<body>
+<h1>Report</h1>
+<h2>Sessions</h2>
+<img src="data:image/png;base64,{heatmap_data}" alt="Sessions per day">
+<h2>Focus summary (minutes)</h2>
+<table>
+{summary_rows}</table>
+<h2>Session history</h2>
+<table>
+<tr><th>Start Time</th><th>End Time</th><th>Minutes</th></tr>
+"""
+
+
+class ReportExporter(QObject):
+    """Runs export_report on a worker thread, reporting back through signals."""
+
+    progress = Signal(int, int)  # done, total
+    finished = Signal(list)  # Paths written
+    failed = Signal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.executor = None  # Started by the first export, stopped by shutdown()
+
+    def start(self, folder):
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="export")
+        return self.executor.submit(self.export, folder)
+
+    def shutdown(self):
+        """Wait for the export still running, if any, and stop the worker."""
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def export(self, folder):
+        try:
+            paths = export_report(folder, self.progress.emit)
+        except Exception as e:
+            logging.error("Could not export the report to %s: %s", folder, e)
+            self.failed.emit(str(e))
+            return
+        logging.info("Report exported to %s", folder)
+        self.finished.emit(paths)
@@ -0,0 +1,260 @@
+import heapq
+import itertools
+import math
+from collections import deque
+from datetime import datetime, timedelta
+
+from clock import get_clock, ClockJumpDetector
+from metrics import GUI_STALL, STALL_THRESHOLD_SECONDS, TIMER_LATENESS
+
+
+class Job:
+    """
+    A callback scheduled on a Scheduler.
+
+    One-shot jobs run once after their delay, periodic jobs run every interval
+    and daily jobs run at a wall-clock time of day (e.g. local midnight).
+    Background jobs may run late in power save mode, together with other jobs.
+    """
+
+    def __init__(
+        self, scheduler, callback, name, delay=None, interval=None, at=None, background=False
+    ):
+        self.scheduler = scheduler
+        self.callback = callback
+        self.name = name or getattr(callback, "__name__", "job")
+        self.delay = delay
+        self.interval = interval
+        self.at = at
+        self.background = background
+        self.deadline = None  # Monotonic time of the next run, None when inactive
+        self.runs = 0
+
+    @property
+    def active(self):
+        return self.deadline is not None
+
+    def due_in(self):
+        """Seconds until the next run, or None if the job is not scheduled."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - self.scheduler.clock.monotonic())
+
+    def restart(self, delay=None):
+        """(Re)schedule the job, by default after its delay or interval."""
+        self.scheduler._push(self, self._next_delay() if delay is None else delay)
+
+    def cancel(self):
+        self.scheduler._remove(self)
+
+    def _next_delay(self):
+        if self.at is not None:
+            return self.scheduler.seconds_until(self.at)
+        if self.interval is not None:
+            return self.interval
+        return self.delay
+
+    def __repr__(self):
+        due_in = self.due_in()
+        due = "inactive" if due_in is None else f"in {due_in:.1f}s"
+        return f"<Job {self.name} {due}>"
+
+
+class Scheduler:
+    """
+    Runs all timed jobs from a min-heap of deadlines.
+
+    Only one timer is ever armed, for the earliest deadline, so the process
+    wakes up once per due job instead of once per independent timer.
+
+    In power save mode background jobs are coalesced: they may be postponed by
+    up to coalesce_seconds and then run along with whatever wakes the process.
+
+    Every wakeup also checks the wall clock against the monotonic clock. When
+    it jumped (suspend/resume, NTP, DST) daily jobs are re-aligned and the
+    callbacks in clock_jump_listeners are called with the ClockJump.
+    """
+
+    def __init__(self, clock=None, parent=None, coalesce_seconds=600):
+        self.clock = clock or get_clock()
+        # A precise timer never fires before the deadline, which would cost a second wakeup
+        self._timer = self.clock.timer(self._run_due, parent, precise=True)
+        self._timer.setSingleShot(True)
+        # Entries are [deadline, sequence, job], stale ones are skipped.
+        # Foreground and background jobs live in separate heaps.
+        self._queues = {False: [], True: []}
+        self._entries = {}  # job -> its live heap entry
+        self._counter = itertools.count()
+        self._running = False
+        self._armed_for = None  # Monotonic time the timer is armed for
+        self.clock_monitor = ClockJumpDetector(self.clock)
+        self.clock_jump_listeners = []
+        self.coalesce_seconds = coalesce_seconds
+        self.power_save = False
+        self.wakeups = 0
+        self._started_at = self.clock.monotonic()
+        self._recent_wakeups = deque()  # Monotonic times of the wakeups in the last hour
+
+    def call_later(self, delay, callback, name=None, start=True, background=False):
+        """Run callback once after delay seconds."""
+        job = Job(self, callback, name, delay=delay, background=background)
+        if start:
+            job.restart()
+        return job
+
+    def call_every(self, interval, callback, name=None, start=True, background=False):
+        """Run callback every interval seconds."""
+        job = Job(self, callback, name, interval=interval, background=background)
+        if start:
+            job.restart()
+        return job
+
+    def call_daily(self, at, callback, name=None, background=False):
+        """Run callback every day at the wall-clock time `at` (a datetime.time)."""
+        job = Job(self, callback, name, at=at, background=background)
+        job.restart()
+        return job
+
+    def set_power_save(self, enabled):
+        """Turn coalescing of background jobs on or off."""
+        self.power_save = enabled
+        self._arm()
+
+    def check_clock(self, missed=0.0):
+        """
+        Look for a wall-clock jump since the last check, re-align daily jobs and
+        notify clock_jump_listeners if there was one. Returns the ClockJump or None.
+        """
+        jump = self.clock_monitor.check(missed)
+        if jump is None:
+            return None
+        for job in list(self._entries):
+            if job.at is not None:
+                self._push(job, job._next_delay())
+        for listener in self.clock_jump_listeners:
+            listener(jump)
+        return jump
+
+    def wakeups_per_hour(self):
+        """Wakeups over the last hour, extrapolated when running for less than an hour."""
+        now = self.clock.monotonic()
+        self._forget_old_wakeups(now)
+        elapsed = min(now - self._started_at, 3600.0)
+        if elapsed <= 0:
+            return 0.0
+        return len(self._recent_wakeups) * 3600.0 / elapsed
+
+    def _forget_old_wakeups(self, now):
+        while self._recent_wakeups and self._recent_wakeups[0] <= now - 3600:
+            self._recent_wakeups.popleft()
+
+    def seconds_until(self, at):
+        """Seconds from now until the next wall-clock occurrence of time of day `at`."""
+        now = self.clock.now()
+        target = datetime.combine(now.date(), at)
+        if target <= now:
+            target += timedelta(days=1)
+        return (target - now).total_seconds()
+
+    def jobs(self):
+        """Active jobs, soonest first."""
+        return sorted(self._entries, key=lambda job: job.deadline)
+
+    def _push(self, job, delay):
+        self._discard(job)
+        job.deadline = self.clock.monotonic() + max(0.0, delay)
+        entry = [job.deadline, next(self._counter), job]
+        self._entries[job] = entry
+        heapq.heappush(self._queues[job.background], entry)
+        self._arm()
+
+    def _discard(self, job):
+        entry = self._entries.pop(job, None)
+        if entry is not None:
+            entry[2] = None
+        job.deadline = None
+
+    def _remove(self, job):
+        self._discard(job)
+        self._arm()
+
+    def _peek(self, queue):
+        """Earliest live deadline of a heap, or None."""
+        while queue and queue[0][2] is None:
+            heapq.heappop(queue)
+        return queue[0][0] if queue else None
+
+    def _next_wakeup(self):
+        foreground = self._peek(self._queues[False])
+        background = self._peek(self._queues[True])
+        if background is not None and self.power_save:
+            background += self.coalesce_seconds
+        deadlines = [d for d in (foreground, background) if d is not None]
+        return min(deadlines) if deadlines else None
+
+    def _arm(self):
+        """Arm the single timer for the earliest live deadline."""
+        if self._running:
+            return  # _run_due re-arms once all due jobs have run
+        wakeup = self._next_wakeup()
+        self._armed_for = wakeup
+        if wakeup is None:
+            self._timer.stop()
+            return
+        delay = wakeup - self.clock.monotonic()
+        self._timer.start(max(0, math.ceil(delay * 1000)))
+
+    def _pop_due(self, now):
+        """Remove and return the heap entry of the earliest job due by now, or None."""
+        due = [
+            queue
+            for queue in self._queues.values()
+            if self._peek(queue) is not None and queue[0][0] <= now
+        ]
+        if not due:
+            return None
+        return heapq.heappop(min(due, key=lambda queue: queue[0]))
+
+    def _run_due(self):
+        now = self.clock.monotonic()
+        self.wakeups += 1
+        self._forget_old_wakeups(now)
+        self._recent_wakeups.append(now)
+        self._running = True
+        try:
+            missed = now - self._armed_for if self._armed_for is not None else 0.0
+            jump = self.check_clock(missed)
+            if missed > STALL_THRESHOLD_SECONDS and (jump is None or jump.kind != "suspend"):
+                GUI_STALL.observe(missed)
+            # Due jobs stay in the heap until their turn, so the ones left
+            # still run if a callback raises
+            while True:
+                entry = self._pop_due(now)
+                if entry is None:
+                    break
+                deadline, _, job = entry
+                if not (job.background and self.power_save):
+                    # Power save postpones background jobs on purpose, that is not jitter
+                    TIMER_LATENESS.observe(max(0.0, now - deadline), job=job.name)
+                del self._entries[job]
+                job.deadline = None
+                if job.at is not None:
+                    self._push(job, job._next_delay())
+                elif job.interval is not None:
+                    # Keep the cadence of periodic jobs instead of drifting by the wakeup
+                    # latency, but skip runs that were missed entirely
+                    next_deadline = deadline + job.interval
+                    if next_deadline <= now:
+                        next_deadline = now + job.interval
+                    self._push(job, next_deadline - now)
+                job.runs += 1
+                # Arm for the next deadline before the callback runs: a callback
+                # that opens a nested event loop, like a modal dialog, must not
+                # hold up the other jobs
+                self._running = False
+                self._arm()
+                job.callback()
+                self._running = True
+        finally:
+            self._running = False
+            self._arm()
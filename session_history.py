@@ -0,0 +1,155 @@
+"""
+Table model browsing every completed session, however many there are.
+
+Rows are read from the database a page at a time as the view scrolls down
+(canFetchMore/fetchMore), with keyset pagination so a deep page costs the
+same as the first one. Only the last MAX_CACHED_PAGES pages used stay in
+memory; a page that was dropped is read again from the key it starts after.
+When sessions were written since the rows were listed, that page may no
+longer line up with them, so the model lists the sessions again instead.
+Sorting and filtering are done by the query, and display strings are only
+made for the cells the view asks for.
+"""
+
+from collections import OrderedDict
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
+
+from db import fetch_session_write_version, fetch_sessions_page
+
+PAGE_SIZE = 200
+MAX_CACHED_PAGES = 8
+
+# (header, sort column in fetch_sessions_page, index in the row tuple)
+COLUMNS = [
+    ("Start Time", "start_time", 1),
+    ("End Time", "end_time", 2),
+    ("Minutes", "duration", 3),
+]
+
+
+class SessionHistoryModel(QAbstractTableModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.sort_column = 0
+        self.descending = True
+        self.prefix = ""
+        self.clear()
+
+    def clear(self):
+        self.page_starts = [None]  # Keyset position each known page starts after
+        self.pages = OrderedDict()  # page number -> rows, least recently used first
+        self.row_count = 0
+        self.exhausted = False
+        self.version = None  # Session write version when the first page was read
+        self.refresh_pending = False
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return COLUMNS[section][0]
+        return super().headerData(section, orientation, role)
+
+    def fetch_page(self, page):
+        if self.version is None:
+            self.version = fetch_session_write_version()
+        elif fetch_session_write_version() != self.version:
+            self.schedule_refresh()  # The page may not start where it used to
+        return fetch_sessions_page(
+            self.page_starts[page],
+            PAGE_SIZE,
+            COLUMNS[self.sort_column][1],
+            self.descending,
+            self.prefix,
+        )
+
+    def cache_page(self, page, rows):
+        self.pages[page] = rows
+        self.pages.move_to_end(page)
+        while len(self.pages) > MAX_CACHED_PAGES:
+            self.pages.popitem(last=False)
+
+    def page(self, number):
+        rows = self.pages.get(number)
+        if rows is None:
+            rows = self.fetch_page(number)
+        self.cache_page(number, rows)
+        return rows
+
+    def row_key(self, row):
+        """The keyset position of a row: its sort value, then its rowid."""
+        return (row[COLUMNS[self.sort_column][2]], row[0])
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self.exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self.exhausted:
+            return
+        number = len(self.page_starts) - 1
+        rows = self.fetch_page(number)
+        if len(rows) < PAGE_SIZE:
+            self.exhausted = True
+        if not rows:
+            return
+        self.beginInsertRows(QModelIndex(), self.row_count, self.row_count + len(rows) - 1)
+        self.cache_page(number, rows)
+        self.row_count += len(rows)
+        if not self.exhausted:
+            self.page_starts.append(self.row_key(rows[-1]))
+        self.endInsertRows()
+
+    def session(self, row):
+        """
+        The (rowid, start_time, end_time, focus_seconds) tuple shown in row, or
+        None when the row is gone from its page since sessions were deleted.
+        """
+        number, offset = divmod(row, PAGE_SIZE)
+        rows = self.page(number)
+        if offset >= len(rows):
+            self.schedule_refresh()
+            return None
+        return rows[offset]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            session = self.session(index.row())
+            if session is None:
+                return None
+            value = session[COLUMNS[index.column()][2]]
+            if COLUMNS[index.column()][1] == "duration":
+                return f"{value / 60:.0f}"
+            return value
+        if role == Qt.TextAlignmentRole and COLUMNS[index.column()][1] == "duration":
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort in the query, starting again from the first page."""
+        self.sort_column = column
+        self.descending = order == Qt.DescendingOrder
+        self.refresh()
+
+    def set_prefix(self, prefix):
+        """Only show the sessions whose start time starts with prefix, e.g. "2024-07"."""
+        self.prefix = prefix.strip()
+        self.refresh()
+
+    def schedule_refresh(self):
+        """Refresh once the view is done asking for data, it cannot be reset meanwhile."""
+        if not self.refresh_pending:
+            self.refresh_pending = True
+            QTimer.singleShot(0, self, self.refresh)
+
+    def refresh(self):
+        """Forget the loaded pages, the view fetches the first ones again."""
+        self.beginResetModel()
+        self.clear()
+        self.endResetModel()
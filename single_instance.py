@@ -0,0 +1,141 @@
+"""
+Single-instance enforcement.
+
+The first xbitopomo process listens on a QLocalServer (a Unix domain socket or
+a Windows named pipe). Later launches connect to it, forward their command
+line arguments (e.g. `--start`, `--status`), print the reply and exit, so only
+one process ever writes to the database.
+"""
+
+import getpass
+import json
+import logging
+import os
+import sys
+
+from PySide6.QtCore import QObject
+from PySide6.QtNetwork import QLocalServer, QLocalSocket
+
+CONNECT_TIMEOUT_MS = 200  # A live instance accepts connections right away
+REPLY_TIMEOUT_MS = 2000
+
+
+def default_server_name():
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = "user"
+    return f"xbitopomo-{user}"
+
+
+class SingleInstance(QObject):
+    """
+    Forwards arguments to the running instance, or becomes it.
+
+    The running instance calls handler with the forwarded argument list and
+    sends its return value (a string) back to the other process. It listens
+    before its window is built; commands arriving before set_handler() wait.
+    """
+
+    def __init__(self, name=None, parent=None):
+        super().__init__(parent)
+        self.name = name or default_server_name()
+        self.handler = None
+        self.server = None
+        self._buffers = {}  # Connection -> bytes received so far
+        self._waiting = []  # (connection, args) received before there was a handler
+
+    def forward(self, args):
+        """
+        Send args to the running instance.
+
+        Returns its reply, or None when no instance is running. This blocks
+        for at most a few milliseconds when there is no instance.
+        """
+        socket = QLocalSocket()
+        socket.connectToServer(self.name)
+        if not socket.waitForConnected(CONNECT_TIMEOUT_MS):
+            return None
+        socket.write(json.dumps(list(args)).encode() + b"\n")
+        socket.flush()
+        reply = b""
+        while not reply.endswith(b"\n") and socket.waitForReadyRead(REPLY_TIMEOUT_MS):
+            reply += bytes(socket.readAll())
+        socket.disconnectFromServer()
+        return reply.decode().strip()
+
+    def listen(self, replace_stale=False):
+        """
+        Start accepting forwarded commands. Returns whether listening worked.
+
+        Listening fails when the name is taken: either another launch became the
+        running instance since forward() found nobody, or a crashed instance left
+        its socket behind. Only call again with replace_stale=True once forward()
+        got no reply, as it removes the socket before listening.
+        """
+        if self.server is None:
+            self.server = QLocalServer(self)
+            if sys.platform == "win32":
+                # On Unix this option makes Qt rename its socket over an existing
+                # one, even a running instance's; there the socket is chmod'ed instead
+                self.server.setSocketOptions(QLocalServer.UserAccessOption)
+            self.server.newConnection.connect(self.accept_connections)
+        if replace_stale:
+            QLocalServer.removeServer(self.name)
+        if not self.server.listen(self.name):
+            log = logging.error if replace_stale else logging.info
+            log("Could not listen on %s: %s", self.name, self.server.errorString())
+            return False
+        if sys.platform != "win32":
+            os.chmod(self.server.fullServerName(), 0o600)  # Only this user may send commands
+        return True
+
+    def set_handler(self, handler):
+        """Handle forwarded commands with handler, answering those that were waiting for one."""
+        self.handler = handler
+        waiting, self._waiting = self._waiting, []
+        for connection, args in waiting:
+            self.reply(connection, args)
+
+    def accept_connections(self):
+        while self.server.hasPendingConnections():
+            connection = self.server.nextPendingConnection()
+            self._buffers[connection] = bytearray()
+            connection.readyRead.connect(self.read_command)
+            connection.disconnected.connect(self.drop_connection)
+
+    def drop_connection(self):
+        connection = self.sender()
+        self._buffers.pop(connection, None)
+        self._waiting = [(waiting, args) for waiting, args in self._waiting if waiting is not connection]
+        connection.deleteLater()
+
+    def read_command(self):
+        connection = self.sender()
+        buffer = self._buffers[connection]
+        buffer += bytes(connection.readAll())
+        if not buffer.endswith(b"\n"):
+            return  # Wait for the rest of the line
+        try:
+            args = json.loads(buffer)
+        except ValueError as e:
+            logging.error("Failed to read forwarded command %r: %s", bytes(buffer), e)
+            self.send(connection, f"Error: {e}")
+            return
+        if self.handler is None:
+            self._waiting.append((connection, args))  # The window is still being built
+            return
+        self.reply(connection, args)
+
+    def reply(self, connection, args):
+        try:
+            reply = self.handler(args)
+        except Exception as e:
+            logging.error("Failed to handle forwarded command %r: %s", args, e)
+            reply = f"Error: {e}"
+        self.send(connection, reply)
+
+    def send(self, connection, reply):
+        connection.write(str(reply).encode() + b"\n")
+        connection.flush()
+        connection.disconnectFromServer()
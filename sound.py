@@ -1,51 +1,82 @@
-from pydub.generators import Sine
-
+import io
 import logging
-import os
-import tempfile
-import winsound
 from math import log10
 
+from metrics import AUDIO_LATENCY
+
+# Melodies as (frequencies in Hz, durations in milliseconds, initial volume, final volume).
+# The volume grows note by note from the initial to the final percentage.
+MELODIES = {
+    "celebratory": (
+        [523, 587, 659, 784, 880, 988, 1046],  # C5 D5 E5 G5 A5 B5 C6
+        [250, 250, 300, 200, 250, 300, 450],
+        0.1,
+        0.5,
+    ),
+    "rest_end": (
+        [261, 329, 392, 523, 659, 784, 1046],  # C4 E4 G4 C5 E5 G5 C6
+        [400, 400, 400, 600, 400, 400, 400],
+        0.2,
+        0.6,
+    ),
+    "bell": (
+        [659, 784, 988],  # E5 G5 B5
+        [500, 500, 500],
+        0.3,
+        0.7,
+    ),
+}
+
+_rendered = {}  # Melody name -> WAV bytes
+
+
+def render_melody(name):
+    """
+    Render a melody to WAV bytes, once per process.
+
+    pydub is imported here rather than at module load so importing this module
+    stays cheap at startup.
+    """
+    if name not in _rendered:
+        with AUDIO_LATENCY.time(stage="render", melody=name):
+            from pydub.generators import Sine
+
+            frequencies, durations, initial_volume, final_volume = MELODIES[name]
+            # Calculate the volume increase per note
+            volume_step = (final_volume - initial_volume) / (len(frequencies) - 1)
+            segments = []
+            for i, frequency in enumerate(frequencies):
+                volume = initial_volume + i * volume_step
+                segment = Sine(frequency).to_audio_segment(duration=durations[i]).apply_gain(
+                    20 * log10(volume)
+                )
+                segments.append(segment)
+            buffer = io.BytesIO()
+            sum(segments).export(buffer, format="wav")
+            _rendered[name] = buffer.getvalue()
+    return _rendered[name]
+
+
+def prerender_sounds():
+    """Render every melody ahead of time, e.g. from an idle task after startup."""
+    for name in MELODIES:
+        render_melody(name)
+
+
+def _play(name):
+    import winsound
+
+    wav = render_melody(name)
+    # PlaySound blocks until the melody is over, so this measures render-to-end time
+    with AUDIO_LATENCY.time(stage="play", melody=name):
+        winsound.PlaySound(wav, winsound.SND_MEMORY)
+
 
 def play_celebratory_melody():
     try:
         logging.debug("Attempting to play melody.")
-        # Create a celebratory melody with a sequence of notes
-        durations = [250, 250, 300, 200, 250, 300, 450]  # Durations in milliseconds
-        notes = [
-            Sine(523),  # C5
-            Sine(587),  # D5
-            Sine(659),  # E5
-            Sine(784),  # G5
-            Sine(880),  # A5
-            Sine(988),  # B5
-            Sine(1046),  # C6
-        ]
-
-        # Initial and final volumes as a percentage
-        initial_volume = 0.1
-        final_volume = 0.5
-
-        # Calculate the volume increase per note
-        volume_step = (final_volume - initial_volume) / (len(notes) - 1)
-        segments = []
-
-        for i, note in enumerate(notes):
-            volume = initial_volume + i * volume_step
-            segment = note.to_audio_segment(duration=durations[i]).apply_gain(
-                20 * log10(volume)
-            )
-            segments.append(segment)
-
-        melody = sum(segments)
-        # Save the generated melody to a temporary WAV file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmpfile:
-            melody.export(tmpfile.name, format="wav")
-            # Play the WAV file
-            winsound.PlaySound(tmpfile.name, winsound.SND_FILENAME)
-            logging.debug("Melody finished playing.")
-        # Clean up the temporary file
-        os.remove(tmpfile.name)
+        _play("celebratory")
+        logging.debug("Melody finished playing.")
     except Exception as e:
         logging.error("Error occurred while attempting to play melody: %s", e)
 
@@ -53,42 +84,8 @@ def play_celebratory_melody():
 def play_rest_end_melody():
     try:
         logging.debug("Attempting to play rest end melody.")
-        # Create an inspiring melody with a sequence of notes
-        durations = [400, 400, 400, 600, 400, 400, 400]  # Durations in milliseconds
-        notes = [
-            Sine(261),  # C4
-            Sine(329),  # E4
-            Sine(392),  # G4
-            Sine(523),  # C5
-            Sine(659),  # E5
-            Sine(784),  # G5
-            Sine(1046),  # C6
-        ]
-
-        # Initial and final volumes as a percentage
-        initial_volume = 0.2
-        final_volume = 0.6
-
-        # Calculate the volume increase per note
-        volume_step = (final_volume - initial_volume) / (len(notes) - 1)
-        segments = []
-
-        for i, note in enumerate(notes):
-            volume = initial_volume + i * volume_step
-            segment = note.to_audio_segment(duration=durations[i]).apply_gain(
-                20 * log10(volume)
-            )
-            segments.append(segment)
-
-        melody = sum(segments)
-        # Save the generated melody to a temporary WAV file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmpfile:
-            melody.export(tmpfile.name, format="wav")
-            # Play the WAV file
-            winsound.PlaySound(tmpfile.name, winsound.SND_FILENAME)
-            logging.debug("Melody finished playing.")
-        # Clean up the temporary file
-        os.remove(tmpfile.name)
+        _play("rest_end")
+        logging.debug("Melody finished playing.")
     except Exception as e:
         logging.error("Error occurred while attempting to play rest end melody: %s", e)
 
@@ -96,37 +93,7 @@ def play_rest_end_melody():
 def play_bell_sound():
     try:
         logging.debug("Attempting to play bell sound.")
-        # Create a bell sound with a sequence of notes
-        durations = [500, 500, 500]  # Durations in milliseconds
-        notes = [
-            Sine(659),  # E5
-            Sine(784),  # G5
-            Sine(988),  # B5
-        ]
-
-        # Initial and final volumes as a percentage
-        initial_volume = 0.3
-        final_volume = 0.7
-
-        # Calculate the volume increase per note
-        volume_step = (final_volume - initial_volume) / (len(notes) - 1)
-        segments = []
-
-        for i, note in enumerate(notes):
-            volume = initial_volume + i * volume_step
-            segment = note.to_audio_segment(duration=durations[i]).apply_gain(
-                20 * log10(volume)
-            )
-            segments.append(segment)
-
-        bell_sound = sum(segments)
-        # Save the generated bell sound to a temporary WAV file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmpfile:
-            bell_sound.export(tmpfile.name, format="wav")
-            # Play the WAV file
-            winsound.PlaySound(tmpfile.name, winsound.SND_FILENAME)
-            logging.debug("Bell sound finished playing.")
-        # Clean up the temporary file
-        os.remove(tmpfile.name)
+        _play("bell")
+        logging.debug("Bell sound finished playing.")
     except Exception as e:
         logging.error("Error occurred while attempting to play bell sound: %s", e)
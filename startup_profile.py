@@ -0,0 +1,163 @@
+"""
+Startup profiler.
+
+Run with `--profile-startup` (or set XBITO_PROFILE_STARTUP=1) to record the
+wall time of every startup phase: each module import, QApplication creation,
+settings loading, every setup_* method, the first paint and the deferred
+startup tasks. Once startup is over a Chrome trace file (startup_profile.json,
+viewable in chrome://tracing, Perfetto or speedscope) is written next to the
+database and a summary sorted by duration is printed.
+
+When profiling is off the decorators return the functions untouched, so
+there is no cost outside of profiling runs.
+"""
+
+import builtins
+import functools
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+ENV_VAR = "XBITO_PROFILE_STARTUP"
+FLAG = "--profile-startup"
+
+_enabled = False
+_events = []  # [name, category, start, duration, depth]
+_depth = 0
+_origin = time.perf_counter()
+_original_import = builtins.__import__
+
+
+def requested(argv=None):
+    """Whether profiling was asked for on the command line or in the environment."""
+    argv = sys.argv if argv is None else argv
+    return FLAG in argv or os.environ.get(ENV_VAR, "") not in ("", "0")
+
+
+def enable():
+    """Start recording. Imports are timed from this point on."""
+    global _enabled
+    if _enabled:
+        return
+    _enabled = True
+    builtins.__import__ = _timed_import
+
+
+def enable_if_requested():
+    if requested():
+        enable()
+
+
+def is_enabled():
+    return _enabled
+
+
+def _record(name, category, start, duration, depth):
+    _events.append([name, category, start - _origin, duration, depth])
+
+
+@contextmanager
+def phase(name, category="phase"):
+    """Time the enclosed block as one phase."""
+    global _depth
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter()
+    depth = _depth
+    _depth += 1
+    try:
+        yield
+    finally:
+        _depth -= 1
+        _record(name, category, start, time.perf_counter() - start, depth)
+
+
+def profiled(func):
+    """Decorator timing every call of func as a phase while profiling is on."""
+    if not _enabled:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with phase(func.__qualname__):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def mark(name):
+    """Record an instant, e.g. the first frame."""
+    if _enabled:
+        _record(name, "mark", time.perf_counter(), 0.0, _depth)
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    if level or name in sys.modules:
+        return _original_import(name, globals, locals, fromlist, level)
+    with phase(name, "import"):
+        return _original_import(name, globals, locals, fromlist, level)
+
+
+def self_times():
+    """Duration of every event minus the time spent in the events nested in it."""
+    times = [event[3] for event in _events]
+    # Events are recorded when they end, so children come before their parent
+    open_children = {}
+    for index, (_, _, _, duration, depth) in enumerate(_events):
+        times[index] -= open_children.pop(depth + 1, 0.0)
+        open_children[depth] = open_children.get(depth, 0.0) + duration
+    return times
+
+
+def trace():
+    """Recorded events in the Chrome trace event format."""
+    events = []
+    for name, category, start, duration, _ in _events:
+        event = {
+            "name": name,
+            "cat": category,
+            "ts": round(start * 1e6),
+            "pid": os.getpid(),
+            "tid": 0,
+        }
+        if category == "mark":
+            event.update(ph="i", s="g")
+        else:
+            event.update(ph="X", dur=round(duration * 1e6))
+        events.append(event)
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def summary(limit=25):
+    """Text table of the slowest events by self time."""
+    rows = sorted(
+        zip(_events, self_times()), key=lambda row: row[1], reverse=True
+    )
+    lines = [f"{'self ms':>9} {'total ms':>9}  {'kind':<7} name"]
+    for (name, category, start, duration, _), self_time in rows[:limit]:
+        if category == "mark":
+            continue
+        lines.append(
+            f"{self_time * 1000:9.1f} {duration * 1000:9.1f}  {category:<7} {name}"
+        )
+    for name, category, start, _, _ in _events:
+        if category == "mark":
+            lines.append(f"{name} at {start * 1000:.1f} ms")
+    return "\n".join(lines)
+
+
+def finish(path):
+    """Stop recording, write the trace to path and print the summary."""
+    global _enabled
+    if not _enabled:
+        return
+    _enabled = False
+    builtins.__import__ = _original_import
+    with open(path, "w") as trace_file:
+        json.dump(trace(), trace_file)
+    if sys.stdout is not None:  # Windowed builds have no console
+        print(summary())
+        print(f"Startup trace written to {path}")
@@ -0,0 +1,33 @@
+"""
+Built-in session lifecycle subscribers: persistence and sounds.
+
+Both run on the event bus worker pool, so database writes and melodies never
+block the timer. Plugins follow the same shape: a module with register(bus).
+"""
+
+from db import insert_pomodoro_session, update_pomodoro_session
+from events import SESSION_STARTED, COMPLETED
+from sound import play_celebratory_melody, play_rest_end_melody
+from timer_core import FOCUS
+
+
+def record_session(event):
+    """Open a session row when Focus starts and close it when Focus completes."""
+    if event.name == SESSION_STARTED:
+        insert_pomodoro_session(event.data["start_time"], None, None)  # No status needed until completion
+    elif event.data["finished_type"] == FOCUS:
+        update_pomodoro_session(event.data["start_time"], event.data["end_time"], "pending")
+
+
+def play_session_sound(event):
+    """Celebrate a completed Focus session, or chime at the end of a break."""
+    if event.data["finished_type"] == FOCUS:
+        play_celebratory_melody()
+    else:
+        play_rest_end_melody()
+
+
+def register(bus):
+    # One subscription for both events so the insert always comes before the update
+    bus.subscribe(record_session, (SESSION_STARTED, COMPLETED), "persistence")
+    bus.subscribe(play_session_sound, (COMPLETED,), "audio")
@@ -1,8 +1,8 @@
 import sys
 import pytest
 from PySide6.QtWidgets import QApplication
-from PySide6.QtGui import QColor
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtGui import QColor, QGradient, QLinearGradient
+from PySide6.QtCore import Qt, QSize, QPoint
 from MultiColorProgressBar import MultiColorProgressBar
 
 # Create a Qt application for the tests
@@ -124,6 +124,56 @@ class TestMultiColorProgressBar:
             
             assert sections == expected_sections, f"At {value}%, expected {expected_sections} section(s), got {sections}"
 
+    def test_bands_are_rendered_once_per_size(self, app):
+        """Value changes reuse the band pixmap, a resize or new colors render it again."""
+        progress_bar = MultiColorProgressBar()
+        progress_bar.resize(QSize(200, 30))
+        progress_bar.setValue(40)
+        bands = progress_bar.bands()
+        progress_bar.setValue(60)
+        assert progress_bar.bands() is bands
+        progress_bar.resize(QSize(300, 30))
+        assert progress_bar.bands() is not bands
+        resized = progress_bar.bands()
+        progress_bar.colors = [(0.0, 1.0, QColor("#2196F3"))]
+        assert progress_bar.bands() is not resized
+
+    def test_band_colors(self, app):
+        """Any number of sections, plain colors or gradients."""
+        progress_bar = MultiColorProgressBar()
+        progress_bar.resize(QSize(100, 10))
+        gradient = QLinearGradient(0, 0, 1, 0)
+        gradient.setColorAt(0, QColor("#000000"))
+        gradient.setColorAt(1, QColor("#0000FF"))
+        progress_bar.colors = [
+            (0.0, 0.25, QColor("#FF0000")),
+            (0.25, 0.5, QColor("#00FF00")),
+            (0.5, 1.0, gradient),
+        ]
+        image = progress_bar.bands().toImage()
+        assert image.pixelColor(10, 5).name() == "#ff0000"
+        assert image.pixelColor(30, 5).name() == "#00ff00"
+        assert image.pixelColor(52, 5).blue() < image.pixelColor(97, 5).blue()
+        assert gradient.coordinateMode() == QGradient.LogicalMode  # Not changed by the bar
+
+    def test_set_value_repaints_only_the_change(self, app, monkeypatch):
+        """Only the part of the fill that changed and the text are repainted."""
+        progress_bar = MultiColorProgressBar()
+        progress_bar.resize(QSize(200, 30))
+        progress_bar.setValue(10)
+        updates = []
+        monkeypatch.setattr(progress_bar, "update", lambda *region: updates.append(region))
+        progress_bar.setValue(20)
+        progress_bar.setValue(20)
+        assert len(updates) == 1
+        region = updates[0][0]
+        assert region.contains(QPoint(30, 15))  # The fill between 10% and 20%
+        assert region.contains(progress_bar.rect().center())  # The text
+        assert not region.contains(QPoint(5, 15))
+        assert not region.contains(QPoint(190, 15))
+        assert progress_bar.value() == 20
+        assert progress_bar.updatesEnabled()
+
 
 if __name__ == "__main__":
     pytest.main(["-v", "test_MultiColorProgressBar.py"])
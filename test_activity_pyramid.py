@@ -0,0 +1,52 @@
+from datetime import date
+
+from activity_pyramid import ActivityPyramid, DAY, WEEK, MONTH, WEEKS_PER_YEAR
+
+
+def test_levels_are_sums_of_days():
+    # 2020-12-30 is a Wednesday in ISO week 53 of 2020
+    pyramid = ActivityPyramid.from_daily_counts(date(2020, 12, 30), date(2021, 1, 4), [1, 2, 0, 3, 0, 4])
+    assert pyramid.start == date(2020, 12, 28)
+    assert list(pyramid.days) == [0, 0, 1, 2, 0, 3, 0, 4]
+    assert pyramid.weeks[pyramid.week_index(date(2020, 12, 30))] == 6  # Dec 30 - Jan 3
+    assert pyramid.weeks[pyramid.week_index(date(2021, 1, 4))] == 4
+    assert sum(pyramid.weeks) == sum(pyramid.months) == 10
+    assert pyramid.months[pyramid.month_index(date(2020, 12, 1))] == 3
+    assert pyramid.years(WEEK) == [2020, 2021]
+    assert pyramid.years(MONTH) == [2020, 2021]
+
+
+def test_add_updates_every_level():
+    pyramid = ActivityPyramid(date(2024, 1, 1), date(2024, 12, 31))
+    pyramid.add(date(2024, 7, 4), 2)
+    pyramid.add(date(2024, 7, 4), -1)
+    pyramid.add(date(2023, 7, 4), 5)  # Out of range, ignored
+    assert pyramid.days[(date(2024, 7, 4) - pyramid.start).days] == 1
+    assert pyramid.weeks[26] == 1  # ISO week 27
+    assert pyramid.months[6] == 1
+
+
+def test_periods():
+    pyramid = ActivityPyramid(date(2024, 1, 3), date(2024, 7, 4))
+    assert pyramid.period(DAY, 2) == (date(2024, 1, 3), date(2024, 1, 3))
+    assert pyramid.period(WEEK, 25) == (date(2024, 6, 24), date(2024, 6, 30))
+    assert pyramid.period(MONTH, 6) == (date(2024, 7, 1), date(2024, 7, 4))  # Clipped to the end
+    assert pyramid.exists(MONTH, 6)
+    assert not pyramid.exists(MONTH, 7)  # August has not come yet
+    assert not pyramid.exists(WEEK, WEEKS_PER_YEAR - 1)  # 2024 has 52 ISO weeks
+
+
+def test_set_adjusts_every_level():
+    pyramid = ActivityPyramid.from_daily_counts(date(2024, 7, 1), date(2024, 7, 7), [1, 2, 0, 0, 0, 0, 3])
+    pyramid.set(date(2024, 7, 2), 5)
+    assert list(pyramid.days) == [1, 5, 0, 0, 0, 0, 3]
+    assert pyramid.weeks[pyramid.week_index(date(2024, 7, 1))] == 9
+    assert pyramid.months[pyramid.month_index(date(2024, 7, 1))] == 9
+
+
+def test_negative_values_are_kept():
+    """A day can go below zero, e.g. after an edit put a session's end before its start"""
+    pyramid = ActivityPyramid.from_daily_counts(date(2024, 7, 1), date(2024, 7, 7), [1, 0, 0, 0, 0, 0, 0])
+    pyramid.set(date(2024, 7, 2), -3)
+    assert pyramid.days[1] == -3
+    assert pyramid.weeks[pyramid.week_index(date(2024, 7, 1))] == -2
@@ -0,0 +1,58 @@
+from datetime import date, datetime
+
+import analytics
+import db
+from analytics import compute, productivity_analytics, rolling_averages, streaks
+from clock import VirtualClock, set_clock
+
+
+def epoch(text):
+    return int((datetime.fromisoformat(text) - datetime(1970, 1, 1)).total_seconds())
+
+
+def test_streaks():
+    assert streaks([1, 1, 0, 1, 1, 1, 0, 0]) == (0, 3)  # Nothing yesterday nor today
+    assert streaks([1, 1, 0, 1, 1, 1]) == (3, 3)
+    assert streaks([1, 0, 1, 1, 0]) == (2, 2)  # Today can still be added to
+    assert streaks([0]) == (0, 0)
+
+
+def test_rolling_averages():
+    assert list(rolling_averages([2, 4, 6, 8], 2)) == [2, 3, 5, 7]
+
+
+def test_compute():
+    # 2024-07-01 is a Monday
+    starts = [epoch("2024-07-01 09:00"), epoch("2024-07-01 14:00"), epoch("2024-07-02 09:30"), epoch("2024-07-03 10:00")]
+    seconds = [1500, -1, 1800, 1200]
+    result = compute(starts, seconds, date(2024, 7, 3))
+    assert (result["current_streak"], result["longest_streak"]) == (3, 3)
+    assert result["hour_minutes"][9] == 55 and result["hour_minutes"][14] == 0
+    assert result["weekday_minutes"][:3] == [25, 30, 20]
+    assert result["median_session_minutes"] == 25
+    assert (result["completed"], result["abandoned"], result["completion_rate"]) == (3, 1, 0.75)
+    assert result["first_day"] == date(2024, 7, 1)
+    assert list(result["rolling_minutes"][7]) == [25, 27.5, 25]
+
+
+def test_compute_without_sessions():
+    result = compute([], [], date(2024, 7, 3))
+    assert result["completion_rate"] == 0.0
+    assert result["median_session_minutes"] == 0
+    assert list(result["rolling_minutes"][30]) == [0]
+
+
+def test_cached_by_write_version(temp_db, monkeypatch):
+    monkeypatch.setattr(analytics, "_cache", {})
+    previous = set_clock(VirtualClock(datetime(2024, 7, 5, 12, 0)))
+    try:
+        db.insert_pomodoro_session("2024-07-05 09:00:00", "2024-07-05 09:25:00", None)
+        first = productivity_analytics()
+        assert first["current_streak"] == 1
+        assert productivity_analytics() is first
+        db.insert_pomodoro_session("2024-07-04 09:00:00", "2024-07-04 09:25:00", None)
+        second = productivity_analytics()
+        assert second is not first
+        assert second["current_streak"] == 2
+    finally:
+        set_clock(previous)
@@ -1,17 +1,41 @@
 import pytest
+from datetime import datetime
+from unittest.mock import MagicMock
 from PySide6.QtCore import Qt, QDate
 from app import XbitoPomodoro
+from clock import VirtualClock, set_clock
 
 
 @pytest.fixture
-def app(qtbot):
-    """Create an instance of the XbitoPomodoro app"""
+def virtual_clock():
+    """Replace the app clock with a VirtualClock for time-travel tests"""
+    clock = VirtualClock(datetime(2024, 7, 4, 8, 0))
+    previous = set_clock(clock)
+    yield clock
+    set_clock(previous)
+
+
+@pytest.fixture
+def app(qtbot, virtual_clock, temp_db):
+    """Create an instance of the XbitoPomodoro app running on a virtual clock"""
     phrase = "Stay focused and keep working!"
     pomodoro_app = XbitoPomodoro(qtbot, phrase)
     qtbot.addWidget(pomodoro_app)
     return pomodoro_app
 
 
+@pytest.fixture
+def quiet_app(virtual_clock, qtbot, monkeypatch, temp_db):
+    """An app running on the virtual clock, with sounds and dialogs disabled"""
+    monkeypatch.setattr("subscribers.play_celebratory_melody", lambda: None)
+    monkeypatch.setattr("subscribers.play_rest_end_melody", lambda: None)
+    monkeypatch.setattr("app.play_bell_sound", lambda: None)
+    pomodoro_app = XbitoPomodoro(qtbot, "Stay focused and keep working!")
+    pomodoro_app.show_dialog = MagicMock()
+    qtbot.addWidget(pomodoro_app)
+    return pomodoro_app
+
+
 def test_start_pause_button_initial_state(app):
     """Check the initial state of the start/pause button"""
     assert app.start_pause_button.text() == "Start"
@@ -37,14 +61,14 @@ def test_pause_button_pauses_timer(app, qtbot):
     assert not app.is_timer_running
 
 
-def test_timer_countdown(app, qtbot):
+def test_timer_countdown(app, qtbot, virtual_clock):
     """Check if the timer countdowns correctly"""
     # Start the timer
     qtbot.mouseClick(app.start_pause_button, Qt.LeftButton)
     assert app.is_timer_running
 
-    # Wait for a few seconds to let the timer countdown
-    qtbot.wait(2000)  # Wait for 2 seconds
+    # Let a few seconds pass to let the timer countdown
+    virtual_clock.advance(2)  # Advance 2 seconds
 
     # Check if the remaining seconds have decreased
     assert app.remaining_seconds < app.initial_seconds
@@ -56,8 +80,8 @@ def test_timer_countdown(app, qtbot):
     # Store the remaining seconds
     remaining_seconds = app.remaining_seconds
 
-    # Wait for a few seconds to ensure the timer is paused
-    qtbot.wait(2000)
+    # Let a few seconds pass to ensure the timer is paused
+    virtual_clock.advance(2)
 
     # Check if the remaining seconds have not changed
     assert app.remaining_seconds == remaining_seconds
@@ -66,7 +90,7 @@ def test_timer_countdown(app, qtbot):
 def test_date_month_year_day_label(app, qtbot):
     """Check if the date, month, year, and day labels are displayed correctly"""
     # Check if the date, month, year, and day labels are displayed
-    current_date = QDate.currentDate()
+    current_date = QDate(2024, 7, 4)
     assert app.date_label.text() == current_date.toString("dd")
     assert app.month_label.text() == current_date.toString("MMM")
     assert app.year_label.text() == current_date.toString("yyyy")
@@ -94,3 +118,86 @@ def test_reverse_forward_buttons(app, qtbot):
     initial_seconds = app.remaining_seconds
     qtbot.mouseClick(app.fast_reverse_button, Qt.LeftButton)
     assert app.remaining_seconds < initial_seconds
+
+
+def test_full_day_of_pomodoros(quiet_app, virtual_clock):
+    """A full day of Focus/Rest sessions runs on the virtual clock in milliseconds"""
+    labels = []
+    for _ in range(8):
+        quiet_app.click_start_timer()
+        virtual_clock.advance(quiet_app.remaining_seconds)
+        labels.append(quiet_app.timer_type_label.text())
+    assert labels == ["Next: Rest", "Next: Focus", "Next: Long Rest", "Next: Focus"] * 2
+    assert quiet_app.completed_sessions == 4
+    assert quiet_app.tree_widget.stage == 4
+    assert not quiet_app.is_timer_running
+
+
+def test_midnight_rollover(quiet_app, virtual_clock):
+    """The date labels and the tree reset after midnight"""
+    quiet_app.click_start_timer()
+    virtual_clock.advance(quiet_app.remaining_seconds)
+    assert quiet_app.completed_sessions == 1
+    virtual_clock.advance_to(datetime(2024, 7, 5, 0, 30))
+    assert quiet_app.date_label.text() == "05"
+    assert quiet_app.day_label.text() == "Friday"
+    assert quiet_app.completed_sessions == 0
+    assert quiet_app.tree_widget.stage == 1
+
+
+def test_session_alert_snooze(quiet_app, virtual_clock):
+    """The idle alert fires after the alert delay and again after a snooze"""
+    virtual_clock.advance(quiet_app.session_alert_miliseconds / 1000)
+    assert quiet_app.show_dialog.call_count == 1
+    assert quiet_app.show_dialog.call_args.kwargs["show_snooze"]
+    quiet_app.handle_snooze(MagicMock(), 5)
+    virtual_clock.advance(4 * 60)
+    assert quiet_app.show_dialog.call_count == 1
+    virtual_clock.advance(60)
+    assert quiet_app.show_dialog.call_count == 2
+
+
+def test_power_save_wakes_only_at_session_deadline(quiet_app, virtual_clock):
+    """A hidden window skips the per-second countdown and wakes exactly at the deadline"""
+    quiet_app.update_power_mode()  # The test window is never shown
+    assert quiet_app.scheduler.power_save
+    quiet_app.click_start_timer()
+    wakeups = quiet_app.scheduler.wakeups
+    virtual_clock.advance(quiet_app.initial_seconds - 1)
+    assert quiet_app.is_timer_running
+    virtual_clock.advance(1)
+    assert not quiet_app.is_timer_running
+    assert quiet_app.timer_type_label.text() == "Next: Rest"
+    assert quiet_app.scheduler.wakeups - wakeups < 10
+
+
+def test_resume_from_suspend_resyncs(quiet_app, virtual_clock):
+    """A session that ended during suspend completes on resume and the date is refreshed"""
+    virtual_clock.advance_to(datetime(2024, 7, 4, 23, 50))
+    quiet_app.click_start_timer()
+    virtual_clock.suspend(8 * 3600)
+    virtual_clock.advance(1)
+    assert not quiet_app.is_timer_running
+    assert quiet_app.timer_type_label.text() == "Next: Rest"
+    assert quiet_app.date_label.text() == "05"
+    assert quiet_app.completed_sessions == 0
+
+
+def test_handle_remote_command(quiet_app, virtual_clock):
+    """Arguments forwarded by a second launch control the timer and get the status back"""
+    assert quiet_app.handle_remote_command(["--start"]) == "Focus 30:00 (running)"
+    virtual_clock.advance(60)
+    assert quiet_app.handle_remote_command(["--status"]) == "Focus 29:00 (running)"
+    assert quiet_app.handle_remote_command(["--pause"]) == "Focus 29:00 (stopped)"
+    assert quiet_app.handle_remote_command(["--reset"]) == "Focus 30:00 (stopped)"
+
+
+def test_progress_bar_wakes_only_when_the_percent_changes(quiet_app, virtual_clock):
+    """From 5 AM to 11 PM a percent lasts 10.8 minutes, the job sleeps until the next one"""
+    assert quiet_app.progress_bar.value() == 16  # 3 of 18 hours
+    assert quiet_app.progress_bar_job.due_in() == pytest.approx(216)  # 17% is at 08:03:36
+    virtual_clock.advance(215)
+    assert quiet_app.progress_bar.value() == 16
+    virtual_clock.advance(1)
+    assert quiet_app.progress_bar.value() == 17
+    assert quiet_app.progress_bar_job.due_in() == pytest.approx(648)
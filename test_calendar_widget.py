@@ -0,0 +1,84 @@
+import time
+from array import array
+from datetime import date
+
+import pytest
+from PySide6.QtGui import QColor
+
+import calendar_widget
+from calendar_widget import CalendarWidget, add_months, render_month
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """Months read from the database, the data is 25 minutes on every day"""
+    loaded = []
+
+    def fake_fetch(start, end):
+        loaded.append(start)
+        return array("L", [1500] * ((end - start).days + 1))
+
+    monkeypatch.setattr(calendar_widget, "fetch_daily_focus_seconds", fake_fetch)
+    return loaded
+
+
+@pytest.fixture
+def calendar(qtbot, loads):
+    widget = CalendarWidget()
+    qtbot.addWidget(widget)
+    widget.resize(widget.sizeHint())
+    return widget
+
+
+def test_add_months():
+    assert add_months(date(2024, 12, 1), 1) == date(2025, 1, 1)
+    assert add_months(date(2024, 1, 1), -1) == date(2023, 12, 1)
+
+
+def test_render_month_shades_focus_days(qapp):
+    seconds = array("L", [0] * 31)
+    seconds[3] = 120 * 60
+    colors = {"text": QColor("white"), "focus": QColor(0, 200, 0)}
+    image = render_month(date(2024, 7, 1), seconds, 350, 286, 1.0, colors)
+    # July 2024 starts on a Monday: the 4th is the fourth cell of the first row
+    assert image.pixelColor(3 * 50 + 25, 28 + 18 + 4).alpha() == 255
+    assert image.pixelColor(1 * 50 + 25, 28 + 18 + 4).alpha() == 0
+
+
+def test_neighbours_are_prefetched(calendar, loads, qtbot):
+    calendar.show_month(date(2024, 7, 15))
+    assert calendar.month == date(2024, 7, 1)
+    qtbot.waitUntil(lambda: len(calendar.images) == 2)
+    assert sorted(loads) == [date(2024, 6, 1), date(2024, 8, 1)]
+    calendar.next_month()
+    calendar.repaint()
+    assert date(2024, 8, 1) in calendar.focus_seconds
+    assert loads.count(date(2024, 8, 1)) == 1  # August was ready, no query when shown
+    qtbot.waitUntil(lambda: date(2024, 9, 1) in calendar.focus_seconds)
+
+
+def test_refresh_drops_the_loaded_months(calendar, loads, qtbot):
+    calendar.show_month(date(2024, 7, 1))
+    qtbot.waitUntil(lambda: len(calendar.focus_seconds) == 2)
+    calendar.refresh()
+    assert calendar.generation == 1
+    qtbot.waitUntil(lambda: len(calendar.focus_seconds) == 2)
+    assert loads.count(date(2024, 6, 1)) == 2
+
+
+def test_invalidate_months_waits_for_prefetches(calendar, loads, monkeypatch):
+    load = calendar.load
+    monkeypatch.setattr(calendar, "load", lambda month: time.sleep(0.05) or load(month))
+    calendar.show_month(date(2024, 7, 1))
+    futures = list(calendar.futures)
+    calendar.invalidate_months({date(2024, 7, 1)})
+    assert len(futures) == 2  # The first load is still running when the second is queued
+    assert all(future.done() for future in futures)
+
+
+def test_closing_stops_the_prefetcher(calendar, loads):
+    calendar.show_month(date(2024, 7, 1))
+    futures = list(calendar.futures)
+    calendar.close()
+    assert calendar.prefetcher is None
+    assert all(future.done() for future in futures)
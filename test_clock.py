@@ -0,0 +1,144 @@
+from datetime import datetime
+from clock import VirtualClock, SystemClock, ClockJumpDetector, get_clock, set_clock
+
+
+def test_advance_moves_wall_and_monotonic_time():
+    """Wall time and monotonic time move together"""
+    clock = VirtualClock(datetime(2024, 7, 4, 23, 59))
+    clock.advance(120)
+    assert clock.now() == datetime(2024, 7, 5, 0, 1)
+    assert clock.today().day == 5
+    assert clock.monotonic() == 120
+
+
+def single_shot(clock, seconds, callback):
+    timer = clock.timer(callback)
+    timer.setSingleShot(True)
+    timer.start(int(seconds * 1000))
+    return timer
+
+
+def test_timers_fire_in_order():
+    """Timers fire in deadline order with the clock set to their deadline"""
+    clock = VirtualClock()
+    fired = []
+    single_shot(clock, 20, lambda: fired.append(("b", clock.monotonic())))
+    single_shot(clock, 10, lambda: fired.append(("a", clock.monotonic())))
+    clock.advance(5)
+    assert fired == []
+    clock.advance(100)
+    assert fired == [("a", 10), ("b", 20)]
+    assert clock.monotonic() == 105
+
+
+def test_periodic_timer():
+    """A timer keeps firing at its interval until stopped"""
+    clock = VirtualClock()
+    ticks = []
+    timer = clock.timer(lambda: ticks.append(clock.monotonic()))
+    timer.start(1000)
+    clock.advance(3.5)
+    assert ticks == [1, 2, 3]
+    assert timer.remainingTime() == 500
+    timer.stop()
+    clock.advance(10)
+    assert ticks == [1, 2, 3]
+    assert not timer.isActive()
+    assert clock.pending() == 0
+
+
+def test_single_shot_timer_restart():
+    """Restarting a single-shot timer pushes its deadline back"""
+    clock = VirtualClock()
+    fired = []
+    timer = clock.timer(lambda: fired.append(clock.monotonic()))
+    timer.setSingleShot(True)
+    timer.start(10000)
+    clock.advance(8)
+    timer.start(10000)
+    clock.advance(8)
+    assert fired == []
+    clock.advance(100)
+    assert fired == [18]
+    assert not timer.isActive()
+
+
+def test_timers_started_while_advancing():
+    """Timers started from a callback fire within the same advance()"""
+    clock = VirtualClock()
+    fired = []
+    inner = clock.timer(lambda: fired.append(clock.monotonic()))
+    inner.setSingleShot(True)
+    single_shot(clock, 1, lambda: inner.start(1000))
+    clock.advance(5)
+    assert fired == [2]
+
+
+def test_advance_to():
+    """advance_to() moves to a given wall time"""
+    clock = VirtualClock(datetime(2024, 7, 4, 8, 0))
+    clock.advance_to(datetime(2024, 7, 4, 9, 30))
+    assert clock.monotonic() == 5400
+
+
+def test_set_clock_returns_previous():
+    """set_clock() swaps the process-wide clock"""
+    virtual = VirtualClock()
+    previous = set_clock(virtual)
+    try:
+        assert isinstance(previous, SystemClock)
+        assert get_clock() is virtual
+    finally:
+        set_clock(previous)
+
+
+def test_detector_ignores_normal_time():
+    """No jump is reported while both clocks move together"""
+    clock = VirtualClock()
+    detector = ClockJumpDetector(clock)
+    clock.advance(3600)
+    assert detector.check() is None
+
+
+def test_detector_suspend():
+    """A suspend moves the wall clock but not the monotonic clock"""
+    clock = VirtualClock()
+    detector = ClockJumpDetector(clock)
+    clock.advance(10)
+    clock.suspend(3600)
+    jump = detector.check()
+    assert jump.kind == "suspend"
+    assert jump.drift == 3600
+    assert detector.check() is None
+
+
+def test_detector_late_wakeup_is_suspend():
+    """Where monotonic time runs during suspend, a very late wakeup is a suspend"""
+    clock = VirtualClock()
+    detector = ClockJumpDetector(clock)
+    clock.advance(3600)
+    jump = detector.check(missed=3540)
+    assert jump.kind == "suspend"
+    assert jump.drift == 0
+
+
+def test_detector_clock_jump():
+    """Setting the wall clock back is a clock jump"""
+    clock = VirtualClock()
+    detector = ClockJumpDetector(clock)
+    clock.jump(-120)
+    jump = detector.check()
+    assert jump.kind == "clock_jump"
+    assert jump.drift == -120
+
+
+def test_detector_utc_offset_change():
+    """A DST change shifts local time without any drift in UTC"""
+    clock = VirtualClock(datetime(2024, 3, 31, 1, 59), utc_offset=3600)
+    detector = ClockJumpDetector(clock)
+    clock.advance(60)
+    clock.set_utc_offset(7200)
+    assert clock.now() == datetime(2024, 3, 31, 3, 0)
+    jump = detector.check()
+    assert jump.kind == "utc_offset"
+    assert jump.drift == 3600
@@ -0,0 +1,166 @@
+import asyncio
+import json
+import socket
+from datetime import datetime
+
+import pytest
+
+import daemon
+import subscribers
+from clock import VirtualClock
+from timer_core import FOCUS, REST
+
+
+@pytest.fixture
+def quiet(monkeypatch):
+    """Record database writes and sounds instead of performing them"""
+    calls = []
+    monkeypatch.setattr(daemon, "get_settings", lambda defaults: dict(defaults))
+    monkeypatch.setattr(subscribers, "insert_pomodoro_session", lambda *args: calls.append(("insert",) + args))
+    monkeypatch.setattr(subscribers, "update_pomodoro_session", lambda *args: calls.append(("update",) + args))
+    for module, name in (
+        (daemon, "play_bell_sound"),
+        (subscribers, "play_celebratory_melody"),
+        (subscribers, "play_rest_end_melody"),
+    ):
+        monkeypatch.setattr(module, name, lambda name=name: calls.append((name,)))
+    return calls
+
+
+def test_focus_session_runs_to_completion(quiet):
+    """A started Focus session completes on its own, is recorded and queues the Rest"""
+    clock = VirtualClock(datetime(2024, 7, 4, 8, 0))
+    timer_daemon = daemon.TimerDaemon(clock)
+    events = []
+    timer_daemon.listeners.append(events.append)
+    reply = timer_daemon.handle_command({"command": "start"})
+    assert reply["ok"] and reply["status"]["is_running"]
+    clock.advance(1800)
+    assert [event["event"] for event in events] == ["started", "completed"]
+    status = events[-1]["status"]
+    assert status["session_type"] == REST
+    assert status["label"] == "Next: Rest"
+    assert status["completed_sessions"] == 1
+    timer_daemon.events.flush()
+    assert quiet == [
+        ("insert", "2024-07-04 08:00:00", None, None),
+        ("update", "2024-07-04 08:00:00", "2024-07-04 08:30:00", "pending"),
+        ("play_celebratory_melody",),
+    ]
+
+
+def test_pause_adjust_and_resume(quiet):
+    """Pausing keeps the time left, resuming does not open a second session row"""
+    clock = VirtualClock()
+    timer_daemon = daemon.TimerDaemon(clock)
+    timer_daemon.handle_command({"command": "start"})
+    clock.advance(600)
+    reply = timer_daemon.handle_command({"command": "pause"})
+    assert reply["status"]["remaining_seconds"] == 1200
+    reply = timer_daemon.handle_command({"command": "adjust", "minutes": -10})
+    assert reply["status"]["remaining_seconds"] == 600
+    clock.advance(3600)
+    timer_daemon.handle_command({"command": "start"})
+    clock.advance(600)
+    assert timer_daemon.timer.session_type == REST
+    timer_daemon.events.flush()
+    assert [call[0] for call in quiet].count("insert") == 1
+
+
+def test_idle_alert(quiet):
+    """When no session is started the bell rings and subscribers are told"""
+    clock = VirtualClock()
+    timer_daemon = daemon.TimerDaemon(clock)
+    events = []
+    timer_daemon.listeners.append(events.append)
+    clock.advance(daemon.SESSION_ALERT_SECONDS)
+    assert ("play_bell_sound",) in quiet
+    assert events[-1]["event"] == "alert"
+
+
+def test_invalid_commands(quiet):
+    """Unknown commands and bad arguments are answered with an error"""
+    timer_daemon = daemon.TimerDaemon(VirtualClock())
+    assert not timer_daemon.handle_command({"command": "explode"})["ok"]
+    assert not timer_daemon.handle_command({"command": "adjust", "minutes": "x"})["ok"]
+    assert not timer_daemon.handle_command(["start"])["ok"]
+    assert timer_daemon.timer.session_type == FOCUS
+
+
+def test_parse_address():
+    assert daemon.parse_address("127.0.0.1:8000") == ("127.0.0.1", 8000)
+    assert daemon.parse_address("/tmp/xbitopomo.sock") == "/tmp/xbitopomo.sock"
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Needs Unix domain sockets")
+def test_socket_api_streams_events(quiet, tmp_path):
+    """Clients send commands over the socket and subscribers receive the events"""
+    address = str(tmp_path / "daemon.sock")
+
+    async def scenario():
+        timer_daemon = daemon.TimerDaemon(daemon.AsyncioClock())
+        server = await daemon.serve(timer_daemon, address)
+        async with server:
+            reader, writer = await asyncio.open_unix_connection(address)
+            writer.write(b'{"command": "subscribe"}\n')
+            subscribed = json.loads(await reader.readline())
+            control_reader, control_writer = await asyncio.open_unix_connection(address)
+            control_writer.write(b'{"command": "start"}\nnot json\n')
+            started = json.loads(await control_reader.readline())
+            invalid = json.loads(await control_reader.readline())
+            event = json.loads(await reader.readline())
+            for stream in (writer, control_writer):
+                stream.close()
+            await asyncio.sleep(0.01)
+            return subscribed, started, invalid, event, len(timer_daemon.listeners)
+
+    subscribed, started, invalid, event, listeners = asyncio.run(scenario())
+    assert subscribed["ok"] and not subscribed["status"]["is_running"]
+    assert started["status"]["is_running"]
+    assert invalid == {"ok": False, "error": "Invalid JSON"}
+    assert event["event"] == "started"
+    assert listeners == 0
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Needs Unix domain sockets")
+def test_stale_socket_is_replaced_but_live_one_is_kept(quiet, tmp_path):
+    """A socket left behind is removed, a running daemon's socket refuses a second one"""
+    address = str(tmp_path / "daemon.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(address)
+    stale.close()
+
+    async def scenario():
+        server = await daemon.serve(daemon.TimerDaemon(daemon.AsyncioClock()), address)
+        async with server:
+            with pytest.raises(OSError, match="already listening"):
+                await daemon.serve(daemon.TimerDaemon(daemon.AsyncioClock()), address)
+            reader, writer = await asyncio.open_unix_connection(address)
+            writer.write(b'{"command": "status"}\n')
+            reply = json.loads(await reader.readline())
+            writer.close()
+            return reply
+
+    assert asyncio.run(scenario())["ok"]
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Needs Unix domain sockets")
+def test_is_running(quiet, tmp_path):
+    """is_running() finds a daemon answering on the address"""
+    address = str(tmp_path / "daemon.sock")
+    assert not daemon.is_running(address)
+
+    async def scenario():
+        server = await daemon.serve(daemon.TimerDaemon(daemon.AsyncioClock()), address)
+        async with server:
+            return await asyncio.to_thread(daemon.is_running, address)
+
+    assert asyncio.run(scenario())
+
+
+def test_daemon_does_not_start_next_to_the_window(monkeypatch, tmp_path):
+    """The daemon refuses to serve while the windowed app owns the database"""
+    monkeypatch.setattr(daemon, "setup_logging", lambda: None)
+    monkeypatch.setattr(daemon, "gui_is_running", lambda: True)
+    monkeypatch.setattr(daemon, "run", lambda address: pytest.fail("the daemon started"))
+    assert daemon.main(["--address", str(tmp_path / "daemon.sock")]) == 1
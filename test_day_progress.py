@@ -0,0 +1,45 @@
+from datetime import datetime, time, timedelta
+
+import pytest
+
+from day_progress import DayProgress, minutes_to_time, time_to_minutes
+
+
+def test_percent():
+    progress = DayProgress()  # 5 AM to 11 PM
+    assert progress.percent(datetime(2024, 7, 4, 4, 0)) == 0
+    assert progress.percent(datetime(2024, 7, 4, 5, 0)) == 0
+    assert progress.percent(datetime(2024, 7, 4, 14, 0)) == 50
+    assert progress.percent(datetime(2024, 7, 4, 23, 0)) == 100
+    assert progress.percent(datetime(2024, 7, 4, 23, 30)) == 100
+
+
+def test_next_change_is_the_exact_instant_the_percent_changes():
+    progress = DayProgress(time(8, 0), time(16, 20))  # 500 minutes, 5 per percent
+    now = datetime(2024, 7, 4, 9, 1, 30)
+    change = progress.next_change(now)
+    assert change == datetime(2024, 7, 4, 9, 5)
+    assert progress.percent(change - timedelta(microseconds=1)) == progress.percent(now) == 12
+    assert progress.percent(change) == 13
+    assert progress.seconds_until_change(now) == 210
+
+
+def test_every_percent_is_visited_once():
+    progress = DayProgress(time(6, 7), time(21, 13))  # Percents do not fall on whole seconds
+    now = datetime(2024, 7, 4, 0, 0)
+    values = []
+    while now.date() == datetime(2024, 7, 4).date():
+        values.append(progress.percent(now))
+        now = progress.next_change(now)
+    assert values == list(range(101))
+    assert now == datetime(2024, 7, 5, 0, 0)  # After the end of the day, the next change is midnight
+
+
+def test_day_must_end_after_it_starts():
+    with pytest.raises(ValueError):
+        DayProgress(time(22, 0), time(6, 0))
+
+
+def test_settings_conversion():
+    assert minutes_to_time(300) == time(5, 0)
+    assert time_to_minutes(time(23, 15)) == 1395
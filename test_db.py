@@ -0,0 +1,70 @@
+import pytest
+
+import db
+
+
+@pytest.fixture
+def empty_db(temp_db):
+    """A fresh database in a temporary folder"""
+    db.ensure_db()
+    return temp_db
+
+
+def daily_stats():
+    conn = db.get_conn()
+    rows = conn.execute("SELECT day, sessions, focus_seconds FROM daily_stats ORDER BY day").fetchall()
+    conn.close()
+    return rows
+
+
+def test_daily_stats_follow_session_writes(empty_db):
+    db.insert_pomodoro_session("2024-07-04 09:00:00", None, None)
+    assert daily_stats() == [("2024-07-04", 1, 0)]
+    db.update_pomodoro_session("2024-07-04 09:00:00", "2024-07-04 09:30:00", "pending")
+    db.insert_pomodoro_session("2024-07-05 10:00:00", "2024-07-05 10:25:00", None)
+    assert daily_stats() == [("2024-07-04", 1, 1800), ("2024-07-05", 1, 1500)]
+    conn = db.get_conn()
+    conn.execute("DELETE FROM session_feedback WHERE start_time LIKE '2024-07-05%'")
+    conn.commit()
+    conn.close()
+    assert daily_stats()[-1] == ("2024-07-05", 0, 0)
+
+
+def test_migration_backfills_existing_sessions(temp_db):
+    conn = db.get_conn()
+    conn.execute("CREATE TABLE session_feedback (start_time TEXT, end_time TEXT)")
+    conn.execute("CREATE TABLE settings (key TEXT PRIMARY KEY, value INTEGER)")
+    conn.execute("INSERT INTO settings VALUES ('db_version', 1)")
+    conn.executemany(
+        "INSERT INTO session_feedback VALUES (?, ?)",
+        [("2024-07-04 09:00:00", "2024-07-04 09:30:00"), ("2024-07-04 11:00:00", None)],
+    )
+    conn.commit()
+    conn.close()
+    db.run_migrations()
+    assert db.get_db_version() == 3
+    assert daily_stats() == [("2024-07-04", 2, 1800)]
+
+
+def test_daily_session_counts(empty_db):
+    from datetime import date
+
+    db.insert_pomodoro_session("2024-07-04 09:00:00", "2024-07-04 09:30:00", None)
+    db.insert_pomodoro_session("2024-07-04 10:00:00", "2024-07-04 10:30:00", None)
+    db.insert_pomodoro_session("2024-07-06 10:00:00", None, None)
+    assert list(db.fetch_daily_session_counts(date(2024, 7, 3), date(2024, 7, 6))) == [0, 2, 0, 1]
+    assert db.fetch_first_session_date() == date(2024, 7, 4)
+
+
+def test_session_writes_bump_the_version(empty_db):
+    from datetime import date
+
+    assert db.fetch_session_write_version() == 0
+    db.insert_pomodoro_session("2024-07-04 09:00:00", None, None)
+    db.insert_pomodoro_session("2024-07-05 09:00:00", None, None)
+    version = db.fetch_session_write_version()
+    assert version == 2
+    db.update_pomodoro_session("2024-07-04 09:00:00", "2024-07-04 09:30:00", "pending")
+    assert db.fetch_session_write_version() == 3
+    assert db.fetch_daily_stats_since(version) == [(date(2024, 7, 4), 1, 1800)]
+    assert db.fetch_daily_stats_since(db.fetch_session_write_version()) == []
@@ -0,0 +1,82 @@
+import logging
+import pytest
+import diagnostics
+from diagnostics import RingBufferHandler, KeyValueFormatter, log
+
+
+@pytest.fixture
+def ring(monkeypatch):
+    """A small ring buffer attached to the root logger at DEBUG level"""
+    root = logging.getLogger()
+    previous_level = root.level
+    handler = RingBufferHandler(capacity=3)
+    handler.setFormatter(KeyValueFormatter())
+    monkeypatch.setattr(diagnostics, "_ring_buffer", handler)
+    root.setLevel(logging.DEBUG)
+    root.addHandler(handler)
+    yield handler
+    root.removeHandler(handler)
+    root.setLevel(previous_level)
+
+
+def test_ring_buffer_keeps_last_records(ring):
+    """The ring buffer keeps only the most recent records"""
+    for n in range(5):
+        logging.info("record %s", n)
+    lines = ring.lines()
+    assert len(lines) == 3
+    assert lines[0].endswith("record 2")
+    assert lines[-1].endswith("record 4")
+
+
+def test_key_value_records(ring):
+    """log() renders its fields as key=value pairs"""
+    log(logging.INFO, "session_alert_reset", delay_ms=600000, source="pause")
+    assert ring.lines()[0].endswith("session_alert_reset delay_ms=600000 source='pause'")
+
+
+def test_disabled_level_costs_nothing(ring):
+    """Below the configured level records are not even created"""
+    logging.getLogger().setLevel(logging.WARNING)
+    log(logging.DEBUG, "tree_stage_changed", stage=2)
+    assert ring.lines() == []
+
+
+def test_configured_level(monkeypatch):
+    monkeypatch.setenv(diagnostics.LEVEL_ENV_VAR, "debug")
+    assert diagnostics.configured_level() == logging.DEBUG
+    monkeypatch.setenv(diagnostics.LEVEL_ENV_VAR, "nonsense")
+    assert diagnostics.configured_level() == logging.INFO
+
+
+def test_dump_diagnostics(ring, tmp_path):
+    """The dump has the environment, the given sections and the recent log"""
+    logging.warning("Something odd")
+    path = diagnostics.dump_diagnostics(str(tmp_path / "dump.txt"), {"Timer": "Focus 25:00"})
+    text = open(path).read()
+    assert "PySide6:" in text
+    assert "== Timer ==\nFocus 25:00" in text
+    assert text.rstrip().endswith("Something odd")
+
+
+def test_records_are_formatted_when_read(ring):
+    """Logging a record does not format its message, reading the ring buffer does"""
+
+    class Counted:
+        formatted = 0
+
+        def __str__(self):
+            Counted.formatted += 1
+            return "counted"
+
+    # Only the ring buffer, pytest's own capture handlers format right away
+    logger = logging.getLogger("test_lazy_formatting")
+    logger.propagate = False
+    logger.addHandler(ring)
+    try:
+        logger.info("value %s", Counted())
+    finally:
+        logger.removeHandler(ring)
+    assert Counted.formatted == 0
+    assert ring.lines()[-1].endswith("value counted")
+    assert Counted.formatted == 1
@@ -0,0 +1,133 @@
+import sys
+import threading
+import time
+import types
+from datetime import datetime
+
+from clock import VirtualClock
+from events import (
+    EventBus,
+    TimerPublisher,
+    load_plugins,
+    SESSION_STARTED,
+    PAUSED,
+    RESUMED,
+    ADJUSTED,
+    COMPLETED,
+    BREAK_STARTED,
+    DAY_ROLLED_OVER,
+)
+from timer_core import PomodoroTimer, FOCUS, REST
+
+
+def test_threaded_subscriber_sees_events_in_order():
+    """Each subscriber gets events in publishing order, off the publishing thread"""
+    bus = EventBus()
+    seen, threads = [], set()
+
+    def slow(event):
+        time.sleep(0.001)
+        seen.append(event.data["n"])
+        threads.add(threading.get_ident())
+
+    bus.subscribe(slow)
+    for n in range(20):
+        bus.publish("tick", n=n)
+    assert bus.flush(timeout=5)
+    assert seen == list(range(20))
+    assert threading.get_ident() not in threads
+    bus.shutdown()
+
+
+def test_slow_subscriber_does_not_block_publisher():
+    """publish() returns right away even when a subscriber is stuck"""
+    bus = EventBus()
+    release = threading.Event()
+    fast = []
+    bus.subscribe(lambda event: release.wait(5), name="stuck")
+    bus.subscribe(fast.append, name="fast")
+    started = time.perf_counter()
+    bus.publish(COMPLETED)
+    assert time.perf_counter() - started < 0.5
+    # The other subscriber is not held back by the stuck one
+    deadline = time.monotonic() + 5
+    while not fast and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert len(fast) == 1
+    release.set()
+    assert bus.flush(timeout=5)
+    assert bus.stats()["stuck"].max_run > 0
+    bus.shutdown()
+
+
+def test_inline_subscribers_and_filters():
+    """Inline subscribers run in the publishing thread and only get the events they asked for"""
+    bus = EventBus()
+    seen = []
+    bus.subscribe(lambda event: seen.append(event.name), (PAUSED,), threaded=False)
+    bus.publish(SESSION_STARTED)
+    bus.publish(PAUSED)
+    assert seen == [PAUSED]
+
+
+def test_failing_subscriber_is_counted():
+    """An exception in a subscriber is logged and counted, other events still flow"""
+    bus = EventBus()
+
+    def broken(event):
+        raise ValueError("boom")
+
+    subscription = bus.subscribe(broken, name="broken", threaded=False)
+    bus.publish(COMPLETED)
+    bus.publish(COMPLETED)
+    assert subscription.stats.errors == 2
+    assert subscription.stats.delivered == 2
+    subscription.cancel()
+    assert bus.stats() == {}
+
+
+def test_timer_publisher_lifecycle():
+    """Timer state changes become lifecycle events with the data subscribers need"""
+    clock = VirtualClock(datetime(2024, 7, 4, 8, 0))
+    bus = EventBus()
+    timer = PomodoroTimer(focus_seconds=1500, rest_seconds=300, clock=clock.monotonic)
+    TimerPublisher(bus, timer, clock)
+    events = []
+    bus.subscribe(events.append, threaded=False)
+
+    timer.start()
+    clock.advance(600)
+    timer.pause()
+    timer.start()
+    timer.adjust(-5)
+    clock.advance(600)
+    timer.tick()
+    timer.start()
+    timer.reset_day()
+
+    assert [event.name for event in events] == [
+        SESSION_STARTED,
+        PAUSED,
+        RESUMED,
+        ADJUSTED,
+        COMPLETED,
+        BREAK_STARTED,
+        DAY_ROLLED_OVER,
+    ]
+    completed = events[4].data
+    assert completed["finished_type"] == FOCUS
+    assert completed["next_type"] == REST
+    assert completed["start_time"] == "2024-07-04 08:00:00"
+    assert completed["end_time"] == "2024-07-04 08:20:00"
+    assert events[5].data["session_type"] == REST
+
+
+def test_load_plugins(monkeypatch):
+    """Plugin modules register their own subscribers, broken ones are skipped"""
+    plugin = types.ModuleType("xbito_test_plugin")
+    plugin.register = lambda bus: bus.subscribe(lambda event: None, name="plugin")
+    monkeypatch.setitem(sys.modules, "xbito_test_plugin", plugin)
+    monkeypatch.setenv("XBITO_PLUGINS", "xbito_test_plugin, missing_plugin_module")
+    bus = EventBus()
+    assert load_plugins(bus) == ["xbito_test_plugin"]
+    assert list(bus.stats()) == ["plugin"]
@@ -0,0 +1,76 @@
+from datetime import date
+
+import pytest
+from PySide6.QtCore import QEvent, QPoint
+from PySide6.QtGui import QHelpEvent
+
+from activity_pyramid import ActivityPyramid, DAY, WEEK, MONTH
+from heatmap_widget import HeatmapWidget, CELL_SIZE, CELL_GAP, LEFT_MARGIN, TOP_MARGIN
+
+
+@pytest.fixture
+def heatmap(qtbot):
+    widget = HeatmapWidget()
+    qtbot.addWidget(widget)
+    # A Wednesday, the grid starts on the Monday before
+    widget.set_counts(date(2024, 7, 3), [1, 0, 3, 7])
+    widget.resize(widget.sizeHint())
+    return widget
+
+
+def test_grid_starts_on_monday(heatmap):
+    assert heatmap.start_date == date(2024, 7, 1)
+    assert list(heatmap.counts) == [0, 0, 1, 0, 3, 7]
+    assert heatmap.weeks() == 1
+    assert heatmap.sizeHint().width() == LEFT_MARGIN + CELL_SIZE + CELL_GAP
+
+
+def test_hit_testing(heatmap):
+    friday = heatmap.cell_rect(4)
+    assert heatmap.index_at(friday.center()) == 4
+    assert heatmap.tooltip_text(4) == "July 05: 3"
+    assert heatmap.index_at(QPoint(LEFT_MARGIN + CELL_SIZE, TOP_MARGIN + 1)) is None  # In the gap
+    assert heatmap.index_at(QPoint(1, TOP_MARGIN + 1)) is None  # On the day names
+    assert heatmap.index_at(heatmap.cell_rect(6).center()) is None  # After the last day
+
+
+def test_tooltip_event(heatmap, monkeypatch):
+    shown = []
+    monkeypatch.setattr(
+        "heatmap_widget.QToolTip.showText", lambda pos, text, *args: shown.append(text)
+    )
+    position = heatmap.cell_rect(5).center()
+    heatmap.event(QHelpEvent(QEvent.ToolTip, position, heatmap.mapToGlobal(position)))
+    assert shown == ["July 06: 7"]
+
+
+def test_rendered_once_per_data_and_size(heatmap):
+    rendered = heatmap.rendered_pixmap()
+    assert heatmap.rendered_pixmap() is rendered
+    image = rendered.toImage()
+    assert image.pixelColor(heatmap.cell_rect(5).center()).alpha() == 200  # 5 or more sessions
+    assert image.pixelColor(heatmap.cell_rect(3).center()).alpha() == 0  # No sessions
+    heatmap.set_counts(date(2024, 7, 1), [1])
+    assert heatmap.rendered_pixmap() is not rendered
+
+
+def test_zoom_levels(qtbot):
+    widget = HeatmapWidget()
+    qtbot.addWidget(widget)
+    pyramid = ActivityPyramid(date(2020, 1, 1), date(2024, 12, 29))  # ISO weeks of 2020 to 2024
+    pyramid.add(date(2024, 7, 4), 30)
+    widget.set_pyramid(pyramid)
+    day_width = widget.width()
+    with qtbot.waitSignal(widget.levelChanged):
+        widget.set_level(MONTH)
+    assert widget.grid_size() == (12, 5)
+    assert widget.width() < day_width  # Fitted to the level
+    july = widget.index_at(widget.cell_rect(4 * 12 + 6).center())
+    assert widget.tooltip_text(july) == "July 2024: 30"
+    widget.set_level(WEEK)
+    assert widget.grid_size() == (53, 5)
+    assert widget.tooltip_text(4 * 53 + 26) == "Week 27 2024 (Jul 01 - Jul 07): 30"
+    week_pixmap = widget.rendered_pixmap()
+    widget.set_level(DAY)
+    widget.set_level(WEEK)
+    assert widget.rendered_pixmap() is week_pixmap  # Each level is painted once
@@ -0,0 +1,61 @@
+import os
+
+import pytest
+
+import image_store
+
+STAGE1 = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "tree_stage1.png")
+
+
+@pytest.fixture(autouse=True)
+def empty_store(qapp, monkeypatch):
+    image_store.discard()
+    yield
+    image_store.discard()
+
+
+def test_decodes_once(monkeypatch):
+    decoded = []
+    original = image_store.QPixmap
+
+    def counting_pixmap(path):
+        decoded.append(path)
+        return original(path)
+
+    monkeypatch.setattr(image_store, "QPixmap", counting_pixmap)
+    first = image_store.pixmap(STAGE1)
+    assert image_store.pixmap(STAGE1) is first
+    assert not first.isNull()
+    image_store.pixmap(STAGE1, 50, 50)
+    image_store.pixmap(STAGE1, 50, 50)
+    assert decoded == [STAGE1]
+
+
+def test_scaled_keeps_aspect_ratio_and_dpr():
+    scaled = image_store.pixmap(STAGE1, 40, 80, 2.0)
+    assert scaled.width() == 40
+    assert scaled.devicePixelRatio() == 2.0
+
+
+def test_least_recently_used_entries_are_evicted(monkeypatch):
+    monkeypatch.setattr(image_store, "max_entries", 3)
+    for size in (10, 20, 30):
+        image_store.pixmap(STAGE1, size, size)  # Also uses the decoded image
+    assert image_store.stats()["entries"] == 3
+    assert list(image_store._pixmaps) == [
+        (STAGE1, 20, 20, 1.0),
+        (STAGE1, None, None, 1.0),
+        (STAGE1, 30, 30, 1.0),
+    ]
+
+
+def test_missing_file_is_logged(caplog):
+    assert image_store.pixmap("missing.png").isNull()
+    assert "Failed to load image: missing.png" in caplog.text
+
+
+def test_discard_one_path():
+    image_store.pixmap(STAGE1)
+    image_store.pixmap("missing.png")
+    image_store.discard(STAGE1)
+    assert list(image_store._pixmaps) == [("missing.png", None, None, 1.0)]
@@ -9,7 +9,7 @@ from menu import AppMenu
 
 
 @pytest.fixture
-def app_with_menu(qtbot):
+def app_with_menu(qtbot, temp_db):
     """Create an instance of the XbitoPomodoro app with menu"""
     phrase = "Stay focused and keep working!"
     pomodoro_app = XbitoPomodoro(qtbot, phrase)
@@ -53,6 +53,8 @@ def test_menu_creation(app_with_menu):
     assert "About" in menu_items
     assert "Settings" in menu_items
     assert "Report" in menu_items
+    assert "Power Usage" in menu_items
+    assert "Dump Diagnostics" in menu_items
     assert "Send to Back" in menu_items
     
     # Check platform-specific menu items
@@ -216,3 +218,17 @@ def test_is_startup_enabled(app_with_menu, monkeypatch):
         # Test is_startup_enabled
         result = app_with_menu.menu.is_startup_enabled()
         assert result == scenario['expected_result']
+
+
+def test_dump_diagnostics(app_with_menu, monkeypatch, tmp_path):
+    """Dump Diagnostics writes the app state to a file and tells the user where"""
+    monkeypatch.setattr("menu.get_app_path", lambda: str(tmp_path))
+    mock_show_dialog = MagicMock()
+    monkeypatch.setattr(app_with_menu, "show_dialog", mock_show_dialog)
+    app_with_menu.menu.dump_diagnostics()
+    (dump,) = tmp_path.glob("xbitopomo-diagnostics-*.txt")
+    text = dump.read_text()
+    assert "== Timer ==" in text
+    assert "session_alert" in text
+    assert "persistence" in text
+    assert str(dump) in mock_show_dialog.call_args[0][1]
@@ -0,0 +1,93 @@
+import json
+import urllib.request
+
+import metrics
+from clock import VirtualClock
+from metrics import Histogram
+from scheduler import Scheduler
+
+
+def test_histogram_prometheus_text():
+    """Histograms are exposed with cumulative buckets, sum and count per label set"""
+    histogram = Histogram("xbito_test_seconds", "Test histogram.", ("function",), buckets=(0.01, 0.1))
+    try:
+        histogram.observe(0.005, function="fetch")
+        histogram.observe(0.05, function="fetch")
+        histogram.observe(1.0, function="fetch")
+        lines = histogram.prometheus_lines()
+    finally:
+        metrics._registry.remove(histogram)
+    assert lines == [
+        "# HELP xbito_test_seconds Test histogram.",
+        "# TYPE xbito_test_seconds histogram",
+        'xbito_test_seconds_bucket{function="fetch",le="0.01"} 1',
+        'xbito_test_seconds_bucket{function="fetch",le="0.1"} 2',
+        'xbito_test_seconds_bucket{function="fetch",le="+Inf"} 3',
+        'xbito_test_seconds_sum{function="fetch"} 1.055',
+        'xbito_test_seconds_count{function="fetch"} 3',
+    ]
+
+
+def test_timed_decorator_labels_by_function():
+    """timed() records each call under the function's name"""
+    metrics.DB_LATENCY.reset()
+
+    @metrics.timed(metrics.DB_LATENCY)
+    def fetch_something():
+        return 42
+
+    assert fetch_something() == 42
+    (series,) = metrics.DB_LATENCY.snapshot()
+    assert series["labels"] == {"function": "fetch_something"}
+    assert series["count"] == 1
+
+
+def test_scheduler_records_lateness_and_stalls():
+    """A wakeup that comes late is recorded as job lateness and as a stall"""
+    metrics.reset()
+    clock = VirtualClock()
+    scheduler = Scheduler(clock)
+    scheduler.call_every(1, lambda: None, "countdown")
+    clock.advance(1)
+    # Simulate the event loop being blocked for 300 ms past the next deadline
+    clock._monotonic = 2.3
+    scheduler._run_due()
+    lateness = {tuple(s["labels"].items()): s for s in metrics.TIMER_LATENESS.snapshot()}
+    assert lateness[(("job", "countdown"),)]["count"] == 2
+    assert abs(lateness[(("job", "countdown"),)]["max"] - 0.3) < 1e-9
+    (stall,) = metrics.GUI_STALL.snapshot()
+    assert stall["count"] == 1
+
+
+def test_rss_gauge():
+    assert metrics.RSS.value() > 0
+
+
+def test_http_exporter_and_snapshot(tmp_path):
+    """/metrics serves the Prometheus text and the snapshot file is valid JSON"""
+    server = metrics.start_http_server(0)
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+            body = response.read().decode()
+    finally:
+        server.shutdown()
+    assert "# TYPE xbito_resident_memory_bytes gauge" in body
+    path = str(tmp_path / "metrics.json")
+    metrics.write_snapshot(path)
+    with open(path) as snapshot_file:
+        data = json.load(snapshot_file)
+    assert "xbito_db_latency_seconds" in data["metrics"]
+
+
+def test_coalesced_background_jobs_are_not_late():
+    """Background jobs postponed by power save do not count as timer lateness"""
+    metrics.reset()
+    clock = VirtualClock()
+    scheduler = Scheduler(clock, coalesce_seconds=600)
+    scheduler.call_every(60, lambda: None, "progress_bar", background=True)
+    scheduler.call_every(1, lambda: None, "countdown")
+    scheduler.set_power_save(True)
+    clock.advance(700)
+    jobs = {s["labels"]["job"] for s in metrics.TIMER_LATENESS.snapshot()}
+    assert jobs == {"countdown"}
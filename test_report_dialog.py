@@ -0,0 +1,56 @@
+from datetime import date, datetime
+
+import pytest
+
+import db
+from clock import VirtualClock, set_clock
+from report_dialog import ReportDialog
+
+
+@pytest.fixture
+def report(qtbot, temp_db):
+    """A report over an empty database in a temporary folder, on July 5 2024"""
+    previous = set_clock(VirtualClock(datetime(2024, 7, 5, 12, 0)))
+    dialog = ReportDialog()
+    qtbot.addWidget(dialog)
+    yield dialog
+    set_clock(previous)
+
+
+def day_count(dialog, day):
+    pyramid = dialog.heatmap.pyramid
+    return pyramid.days[(day - pyramid.start).days]
+
+
+def test_refresh_reads_only_changed_days(report, monkeypatch):
+    db.insert_pomodoro_session("2024-07-04 09:00:00", "2024-07-04 09:30:00", None)
+    report.refresh()
+    pyramid = report.heatmap.pyramid
+    assert day_count(report, date(2024, 7, 4)) == 1
+
+    db.insert_pomodoro_session("2024-07-05 09:00:00", "2024-07-05 09:30:00", None)
+    monkeypatch.setattr(
+        "report_dialog.fetch_daily_session_counts",
+        lambda start, end: pytest.fail("the whole history was read again"),
+    )
+    report.refresh()
+    assert report.heatmap.pyramid is pyramid
+    assert day_count(report, date(2024, 7, 5)) == 1
+    assert sum(pyramid.weeks) == 2
+
+
+def test_refresh_without_writes_reads_nothing(report, monkeypatch):
+    report.refresh()
+    monkeypatch.setattr(
+        "report_dialog.fetch_daily_stats_since",
+        lambda version: pytest.fail("read the database without session writes"),
+    )
+    report.refresh()
+
+
+def test_refresh_rebuilds_on_a_new_day(report):
+    report.refresh()
+    assert report.heatmap.pyramid.end == date(2024, 7, 5)
+    set_clock(VirtualClock(datetime(2024, 7, 6, 9, 0)))
+    report.refresh()
+    assert report.heatmap.pyramid.end == date(2024, 7, 6)
@@ -0,0 +1,63 @@
+import csv
+from datetime import datetime
+
+import pytest
+
+import db
+import report_export
+from clock import VirtualClock, set_clock
+from report_export import ReportExporter, export_report
+
+
+@pytest.fixture
+def sessions(temp_db):
+    """A database in a temporary folder with three completed sessions and a running one"""
+    previous = set_clock(VirtualClock(datetime(2024, 7, 5, 12, 0)))
+    db.insert_pomodoro_session("2024-07-04 09:00:00", "2024-07-04 09:25:00", None)
+    db.insert_pomodoro_session("2024-07-04 10:00:00", "2024-07-04 10:30:00", None)
+    db.insert_pomodoro_session("2024-07-05 09:00:00", "2024-07-05 09:20:00", None)
+    db.insert_pomodoro_session("2024-07-05 11:00:00", None, None)
+    yield temp_db
+    set_clock(previous)
+
+
+def test_export_writes_every_file(sessions, qapp, monkeypatch):
+    monkeypatch.setattr(report_export, "PROGRESS_EVERY", 2)
+    progress = []
+    paths = export_report(str(sessions), lambda done, total: progress.append((done, total)))
+    assert [p.rsplit("/", 1)[-1] for p in paths] == [
+        "xbitopomo-heatmap.png",
+        "xbitopomo-summary.csv",
+        "xbitopomo-sessions.csv",
+        "xbitopomo-report.html",
+    ]
+    assert progress[0] == (1, 5) and progress[-1] == (5, 5)
+    with open(paths[2], newline="") as sessions_file:
+        rows = list(csv.reader(sessions_file))
+    assert rows == [
+        ["Start Time", "End Time", "Minutes"],
+        ["2024-07-04 09:00:00", "2024-07-04 09:25:00", "25"],
+        ["2024-07-04 10:00:00", "2024-07-04 10:30:00", "30"],
+        ["2024-07-05 09:00:00", "2024-07-05 09:20:00", "20"],
+    ]
+    with open(paths[1], newline="") as summary_file:
+        assert list(csv.reader(summary_file))[-1] == ["Today", "20.0"]
+    page = open(paths[3], encoding="utf-8").read()
+    assert 'src="data:image/png;base64,' in page
+    assert page.count("<tr><td>2024-07-") == 3
+    assert page.rstrip().endswith("</html>")
+
+
+def test_exporter_reports_failures(sessions, qtbot):
+    exporter = ReportExporter()
+    with qtbot.waitSignal(exporter.failed, timeout=5000):
+        future = exporter.start(str(sessions / "missing"))
+    exporter.shutdown()
+    assert future.done()
+    assert exporter.executor is None
+
+
+def test_iter_completed_sessions_reads_in_batches(sessions):
+    rows = list(db.iter_completed_sessions(batch_size=2))
+    assert [row[2] for row in rows] == [1500, 1800, 1200]
+    assert db.count_completed_sessions() == 3
@@ -0,0 +1,175 @@
+import pytest
+from datetime import datetime, time
+from clock import VirtualClock
+from scheduler import Scheduler
+
+
+def make_scheduler(start=None):
+    clock = VirtualClock(start)
+    return clock, Scheduler(clock)
+
+
+def test_one_shot_job():
+    """call_later() runs the callback once"""
+    clock, scheduler = make_scheduler()
+    fired = []
+    job = scheduler.call_later(10, lambda: fired.append(clock.monotonic()))
+    assert job.active
+    clock.advance(100)
+    assert fired == [10]
+    assert not job.active
+    assert scheduler.jobs() == []
+
+
+def test_periodic_job_keeps_cadence():
+    """call_every() runs at a fixed cadence until cancelled"""
+    clock, scheduler = make_scheduler()
+    fired = []
+    job = scheduler.call_every(60, lambda: fired.append(clock.monotonic()))
+    clock.advance(200)
+    assert fired == [60, 120, 180]
+    job.cancel()
+    clock.advance(200)
+    assert fired == [60, 120, 180]
+
+
+def test_daily_job_is_aligned_to_wall_clock():
+    """call_daily() runs exactly at the given local time every day"""
+    clock, scheduler = make_scheduler(datetime(2024, 7, 4, 22, 30))
+    fired = []
+    scheduler.call_daily(time(0, 0), lambda: fired.append(clock.now()))
+    clock.advance(2 * 24 * 3600)
+    assert fired == [datetime(2024, 7, 5, 0, 0), datetime(2024, 7, 6, 0, 0)]
+
+
+def test_single_timer_wakeups():
+    """Only one wakeup happens per distinct deadline, whatever the number of jobs"""
+    clock, scheduler = make_scheduler()
+    counts = {"a": 0, "b": 0, "c": 0}
+
+    def bump(key):
+        return lambda: counts.__setitem__(key, counts[key] + 1)
+
+    scheduler.call_every(60, bump("a"))
+    scheduler.call_every(300, bump("b"))
+    scheduler.call_every(1800, bump("c"))
+    clock.advance(3600)
+    assert counts == {"a": 60, "b": 12, "c": 2}
+    # Deadlines of the 5 and 30 minute jobs coincide with the 1 minute job
+    assert scheduler.wakeups == 60
+
+
+def test_restart_moves_deadline():
+    """restart() pushes a one-shot job back, like resetting a timer"""
+    clock, scheduler = make_scheduler()
+    fired = []
+    job = scheduler.call_later(600, lambda: fired.append(clock.monotonic()))
+    clock.advance(500)
+    job.restart()
+    clock.advance(500)
+    assert fired == []
+    job.restart(60)
+    clock.advance(60)
+    assert fired == [1060]
+
+
+def test_jobs_are_inspectable():
+    """jobs() lists active jobs soonest first"""
+    clock, scheduler = make_scheduler()
+    scheduler.call_every(300, lambda: None, "focus_summary")
+    scheduler.call_every(60, lambda: None, "progress_bar")
+    countdown = scheduler.call_every(1, lambda: None, "countdown", start=False)
+    assert [job.name for job in scheduler.jobs()] == ["progress_bar", "focus_summary"]
+    countdown.restart()
+    assert scheduler.jobs()[0] is countdown
+    assert scheduler.jobs()[0].due_in() == 1
+
+
+def test_missed_periodic_runs_are_skipped():
+    """A periodic job that fell far behind runs once, not once per missed interval"""
+    clock, scheduler = make_scheduler()
+    fired = []
+    scheduler.call_every(1, lambda: fired.append(clock.monotonic()))
+    # Simulate a stalled event loop: the deadline passes without the timer firing
+    clock._monotonic = 10.0
+    scheduler._run_due()
+    assert fired == [10.0]
+    assert scheduler.jobs()[0].due_in() == 1
+
+
+def test_power_save_coalesces_background_jobs():
+    """In power save mode background jobs ride along with other wakeups"""
+    clock, scheduler = make_scheduler()
+    scheduler.coalesce_seconds = 600
+    fired = []
+    scheduler.call_every(60, lambda: fired.append(("progress", clock.monotonic())), background=True)
+    scheduler.call_every(300, lambda: fired.append(("summary", clock.monotonic())), background=True)
+    scheduler.set_power_save(True)
+    clock.advance(3600)
+    # Instead of 72 separate runs, both jobs run together every coalesce window
+    assert scheduler.wakeups == 5
+    assert fired[:2] == [("progress", 660), ("summary", 660)]
+
+
+def test_power_save_keeps_foreground_deadlines():
+    """Foreground jobs still run on time in power save mode"""
+    clock, scheduler = make_scheduler()
+    scheduler.set_power_save(True)
+    fired = []
+    scheduler.call_every(60, lambda: fired.append(("progress", clock.monotonic())), background=True)
+    scheduler.call_later(125, lambda: fired.append(("deadline", clock.monotonic())))
+    clock.advance(130)
+    assert fired == [("progress", 125), ("deadline", 125)]
+
+
+def test_wakeups_per_hour():
+    """wakeups_per_hour() reports the wakeup rate over the last hour"""
+    clock, scheduler = make_scheduler()
+    scheduler.call_every(60, lambda: None)
+    clock.advance(1800)
+    assert scheduler.wakeups_per_hour() == 60
+    clock.advance(7200)
+    assert scheduler.wakeups_per_hour() == 60
+
+
+def test_clock_jump_realigns_daily_jobs():
+    """After a suspend daily jobs are re-aligned to the wall clock and listeners notified"""
+    clock, scheduler = make_scheduler(datetime(2024, 7, 4, 22, 0))
+    fired, jumps = [], []
+    scheduler.call_daily(time(23, 0), lambda: fired.append(clock.now()))
+    scheduler.call_every(60, lambda: None)
+    scheduler.clock_jump_listeners.append(jumps.append)
+    clock.suspend(30 * 60)
+    clock.advance(60)
+    assert [jump.kind for jump in jumps] == ["suspend"]
+    # Without re-alignment the daily job would run 30 minutes late
+    clock.advance_to(datetime(2024, 7, 4, 23, 0))
+    assert fired == [datetime(2024, 7, 4, 23, 0)]
+
+
+def test_nested_event_loop_does_not_hold_up_other_jobs():
+    """Jobs keep running while a callback waits in a nested event loop, like a modal dialog"""
+    clock, scheduler = make_scheduler()
+    fired = []
+    scheduler.call_every(60, lambda: fired.append(clock.monotonic()))
+    # The nested loop runs for five minutes before the callback returns
+    scheduler.call_later(30, lambda: clock.advance(300))
+    clock.advance(30)
+    assert fired == [60, 120, 180, 240, 300]
+
+
+def test_raising_job_does_not_lose_other_due_jobs():
+    """When a callback raises, the other jobs due at the same time still run"""
+    clock, scheduler = make_scheduler()
+    fired = []
+
+    def fail():
+        raise RuntimeError("job failed")
+
+    scheduler.call_later(10, fail)
+    job = scheduler.call_later(10, lambda: fired.append(clock.monotonic()))
+    with pytest.raises(RuntimeError):
+        clock.advance(10)
+    clock.advance(0)
+    assert fired == [10]
+    assert not job.active
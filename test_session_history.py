@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta
+
+import pytest
+from PySide6.QtCore import Qt
+
+import db
+import session_history
+from session_history import SessionHistoryModel
+
+
+@pytest.fixture
+def sessions_db(temp_db, monkeypatch):
+    """A temporary database with 50 sessions, one a day from 2024-01-01, the nth lasting n minutes"""
+    db.ensure_db()
+    conn = db.get_conn()
+    first = datetime(2024, 1, 1, 9, 0)
+    conn.executemany(
+        "INSERT INTO session_feedback (start_time, end_time) VALUES (?, ?)",
+        [
+            (
+                (first + timedelta(days=n)).strftime("%Y-%m-%d %H:%M:%S"),
+                (first + timedelta(days=n, minutes=n + 1)).strftime("%Y-%m-%d %H:%M:%S"),
+            )
+            for n in range(50)
+        ]
+        + [("2024-03-01 09:00:00", None)],  # Not completed, never shown
+    )
+    conn.commit()
+    conn.close()
+    monkeypatch.setattr(session_history, "PAGE_SIZE", 20)
+    monkeypatch.setattr(session_history, "MAX_CACHED_PAGES", 2)
+
+
+def fetch_all(model):
+    while model.canFetchMore():
+        model.fetchMore()
+
+
+def test_pages_are_fetched_on_demand(sessions_db, qtbot):
+    model = SessionHistoryModel()
+    assert model.rowCount() == 0
+    model.fetchMore()
+    assert model.rowCount() == 20
+    assert model.canFetchMore()
+    fetch_all(model)
+    assert model.rowCount() == 50
+    assert not model.canFetchMore()
+    assert model.data(model.index(0, 0)) == "2024-02-19 09:00:00"  # Newest first
+    assert model.data(model.index(49, 0)) == "2024-01-01 09:00:00"
+    assert model.data(model.index(49, 2)) == "1"
+
+
+def test_only_a_few_pages_stay_in_memory(sessions_db, qtbot, monkeypatch):
+    model = SessionHistoryModel()
+    fetch_all(model)
+    assert len(model.pages) == 2
+    reads = []
+    original = db.fetch_sessions_page
+    monkeypatch.setattr(
+        session_history, "fetch_sessions_page", lambda *args: reads.append(args) or original(*args)
+    )
+    assert model.data(model.index(0, 0)) == "2024-02-19 09:00:00"  # Page 0 read again
+    assert model.data(model.index(25, 0)) == "2024-01-25 09:00:00"  # Page 1 from its keyset
+    assert reads[1][0] == ("2024-01-31 09:00:00", 31)
+    assert len(model.pages) == 2
+
+
+def test_sorting_and_filtering_in_sql(sessions_db, qtbot):
+    model = SessionHistoryModel()
+    model.sort(2, Qt.DescendingOrder)
+    fetch_all(model)
+    assert [model.data(model.index(row, 2)) for row in range(3)] == ["50", "49", "48"]
+    model.set_prefix("2024-02")
+    fetch_all(model)
+    assert model.rowCount() == 19
+    assert model.data(model.index(0, 0)) == "2024-02-19 09:00:00"
+    model.sort(0, Qt.AscendingOrder)
+    model.fetchMore()
+    assert model.data(model.index(0, 0)) == "2024-02-01 09:00:00"
+
+
+def test_rows_gone_from_a_page_read_again(sessions_db, qtbot):
+    """A dropped page read again after sessions were deleted lists the sessions again"""
+    model = SessionHistoryModel()
+    fetch_all(model)
+    model.data(model.index(0, 0))
+    model.data(model.index(25, 0))  # The last page is dropped
+    conn = db.get_conn()
+    conn.execute("DELETE FROM session_feedback WHERE start_time < '2024-01-06'")
+    conn.commit()
+    conn.close()
+    # Reading the last page again returns 5 rows instead of 10
+    with qtbot.waitSignal(model.modelReset):
+        assert model.data(model.index(45, 0)) is None
+    fetch_all(model)
+    assert model.rowCount() == 45
+    assert model.data(model.index(44, 0)) == "2024-01-06 09:00:00"
@@ -0,0 +1,82 @@
+import os
+import socket
+import sys
+import uuid
+
+import pytest
+from PySide6.QtCore import QDir, QProcess
+from single_instance import SingleInstance
+
+
+def test_forward_without_instance_returns_none():
+    """With no running instance forward() gives up right away"""
+    assert SingleInstance(f"xbitopomo-test-{uuid.uuid4().hex}").forward(["--start"]) is None
+
+
+def test_arguments_are_forwarded_to_running_instance(qtbot):
+    """A second launch hands its arguments to the first one and prints its reply"""
+    name = f"xbitopomo-test-{uuid.uuid4().hex}"
+    running = SingleInstance(name)
+    received = []
+    running.set_handler(lambda args: received.append(args) or "Focus 30:00 (running)")
+    assert running.listen()
+
+    # The second launch is a separate process blocking on its socket
+    second = QProcess()
+    with qtbot.waitSignal(second.finished, timeout=5000):
+        second.start(
+            sys.executable,
+            ["-c", f"from single_instance import SingleInstance; print(SingleInstance({name!r}).forward(['--start']))"],
+        )
+    assert received == [["--start"]]
+    assert bytes(second.readAllStandardOutput()).decode().strip() == "Focus 30:00 (running)"
+    running.server.close()
+
+
+def test_commands_wait_for_the_handler(qtbot):
+    """A launch while the window is still being built gets its reply once the handler is set"""
+    name = f"xbitopomo-test-{uuid.uuid4().hex}"
+    running = SingleInstance(name)
+    assert running.listen()
+    second = QProcess()
+    second.start(
+        sys.executable,
+        ["-c", f"from single_instance import SingleInstance; print(SingleInstance({name!r}).forward(['--status']))"],
+    )
+    qtbot.waitUntil(lambda: len(running._waiting) == 1, timeout=5000)
+    with qtbot.waitSignal(second.finished, timeout=5000):
+        running.set_handler(lambda args: f"handled {args[0]}")
+    assert bytes(second.readAllStandardOutput()).decode().strip() == "handled --status"
+    running.server.close()
+
+
+def test_listen_keeps_a_live_instance(qtbot):
+    """Losing the race to listen must not remove the running instance's socket"""
+    name = f"xbitopomo-test-{uuid.uuid4().hex}"
+    running = SingleInstance(name)
+    running.set_handler(lambda args: "running")
+    assert running.listen()
+    late = SingleInstance(name)
+    assert not late.listen()
+    second = QProcess()
+    with qtbot.waitSignal(second.finished, timeout=5000):
+        second.start(
+            sys.executable,
+            ["-c", f"from single_instance import SingleInstance; print(SingleInstance({name!r}).forward([]))"],
+        )
+    assert bytes(second.readAllStandardOutput()).decode().strip() == "running"
+    running.server.close()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Named pipes do not outlive their process")
+def test_stale_socket_is_replaced(qtbot):
+    """A socket left by a crashed instance is only removed once nobody answers on it"""
+    name = f"xbitopomo-test-{uuid.uuid4().hex}"
+    stale = socket.socket(socket.AF_UNIX)
+    stale.bind(os.path.join(QDir.tempPath(), name))
+    stale.close()  # The file stays, like after a crash
+    instance = SingleInstance(name)
+    assert not instance.listen()
+    assert instance.forward([]) is None
+    assert instance.listen(replace_stale=True)
+    instance.server.close()
@@ -0,0 +1,65 @@
+import json
+import pytest
+import startup_profile
+
+
+@pytest.fixture
+def profiler(monkeypatch):
+    monkeypatch.setattr(startup_profile, "_events", [])
+    monkeypatch.setattr(startup_profile, "_enabled", True)
+    return startup_profile
+
+
+def test_requested(monkeypatch):
+    """The flag or the environment variable turn profiling on"""
+    monkeypatch.delenv(startup_profile.ENV_VAR, raising=False)
+    assert startup_profile.requested(["app.py", "--profile-startup"])
+    assert not startup_profile.requested(["app.py"])
+    monkeypatch.setenv(startup_profile.ENV_VAR, "1")
+    assert startup_profile.requested(["app.py"])
+
+
+def test_self_times_exclude_nested_phases(profiler):
+    """A phase's self time does not include the phases nested in it"""
+    profiler._record("child", "phase", 0.1, 0.3, 1)
+    profiler._record("other child", "phase", 0.4, 0.2, 1)
+    profiler._record("parent", "phase", 0.0, 1.0, 0)
+    assert profiler.self_times() == pytest.approx([0.3, 0.2, 0.5])
+
+
+def test_profiled_records_calls(profiler):
+    """Decorated functions are timed by qualified name and still return their result"""
+
+    @profiler.profiled
+    def setup_something():
+        with profiler.phase("inner"):
+            return 42
+
+    assert setup_something() == 42
+    names = [event[0] for event in profiler._events]
+    assert names == ["inner", "test_profiled_records_calls.<locals>.setup_something"]
+
+
+def test_profiled_is_a_no_op_when_disabled():
+    """Without profiling the decorator returns the function itself"""
+
+    def setup_something():
+        pass
+
+    assert startup_profile.profiled(setup_something) is setup_something
+
+
+def test_finish_writes_chrome_trace(profiler, tmp_path, capsys):
+    """finish() writes complete and instant events in the Chrome trace format"""
+    with profiler.phase("QApplication"):
+        pass
+    profiler.mark("first paint")
+    path = tmp_path / "startup_profile.json"
+    profiler.finish(str(path))
+    events = json.loads(path.read_text())["traceEvents"]
+    assert [(event["name"], event["ph"]) for event in events] == [
+        ("QApplication", "X"),
+        ("first paint", "i"),
+    ]
+    assert "first paint at" in capsys.readouterr().out
+    assert not profiler.is_enabled()
@@ -0,0 +1,160 @@
+import pytest
+from timer_core import PomodoroTimer, FOCUS, REST, LONG_REST
+
+
+class FakeClock:
+    """Monotonic clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def timer(clock):
+    return PomodoroTimer(
+        focus_seconds=1500,
+        rest_seconds=300,
+        long_rest_seconds=900,
+        sessions_before_long_rest=2,
+        clock=clock,
+    )
+
+
+def run_session(timer, clock):
+    """Start the queued session and let it run to completion."""
+    timer.start()
+    clock.advance(timer.remaining_seconds)
+    timer.tick()
+
+
+def test_initial_state(timer):
+    """A new timer is a stopped Focus session at full length"""
+    assert timer.session_type == FOCUS
+    assert timer.label == "Focus"
+    assert not timer.is_running
+    assert timer.remaining_seconds == 1500
+    assert timer.completed_sessions == 0
+
+
+def test_countdown_follows_clock(timer, clock):
+    """Remaining time is derived from the clock while running"""
+    timer.start()
+    clock.advance(10.5)
+    assert timer.remaining_seconds == 1490
+    timer.pause()
+    clock.advance(100)
+    assert timer.remaining_seconds == 1490
+    timer.start()
+    clock.advance(90)
+    assert timer.remaining_seconds == 1400
+
+
+def test_tick_completes_session(timer, clock):
+    """tick() completes the session once the deadline has passed"""
+    completed = []
+    timer.on("completed", lambda finished, upcoming: completed.append((finished, upcoming)))
+    timer.start()
+    clock.advance(1499)
+    timer.tick()
+    assert completed == []
+    clock.advance(1)
+    timer.tick()
+    assert completed == [(FOCUS, REST)]
+    assert timer.label == "Next: Rest"
+    assert timer.remaining_seconds == 300
+    assert not timer.is_running
+
+
+def test_full_cycle_with_long_rest(timer, clock):
+    """Every sessions_before_long_rest Focus sessions are followed by a Long Rest"""
+    labels = []
+    for _ in range(8):
+        run_session(timer, clock)
+        labels.append(timer.label)
+    assert labels == [
+        "Next: Rest",
+        "Next: Focus",
+        "Next: Long Rest",
+        "Next: Focus",
+        "Next: Rest",
+        "Next: Focus",
+        "Next: Long Rest",
+        "Next: Focus",
+    ]
+    assert timer.completed_sessions == 4
+
+
+def test_long_rest_is_displayed_as_rest(timer, clock):
+    """A running Long Rest shows as "Rest" and lasts long_rest_seconds"""
+    run_session(timer, clock)
+    run_session(timer, clock)
+    run_session(timer, clock)
+    timer.start()
+    assert timer.session_type == LONG_REST
+    assert timer.label == "Rest"
+    assert timer.remaining_seconds == 900
+
+
+def test_reset_goes_back_to_focus(timer, clock):
+    """reset() returns to a full Focus session unless told to keep the session type"""
+    run_session(timer, clock)
+    timer.reset(keep_session_type=True)
+    assert timer.label == "Next: Rest"
+    assert timer.remaining_seconds == 300
+    timer.reset()
+    assert timer.label == "Focus"
+    assert timer.remaining_seconds == 1500
+
+
+def test_adjust_is_clamped(timer, clock):
+    """Manual adjustments stay within 1 and 120 minutes"""
+    timer.adjust(5)
+    assert timer.remaining_seconds == 1800
+    timer.adjust(-100)
+    assert timer.remaining_seconds == 60
+    timer.adjust(500)
+    assert timer.remaining_seconds == 7200
+    timer.start()
+    clock.advance(30)
+    timer.adjust(-1)
+    assert timer.remaining_seconds == 7110
+
+
+def test_set_durations_updates_stopped_timer(timer, clock):
+    """New durations apply to a stopped timer but not to a running one"""
+    timer.set_durations(600, 60, 120, 3)
+    assert timer.remaining_seconds == 600
+    timer.start()
+    timer.set_durations(1200, 60, 120, 3)
+    assert timer.remaining_seconds == 600
+
+
+def test_reset_day(timer, clock):
+    """reset_day() clears the completed session count and notifies listeners"""
+    events = []
+    timer.on("day_reset", lambda: events.append("day_reset"))
+    run_session(timer, clock)
+    timer.reset_day()
+    assert timer.completed_sessions == 0
+    assert events == ["day_reset"]
+
+
+def test_simulate_many_days(timer, clock):
+    """The state machine can be simulated without a GUI or real timers"""
+    for _ in range(1000):
+        for _ in range(8):
+            run_session(timer, clock)
+        timer.reset_day()
+    assert timer.label == "Next: Focus"
+    assert clock.now == 1000 * (4 * 1500 + 2 * 300 + 2 * 900)
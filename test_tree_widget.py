@@ -1,7 +1,8 @@
 import pytest
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QFile, QAbstractAnimation
 from PySide6.QtGui import QPixmap
-from tree_widget import TreeWidget
+from tree_widget import TreeWidget, GROWTH_FRAMES
+import image_store
 from unittest.mock import patch, MagicMock
 import os
 
@@ -48,27 +49,24 @@ def test_set_stage_boundary_values(tree_widget):
 
 
 def test_load_tree_images(tree_widget, monkeypatch):
-    """Test that images are loaded correctly from the assets folder"""
-    # Reset the tree_images dictionary
-    tree_widget.tree_images = {}
-    
-    # Create a mock for QPixmap that simulates successful image loading
-    class MockPixmap(MagicMock):
-        def __init__(self, path):
-            super().__init__()
-            self.path = path
-        
-        def isNull(self):
-            return False
-    
-    # Apply the mock to QPixmap
-    monkeypatch.setattr("tree_widget.QPixmap", MockPixmap)
-    
-    # Call the method being tested
+    """Each stage is decoded from the compiled resources through the store, once, on first use"""
+    image_store.discard()
+    decode = MagicMock(wraps=QPixmap)
+    monkeypatch.setattr("image_store.QPixmap", decode)
     tree_widget.load_tree_images()
+    assert decode.call_count == 0
     
-    # Check that we have 4 image entries
-    assert len(tree_widget.tree_images) == 4
+    for stage in range(1, 5):
+        path = f":/tree/tree_stage{stage}.png"
+        pixmap = tree_widget.tree_images[stage]
+        assert not pixmap.isNull()
+        assert tree_widget.tree_images[stage] is pixmap
+        assert image_store._pixmaps[(path, None, None, 1.0)] is pixmap
+    
+    # A second access of every stage came from the store
+    assert [call.args for call in decode.call_args_list] == [
+        (f":/tree/tree_stage{stage}.png",) for stage in range(1, 5)
+    ]
 
 
 @patch('tree_widget.QPainter')
@@ -91,3 +89,74 @@ def test_paint_event(mock_painter, tree_widget, qtbot):
         # but we can at least verify the method was called
         painter_instance.drawPixmap.assert_called()
         painter_instance.reset_mock()
+
+
+def test_scaled_pixmap_is_cached_until_resize(tree_widget):
+    """Scaling happens once per stage and size, a resize invalidates the cache"""
+    tree_widget.resize(200, 200)
+    tree_widget.show()
+    first = tree_widget.scaled_pixmap(1)
+    assert tree_widget.scaled_pixmap(1) is first
+    assert first.width() == 160  # Fitted to 200 px, then shrunk by 20%
+    tree_widget.scaled_pixmap(4)
+    assert len(tree_widget.scaled_pixmaps) == 2
+    tree_widget.resize(300, 300)  # Sends a resize event to the visible widget
+    assert tree_widget.scaled_pixmaps == {}
+    assert tree_widget.scaled_pixmap(1).width() == 240
+
+
+def test_widgets_share_decoded_and_scaled_images(qtbot):
+    """A new widget, like the one built on every new day, reuses the stored images"""
+    first, second = TreeWidget(), TreeWidget()
+    qtbot.addWidget(first)
+    qtbot.addWidget(second)
+    for widget in (first, second):
+        widget.resize(200, 200)
+    assert second.tree_images[1] is first.tree_images[1]
+    assert second.scaled_pixmap(1) is first.scaled_pixmap(1)
+
+
+def test_growing_releases_earlier_stages(tree_widget):
+    tree_widget.resize(200, 200)
+    tree_widget.scaled_pixmap(1)
+    tree_widget.set_stage(3)
+    assert all(stage >= 3 for stage, *_ in tree_widget.scaled_pixmaps)
+    stage1_path = tree_widget.tree_images.paths[1]
+    assert all(key[0] != stage1_path for key in image_store._pixmaps)
+
+
+def test_images_come_from_compiled_resources(tree_widget):
+    """The images are read from assets_rc, never from the assets folder"""
+    for stage, path in tree_widget.tree_images.paths.items():
+        assert path.startswith(":/")
+        assert QFile.exists(path)
+        assert not tree_widget.tree_images[stage].isNull()
+
+
+def test_growth_is_animated_then_frames_are_freed(tree_widget, qtbot):
+    tree_widget.resize(80, 120)
+    tree_widget.show()
+    qtbot.waitExposed(tree_widget)
+    tree_widget.set_stage(2)
+    assert tree_widget.stage == 2
+    assert len(tree_widget.growth_frames) == GROWTH_FRAMES
+    assert tree_widget.growth_frame is not None
+    qtbot.waitUntil(lambda: tree_widget.growth_frame is None, timeout=3000)
+    assert tree_widget.growth_frames == []
+    assert tree_widget.growth_animation.state() == QAbstractAnimation.Stopped
+
+
+def test_growth_is_not_animated_when_hidden(tree_widget):
+    tree_widget.set_stage(3)
+    assert tree_widget.growth_frame is None
+    assert tree_widget.growth_frames == []
+
+
+def test_hiding_stops_the_growth_animation(tree_widget, qtbot):
+    tree_widget.resize(80, 120)
+    tree_widget.show()
+    qtbot.waitExposed(tree_widget)
+    tree_widget.set_stage(2)
+    tree_widget.hide()
+    assert tree_widget.growth_frame is None
+    assert tree_widget.growth_animation.state() == QAbstractAnimation.Stopped
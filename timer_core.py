@@ -0,0 +1,182 @@
+import math
+import time
+
+FOCUS = "Focus"
+REST = "Rest"
+LONG_REST = "Long Rest"
+
+MIN_ADJUSTED_SECONDS = 60  # Manual adjustments never go below 1 minute
+MAX_ADJUSTED_SECONDS = 7200  # ...or above 120 minutes
+
+
+class PomodoroTimer:
+    """
+    Qt-free state machine for the Focus / Rest / Long Rest cycle.
+
+    The timer keeps a deadline on an injectable monotonic clock instead of
+    counting ticks, so the remaining time is always derived from the clock and
+    callers only need to call tick() often enough to notice completion.
+
+    Listeners registered with on() are called with positional arguments:
+        started(session_type)
+        paused(remaining_seconds)
+        reset()
+        adjusted(remaining_seconds)
+        completed(finished_type, next_type)
+        day_reset()
+    """
+
+    def __init__(
+        self,
+        focus_seconds=1800,
+        rest_seconds=300,
+        long_rest_seconds=900,
+        sessions_before_long_rest=2,
+        clock=time.monotonic,
+    ):
+        self.focus_seconds = focus_seconds
+        self.rest_seconds = rest_seconds
+        self.long_rest_seconds = long_rest_seconds
+        self.sessions_before_long_rest = sessions_before_long_rest
+        self.clock = clock
+        self.session_type = FOCUS
+        self.awaiting_start = False  # A session ended and the next one is queued
+        self.completed_sessions = 0
+        self.is_running = False
+        self._remaining = float(focus_seconds)
+        self._deadline = None
+        self._listeners = {}
+
+    def on(self, event, callback):
+        """Register a callback for the given event name."""
+        self._listeners.setdefault(event, []).append(callback)
+
+    def _emit(self, event, *args):
+        for callback in self._listeners.get(event, []):
+            callback(*args)
+
+    def duration_for(self, session_type):
+        """Return the configured length in seconds of the given session type."""
+        if session_type == FOCUS:
+            return self.focus_seconds
+        if session_type == LONG_REST:
+            return self.long_rest_seconds
+        return self.rest_seconds
+
+    @property
+    def label(self):
+        """Text describing the current state, e.g. "Focus" or "Next: Long Rest"."""
+        if self.awaiting_start:
+            return f"Next: {self.session_type}"
+        # Both kinds of break are displayed as "Rest" while they run
+        return REST if self.session_type == LONG_REST else self.session_type
+
+    @property
+    def remaining_seconds(self):
+        """Whole seconds left in the current session, rounded up."""
+        if self.is_running:
+            return max(0, math.ceil(self._deadline - self.clock()))
+        return math.ceil(self._remaining)
+
+    @remaining_seconds.setter
+    def remaining_seconds(self, seconds):
+        if self.is_running:
+            self._deadline = self.clock() + seconds
+        else:
+            self._remaining = float(seconds)
+
+    @property
+    def deadline(self):
+        """Monotonic time at which the running session ends, or None."""
+        return self._deadline
+
+    def start(self):
+        """Start or resume the current session."""
+        if self.is_running:
+            return
+        self.awaiting_start = False
+        self._deadline = self.clock() + self._remaining
+        self.is_running = True
+        self._emit("started", self.session_type)
+
+    def pause(self):
+        """Pause the running session, keeping the time left."""
+        if not self.is_running:
+            return
+        self._remaining = max(0.0, self._deadline - self.clock())
+        self._deadline = None
+        self.is_running = False
+        self._emit("paused", self.remaining_seconds)
+
+    def reset(self, keep_session_type=False):
+        """
+        Stop the timer and restore the full session length.
+
+        Unless keep_session_type is set the cycle goes back to Focus.
+        """
+        self.is_running = False
+        self._deadline = None
+        if not keep_session_type:
+            self.session_type = FOCUS
+            self.awaiting_start = False
+        self._remaining = float(self.duration_for(self.session_type))
+        self._emit("reset")
+
+    def adjust(self, minutes_change):
+        """Add (or remove) minutes to the current session, within 1 to 120 minutes."""
+        new_remaining = self.remaining_seconds + minutes_change * 60
+        new_remaining = min(max(new_remaining, MIN_ADJUSTED_SECONDS), MAX_ADJUSTED_SECONDS)
+        self.remaining_seconds = new_remaining
+        self._emit("adjusted", self.remaining_seconds)
+
+    def catch_up(self, seconds):
+        """
+        Count time the monotonic clock did not see (e.g. while the system was
+        suspended on Linux) against the running session.
+        """
+        if self.is_running and seconds > 0:
+            self._deadline -= seconds
+
+    def tick(self):
+        """
+        Check the clock and complete the session if its deadline has passed.
+
+        Returns the remaining seconds after the check.
+        """
+        if self.is_running and self._deadline - self.clock() <= 0:
+            self.complete()
+        return self.remaining_seconds
+
+    def complete(self):
+        """Finish the current session and queue the next one in the cycle."""
+        finished_type = self.session_type
+        self.is_running = False
+        self._deadline = None
+        if finished_type == FOCUS:
+            self.completed_sessions += 1
+            if self.completed_sessions % self.sessions_before_long_rest == 0:
+                next_type = LONG_REST
+            else:
+                next_type = REST
+        else:
+            next_type = FOCUS
+        self.session_type = next_type
+        self.awaiting_start = True
+        self._remaining = float(self.duration_for(next_type))
+        self._emit("completed", finished_type, next_type)
+
+    def set_durations(
+        self, focus_seconds, rest_seconds, long_rest_seconds, sessions_before_long_rest
+    ):
+        """Apply new settings. A stopped timer picks up the new session length."""
+        self.focus_seconds = focus_seconds
+        self.rest_seconds = rest_seconds
+        self.long_rest_seconds = long_rest_seconds
+        self.sessions_before_long_rest = sessions_before_long_rest
+        if not self.is_running:
+            self._remaining = float(self.duration_for(self.session_type))
+
+    def reset_day(self):
+        """Start a new day: the completed session count goes back to zero."""
+        self.completed_sessions = 0
+        self._emit("day_reset")
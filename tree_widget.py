@@ -1,73 +1,188 @@
 from PySide6.QtWidgets import QWidget
 from PySide6.QtGui import QPainter, QPixmap
-from PySide6.QtCore import Qt
-import os
-import sys
+from PySide6.QtCore import Qt, QEasingCurve, QPointF, QRectF, QVariantAnimation
+from collections.abc import Mapping
+import logging
+
+import assets_rc  # noqa: F401  Registers the :/tree images
+import image_store
+from diagnostics import log
+from metrics import PAINT_TIME, timed
+
+
+class LazyPixmaps(Mapping):
+    """
+    Maps tree stages to their image, decoding each PNG only the first time
+    it is needed so that startup does not pay for stages that are not shown.
+    The images live in the shared image store, so every TreeWidget reuses them.
+    """
+
+    def __init__(self, paths):
+        self.paths = paths
+
+    def __getitem__(self, stage):
+        return image_store.pixmap(self.paths[stage])
+
+    def __iter__(self):
+        return iter(self.paths)
+
+    def __len__(self):
+        return len(self.paths)
+
+
+# How much each stage is grown or shrunk after fitting the image to the widget
+SCALE_FACTORS = {
+    1: 0.8,  # 20% smaller
+    2: 0.8,  # 20% smaller
+    3: 1.2,  # 20% bigger
+    4: 1.28,  # 28% bigger
+}
+
+GROWTH_DURATION_MS = 700
+GROWTH_FRAMES = 14  # Rendered once per transition, then only blitted
+
 
 class TreeWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.stage = 1
+        self.scaled_pixmaps = {}  # (stage, width, height, dpr) -> scaled pixmap
+        self.growth_frames = []  # Frames of the running growth animation
+        self.growth_frame = None  # Index of the frame to paint, None when not animating
+        self.growth_animation = QVariantAnimation(self)
+        self.growth_animation.setDuration(GROWTH_DURATION_MS)
+        self.growth_animation.setEasingCurve(QEasingCurve.OutCubic)
+        self.growth_animation.valueChanged.connect(self.show_growth_frame)
+        self.growth_animation.finished.connect(self.finish_growth)
         self.load_tree_images()
 
     def load_tree_images(self):
-        """Load tree stage images from assets folder"""
-        self.tree_images = {}
-        # Get the directory where the executable is located
-        if getattr(sys, 'frozen', False):
-            # Running as compiled executable
-            base_path = sys._MEIPASS
-        else:
-            # Running as script
-            base_path = os.path.dirname(os.path.abspath(__file__))
-            
-        for i in range(1, 5):  # Stages 1-4
-            image_path = os.path.join(base_path, 'assets', f'tree_stage{i}.png')
-            self.tree_images[i] = QPixmap(image_path)
-            if self.tree_images[i].isNull():
-                print(f"Failed to load image: {image_path}")
-
-    def set_stage(self, stage):
-        """Set the tree growth stage (1-4)"""
-        print(f"Stage before: {self.stage}")
+        """Point at the tree stage images compiled into assets_rc, they are decoded on first use"""
+        self.tree_images = LazyPixmaps({
+            i: f':/tree/tree_stage{i}.png'
+            for i in range(1, 5)  # Stages 1-4
+        })
+
+    def preload_images(self):
+        """Decode the images of all stages, meant to run when the app is idle"""
+        for stage in self.tree_images:
+            self.tree_images[stage]
+
+    def set_stage(self, stage, animate=True):
+        """Set the tree growth stage (1-4), animating the growth when the tree is on screen"""
+        previous = self.stage
         self.stage = min(max(stage, 1), 4)  # Clamp between 1 and 4
+        self.finish_growth()
+        if self.stage > previous:
+            if animate and self.isVisible() and not self.window().isMinimized():
+                self.start_growth(previous, self.stage)
+            self.release_stages_below(self.stage)
         self.update()
-        print(f"Stage after: {self.stage}")
+        log(logging.DEBUG, "tree_stage_changed", previous=previous, stage=self.stage)
+
+    def release_stages_below(self, stage):
+        """The tree only grows during a day, free the images of the stages it outgrew"""
+        for key in [key for key in self.scaled_pixmaps if key[0] < stage]:
+            del self.scaled_pixmaps[key]
+        for earlier in range(1, stage):
+            image_store.discard(self.tree_images.paths[earlier])
 
+    def start_growth(self, previous, stage):
+        """Render the transition frames offscreen, then play them back"""
+        self.growth_frames = self.render_growth_frames(previous, stage)
+        self.growth_animation.setStartValue(0)
+        self.growth_animation.setEndValue(len(self.growth_frames) - 1)
+        self.growth_frame = 0
+        self.growth_animation.start()
+
+    def render_growth_frames(self, previous, stage):
+        """
+        Crossfade from the previous stage image to the new one while both grow
+        from the previous size to the new one.
+        """
+        old = self.scaled_pixmap(previous)
+        new = self.scaled_pixmap(stage)
+        old_size = old.deviceIndependentSize()
+        new_size = new.deviceIndependentSize()
+        dpr = self.devicePixelRatioF()
+        center = QPointF(self.width() / 2, self.height() / 2)
+        frames = []
+        for index in range(GROWTH_FRAMES):
+            progress = index / (GROWTH_FRAMES - 1)
+            width = old_size.width() + (new_size.width() - old_size.width()) * progress
+            height = old_size.height() + (new_size.height() - old_size.height()) * progress
+            target = QRectF(0, 0, width, height)
+            target.moveCenter(center)
+            frame = QPixmap(self.size() * dpr)
+            frame.setDevicePixelRatio(dpr)
+            frame.fill(Qt.transparent)
+            painter = QPainter(frame)
+            painter.setRenderHint(QPainter.SmoothPixmapTransform)
+            painter.setOpacity(1 - progress)
+            painter.drawPixmap(target, old, QRectF(old.rect()))
+            painter.setOpacity(progress)
+            painter.drawPixmap(target, new, QRectF(new.rect()))
+            painter.end()
+            frames.append(frame)
+        return frames
+
+    def show_growth_frame(self, index):
+        self.growth_frame = index
+        self.update()
+
+    def finish_growth(self):
+        """Stop the animation and free its frames, painting goes back to the plain stage image"""
+        if self.growth_frame is None:
+            return
+        self.growth_animation.stop()
+        self.growth_frames = []
+        self.growth_frame = None
+        self.update()
+
+    def hideEvent(self, event):
+        self.finish_growth()
+        super().hideEvent(event)
+
+    def resizeEvent(self, event):
+        # Scaled pixmaps and animation frames are only valid for the size they were made for
+        self.finish_growth()
+        self.scaled_pixmaps.clear()
+        super().resizeEvent(event)
+
+    def scaled_pixmap(self, stage):
+        """
+        The stage image scaled for the current widget size and device pixel ratio.
+
+        The image is fitted to the widget keeping its aspect ratio, then grown or
+        shrunk by the stage factor. The result is cached per (stage, size, dpr),
+        so a repaint is a single blit and the smooth scaling only happens once.
+        The scaled images come from the shared image store, so the widget built
+        on the next day does not scale them again.
+        """
+        dpr = self.devicePixelRatioF()
+        key = (stage, self.width(), self.height(), dpr)
+        if key not in self.scaled_pixmaps:
+            pixmap = self.tree_images[stage]
+            # Compute the fitted size arithmetically rather than scaling the image twice
+            fitted = pixmap.size().scaled(self.size() * dpr, Qt.KeepAspectRatio)
+            scale_factor = SCALE_FACTORS[stage]
+            self.scaled_pixmaps[key] = image_store.pixmap(
+                self.tree_images.paths[stage],
+                int(fitted.width() * scale_factor),
+                int(fitted.height() * scale_factor),
+                dpr,
+            )
+        return self.scaled_pixmaps[key]
+
+    @timed(PAINT_TIME, widget="TreeWidget")
     def paintEvent(self, event):
-        if self.stage in self.tree_images:
+        if self.growth_frame is not None:
+            QPainter(self).drawPixmap(0, 0, self.growth_frames[self.growth_frame])
+        elif self.stage in self.tree_images:
             painter = QPainter(self)
-            pixmap = self.tree_images[self.stage]
-            
-            # Define scaling factors for each stage
-            scale_factors = {
-                1: 0.8,  # 20% smaller
-                2: 0.8,  # 20% smaller
-                3: 1.2,  # 20% bigger
-                4: 1.28  # 28% bigger
-            }
-            
-            # Get base size that would fit the widget while maintaining aspect ratio
-            base_scaled_pixmap = pixmap.scaled(
-                self.size(),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            
-            # Apply the stage-specific scaling
-            scale_factor = scale_factors[self.stage]
-            final_width = int(base_scaled_pixmap.width() * scale_factor)
-            final_height = int(base_scaled_pixmap.height() * scale_factor)
-            
-            # Scale with the stage-specific factor
-            final_scaled_pixmap = pixmap.scaled(
-                final_width,
-                final_height,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            
-            # Center the image in the widget
-            x = (self.width() - final_scaled_pixmap.width()) // 2
-            y = (self.height() - final_scaled_pixmap.height()) // 2
-            painter.drawPixmap(x, y, final_scaled_pixmap)
\ No newline at end of file
+            pixmap = self.scaled_pixmap(self.stage)
+            # Center the image in the widget, in device independent pixels
+            size = pixmap.deviceIndependentSize()
+            x = int((self.width() - size.width()) // 2)
+            y = int((self.height() - size.height()) // 2)
+            painter.drawPixmap(x, y, pixmap)